@@ -2,11 +2,23 @@
 """
 Capture screenshots of Some Claude Skills website pages.
 Requires: pip install playwright && playwright install chromium
+
+Every (page x viewport) combination is captured concurrently. Each
+viewport has its own pool of browser contexts that are reused across
+captures, and at most --concurrency pages are open at once. After
+navigation, a capture waits for web fonts and running animations to
+finish (bounded by SETTLE_TIMEOUT_MS) instead of sleeping a fixed second.
+
+Usage:
+    python .project/scripts/capture-screenshots.py
+    python .project/scripts/capture-screenshots.py --concurrency 8 --base-url http://localhost:3001
 """
 
+import argparse
 import asyncio
+import time
 from pathlib import Path
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 
 # Configuration
 BASE_URL = "http://localhost:3000"
@@ -24,82 +36,183 @@ VIEWPORTS = {
     "mobile": {"width": 390, "height": 844},
 }
 
-
-async def capture_page(page, name: str, path: str, viewport_name: str, viewport: dict):
+DEFAULT_CONCURRENCY = 4
+
+# Upper bound on waiting for fonts/animations after navigation
+SETTLE_TIMEOUT_MS = 3000
+
+
+class ContextPool:
+    """
+    Bounded pool of browser contexts per viewport.
+
+    A context is created the first time a viewport needs one and returned
+    to its viewport's pool after each capture. The semaphore caps the
+    number of pages open at once across all viewports.
+    """
+
+    def __init__(self, browser, concurrency: int):
+        self.browser = browser
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.idle = {name: [] for name in VIEWPORTS}
+        self.contexts = []
+
+    async def acquire(self, viewport_name: str):
+        await self.semaphore.acquire()
+        if self.idle[viewport_name]:
+            return self.idle[viewport_name].pop()
+        try:
+            context = await self.browser.new_context(viewport=VIEWPORTS[viewport_name])
+        except Exception:
+            self.semaphore.release()
+            raise
+        self.contexts.append(context)
+        return context
+
+    def release(self, viewport_name: str, context) -> None:
+        self.idle[viewport_name].append(context)
+        self.semaphore.release()
+
+    async def close(self) -> None:
+        for context in self.contexts:
+            await context.close()
+
+
+async def settle(page) -> None:
+    """Wait for web fonts and running CSS/JS animations, within a timeout."""
+    try:
+        await page.evaluate("document.fonts.ready.then(() => true)")
+        await page.wait_for_function(
+            "() => document.getAnimations().every(a => a.playState !== 'running'"
+            " || a.effect?.getTiming().iterations === Infinity)",
+            timeout=SETTLE_TIMEOUT_MS,
+        )
+    except PlaywrightTimeoutError:
+        pass
+
+
+async def open_page(pool: ContextPool, viewport_name: str, url: str):
+    """Acquire a context for the viewport and open url in a new page."""
+    context = await pool.acquire(viewport_name)
+    page = None
+    try:
+        page = await context.new_page()
+        await page.goto(url, wait_until="networkidle")
+        await settle(page)
+    except BaseException:
+        # Also on cancellation: the context and its semaphore slot must
+        # go back to the pool even if closing the page fails
+        try:
+            if page is not None:
+                await page.close()
+        finally:
+            pool.release(viewport_name, context)
+        raise
+    return context, page
+
+
+async def capture_page(pool: ContextPool, base_url: str, name: str, path: str, viewport_name: str):
     """Capture a single page at a specific viewport."""
-    await page.set_viewport_size(viewport)
-
-    url = f"{BASE_URL}{path}"
-    print(f"  Navigating to {url} ({viewport_name})...")
-
-    await page.goto(url, wait_until="networkidle")
-    await asyncio.sleep(1)  # Extra wait for animations
-
-    # Create output directory
-    output_dir = ARCHIVE_DIR / name / viewport_name
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Full page screenshot
-    output_path = output_dir / f"{name}-{viewport_name}-full.png"
-    await page.screenshot(path=str(output_path), full_page=True)
-    print(f"    Saved: {output_path.name}")
-
-    # Above-the-fold screenshot
-    output_path_fold = output_dir / f"{name}-{viewport_name}-above-fold.png"
-    await page.screenshot(path=str(output_path_fold), full_page=False)
-    print(f"    Saved: {output_path_fold.name}")
-
+    url = f"{base_url}{path}"
+    start = time.perf_counter()
+    context, page = await open_page(pool, viewport_name, url)
+
+    try:
+        # Create output directory
+        output_dir = ARCHIVE_DIR / name / viewport_name
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Full page screenshot
+        output_path = output_dir / f"{name}-{viewport_name}-full.png"
+        await page.screenshot(path=str(output_path), full_page=True)
+
+        # Above-the-fold screenshot
+        output_path_fold = output_dir / f"{name}-{viewport_name}-above-fold.png"
+        await page.screenshot(path=str(output_path_fold), full_page=False)
+    finally:
+        await page.close()
+        pool.release(viewport_name, context)
+
+    print(f"  Saved: {output_path.name}, {output_path_fold.name} ({time.perf_counter() - start:.1f}s)")
     return output_path
 
 
-async def capture_quickview_modal(page):
+async def capture_quickview_modal(pool: ContextPool, base_url: str):
     """Capture the QuickView modal on skills page."""
-    await page.set_viewport_size(VIEWPORTS["desktop"])
-    await page.goto(f"{BASE_URL}/skills", wait_until="networkidle")
-    await asyncio.sleep(1)
+    start = time.perf_counter()
+    context, page = await open_page(pool, "desktop", f"{base_url}/skills")
+
+    try:
+        # Try to click on a skill card to open QuickView
+        skill_cards = await page.query_selector_all('[class*="skillCard"], [class*="SkillCard"]')
+        if not skill_cards:
+            print("  QuickView: no skill cards found")
+            return None
 
-    # Try to click on a skill card to open QuickView
-    skill_cards = await page.query_selector_all('[class*="skillCard"], [class*="SkillCard"]')
-    if skill_cards:
         await skill_cards[0].click()
-        await asyncio.sleep(0.5)
+        try:
+            await page.wait_for_selector('[role="dialog"], [class*="quickView"], [class*="QuickView"]',
+                                         state="visible", timeout=SETTLE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
+        await settle(page)
 
         output_dir = ARCHIVE_DIR / "skills" / "desktop"
+        output_dir.mkdir(parents=True, exist_ok=True)
         output_path = output_dir / "skills-desktop-quickview-modal.png"
         await page.screenshot(path=str(output_path), full_page=False)
-        print(f"    Saved: {output_path.name}")
+        print(f"  Saved: {output_path.name} ({time.perf_counter() - start:.1f}s)")
 
         # Close modal
         await page.keyboard.press("Escape")
+        return output_path
+    finally:
+        await page.close()
+        pool.release("desktop", context)
 
 
 async def main():
+    parser = argparse.ArgumentParser(description="Capture website screenshots")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"Site to capture (default: {BASE_URL})")
+    parser.add_argument("--concurrency", "-j", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Pages captured at once (default: {DEFAULT_CONCURRENCY})")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Some Claude Skills - Screenshot Capture")
     print("=" * 60)
-    print(f"Base URL: {BASE_URL}")
+    print(f"Base URL: {args.base_url}")
     print(f"Archive: {ARCHIVE_DIR}")
+    print(f"Concurrency: {args.concurrency}")
     print()
 
+    start = time.perf_counter()
     async with async_playwright() as p:
         browser = await p.chromium.launch()
-        page = await browser.new_page()
-
-        for page_name, page_path in PAGES:
-            print(f"\nCapturing: {page_name}")
-            for viewport_name, viewport in VIEWPORTS.items():
-                await capture_page(page, page_name, page_path, viewport_name, viewport)
+        pool = ContextPool(browser, max(1, args.concurrency))
 
+        tasks = [
+            capture_page(pool, args.base_url, page_name, page_path, viewport_name)
+            for page_name, page_path in PAGES
+            for viewport_name in VIEWPORTS
+        ]
         # Special: QuickView modal
-        print(f"\nCapturing: QuickView Modal")
-        await capture_quickview_modal(page)
+        tasks.append(capture_quickview_modal(pool, args.base_url))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        failures = [r for r in results if isinstance(r, Exception)]
+        for failure in failures:
+            print(f"  Failed: {failure}")
 
+        await pool.close()
         await browser.close()
 
     print("\n" + "=" * 60)
-    print("Screenshot capture complete!")
+    print(f"Screenshot capture complete! {len(tasks) - len(failures)}/{len(tasks)} "
+          f"captures in {time.perf_counter() - start:.1f}s")
     print("=" * 60)
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    raise SystemExit(asyncio.run(main()))
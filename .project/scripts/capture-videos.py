@@ -2,271 +2,308 @@
 """
 Capture video recordings of user flows on Some Claude Skills website.
 Requires: pip install playwright && playwright install chromium
+
+The four flows record concurrently, each in its own browser context.
+Steps wait on page events rather than fixed sleeps:
+
+- wait_visible: a selector becomes visible
+- wait_network_idle: no network activity for 500 ms
+- wait_quiet: no running animations and an unchanged scroll position
+  over QUIET_FRAMES consecutive animation frames
+
+Every wait has a timeout. After a step, a short --dwell pause keeps the
+result on screen long enough to read in the video. The time of each step
+is printed and written to timings.json next to the videos.
+
+Usage:
+    python .project/scripts/capture-videos.py
+    python .project/scripts/capture-videos.py --dwell 0.8 --base-url http://localhost:3001
 """
 
+import argparse
 import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 
 # Configuration
 BASE_URL = "http://localhost:3000"
 ARCHIVE_DIR = Path(__file__).parent.parent / "archive" / "videos" / "before"
 VIEWPORT = {"width": 1920, "height": 1080}
+MOBILE_VIEWPORT = {"width": 390, "height": 844}
+
+# Default pause after each step so changes are visible in the recording
+DEFAULT_DWELL = 0.4
+
+WAIT_TIMEOUT_MS = 5000
+# Shorter wait for elements a flow can do without (optional buttons/tags)
+CLICK_TIMEOUT_MS = 1500
+
+# Consecutive animation frames without motion that count as settled
+QUIET_FRAMES = 5
+
+QUIET_SCRIPT = """
+(frames) => new Promise(resolve => {
+    let quiet = 0;
+    let lastY = window.scrollY;
+    const tick = () => {
+        const moving = window.scrollY !== lastY || document.getAnimations().some(
+            a => a.playState === 'running' && a.effect?.getTiming().iterations !== Infinity);
+        lastY = window.scrollY;
+        quiet = moving ? 0 : quiet + 1;
+        if (quiet >= frames) resolve(true); else requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+})
+"""
 
-
-async def record_first_visit_flow(browser):
+CARD_SELECTOR = '[class*="skillCard"], [class*="card"]'
+MODAL_SELECTOR = '[role="dialog"], [class*="quickView"], [class*="QuickView"]'
+
+
+class Flow:
+    """A recorded flow: wait primitives plus per-step timing."""
+
+    def __init__(self, name: str, page, base_url: str, dwell: float):
+        self.name = name
+        self.page = page
+        self.base_url = base_url
+        self.dwell = dwell
+        self.steps = []
+
+    # -------------------------------------------------------------------------
+    # Wait primitives
+    # -------------------------------------------------------------------------
+
+    async def wait_visible(self, selector: str, timeout: int = WAIT_TIMEOUT_MS):
+        """Return the first visible match for selector, or None on timeout."""
+        try:
+            return await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+
+    async def wait_network_idle(self, timeout: int = WAIT_TIMEOUT_MS) -> None:
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def wait_quiet(self, timeout: int = WAIT_TIMEOUT_MS) -> None:
+        """Wait until animations and scrolling have stopped."""
+        try:
+            await asyncio.wait_for(self.page.evaluate(QUIET_SCRIPT, QUIET_FRAMES), timeout / 1000)
+        except asyncio.TimeoutError:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Steps
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def step(self, label: str):
+        """Time a step; settle and dwell after it."""
+        start = time.perf_counter()
+        yield
+        await self.wait_quiet()
+        self.steps.append({"step": label, "ms": round((time.perf_counter() - start) * 1000)})
+        if self.dwell:
+            await asyncio.sleep(self.dwell)
+
+    async def goto(self, path: str, label: str) -> None:
+        async with self.step(label):
+            await self.page.goto(f"{self.base_url}{path}", wait_until="networkidle")
+
+    async def scroll(self, dy: int, label: str) -> None:
+        async with self.step(label):
+            await self.page.evaluate(f"window.scrollBy({{top: {dy}, behavior: 'smooth'}})")
+
+    async def click(self, selector: str, label: str, fallback_path: str = None) -> bool:
+        """Click the first visible match; navigate to fallback_path if none."""
+        async with self.step(label):
+            element = await self.wait_visible(selector, CLICK_TIMEOUT_MS)
+            if element:
+                await element.click()
+                await self.wait_network_idle()
+            elif fallback_path is not None:
+                await self.page.goto(f"{self.base_url}{fallback_path}", wait_until="networkidle")
+        return element is not None
+
+
+async def record_first_visit_flow(flow: Flow):
     """Record a first-time visitor exploring the site."""
-    print("\n Recording: First Visit Flow")
-
-    context = await browser.new_context(
-        viewport=VIEWPORT,
-        record_video_dir=str(ARCHIVE_DIR),
-        record_video_size=VIEWPORT
-    )
-    page = await context.new_page()
-
     # Land on homepage
-    await page.goto(BASE_URL, wait_until="networkidle")
-    await asyncio.sleep(2)
-
-    # Scroll down to see featured skills
-    await page.evaluate("window.scrollBy(0, 400)")
-    await asyncio.sleep(1.5)
+    await flow.goto("/", "land on homepage")
 
-    # Scroll to bottom CTAs
-    await page.evaluate("window.scrollBy(0, 400)")
-    await asyncio.sleep(1.5)
+    # Scroll down to see featured skills, then to the bottom CTAs
+    await flow.scroll(400, "scroll to featured skills")
+    await flow.scroll(400, "scroll to CTAs")
 
     # Click "Browse All Skills"
-    browse_btn = await page.query_selector('text="Open Gallery"')
-    if browse_btn:
-        await browse_btn.click()
-        await asyncio.sleep(2)
-    else:
-        await page.goto(f"{BASE_URL}/skills", wait_until="networkidle")
-        await asyncio.sleep(2)
+    await flow.click('text="Open Gallery"', "open gallery", fallback_path="/skills")
 
     # Scroll through skills
-    await page.evaluate("window.scrollBy(0, 300)")
-    await asyncio.sleep(1)
+    await flow.scroll(300, "scroll skills")
 
     # Click on a skill card to open QuickView
-    skill_cards = await page.query_selector_all('[class*="skillCard"], [class*="card"]')
-    if skill_cards and len(skill_cards) > 0:
-        await skill_cards[0].click()
-        await asyncio.sleep(2)
+    if await flow.click(CARD_SELECTOR, "open QuickView"):
+        async with flow.step("show QuickView"):
+            await flow.wait_visible(MODAL_SELECTOR)
         # Close modal
-        await page.keyboard.press("Escape")
-        await asyncio.sleep(1)
+        async with flow.step("close QuickView"):
+            await flow.page.keyboard.press("Escape")
 
-    await context.close()
 
-    # Rename the video file
-    videos = list(ARCHIVE_DIR.glob("*.webm"))
-    if videos:
-        latest = max(videos, key=lambda p: p.stat().st_mtime)
-        new_name = ARCHIVE_DIR / "01-first-visit-flow.webm"
-        latest.rename(new_name)
-        print(f"    Saved: {new_name.name}")
-
-
-async def record_skill_discovery_flow(browser):
+async def record_skill_discovery_flow(flow: Flow):
     """Record searching and filtering skills."""
-    print("\n Recording: Skill Discovery Flow")
-
-    context = await browser.new_context(
-        viewport=VIEWPORT,
-        record_video_dir=str(ARCHIVE_DIR),
-        record_video_size=VIEWPORT
-    )
-    page = await context.new_page()
-
     # Go to skills page
-    await page.goto(f"{BASE_URL}/skills", wait_until="networkidle")
-    await asyncio.sleep(2)
+    await flow.goto("/skills", "open skills page")
 
     # Type in search box
-    search_box = await page.query_selector('input[placeholder*="Search"]')
-    if search_box:
-        await search_box.click()
-        await asyncio.sleep(0.5)
-        await search_box.type("documentation", delay=100)
-        await asyncio.sleep(1.5)
-
-    # Clear search
+    search_box = await flow.wait_visible('input[placeholder*="Search"]')
     if search_box:
-        await search_box.fill("")
-        await asyncio.sleep(1)
+        async with flow.step("type search"):
+            await search_box.click()
+            await search_box.type("documentation", delay=100)
 
-    # Click a tag filter
-    tag = await page.query_selector('text="ADHD"')
-    if tag:
-        await tag.click()
-        await asyncio.sleep(1.5)
+        # Clear search
+        async with flow.step("clear search"):
+            await search_box.fill("")
 
-    # Click another tag
-    tag2 = await page.query_selector('text="Automation"')
-    if tag2:
-        await tag2.click()
-        await asyncio.sleep(1.5)
+    # Click tag filters
+    await flow.click('text="ADHD"', "filter ADHD")
+    await flow.click('text="Automation"', "filter Automation")
 
     # Scroll to see results
-    await page.evaluate("window.scrollBy(0, 300)")
-    await asyncio.sleep(1)
+    await flow.scroll(300, "scroll results")
 
     # Click on a skill
-    skill_cards = await page.query_selector_all('[class*="skillCard"], [class*="card"]')
-    if skill_cards and len(skill_cards) > 0:
-        await skill_cards[0].click()
-        await asyncio.sleep(2)
+    if await flow.click(CARD_SELECTOR, "open skill"):
+        async with flow.step("show skill"):
+            await flow.wait_visible(MODAL_SELECTOR)
 
-    await context.close()
 
-    # Rename the video file
-    videos = list(ARCHIVE_DIR.glob("*.webm"))
-    if videos:
-        latest = max(videos, key=lambda p: p.stat().st_mtime)
-        new_name = ARCHIVE_DIR / "02-skill-discovery-flow.webm"
-        latest.rename(new_name)
-        print(f"    Saved: {new_name.name}")
-
-
-async def record_navigation_flow(browser):
+async def record_navigation_flow(flow: Flow):
     """Record navigating between main pages."""
-    print("\n Recording: Navigation Flow")
-
-    context = await browser.new_context(
-        viewport=VIEWPORT,
-        record_video_dir=str(ARCHIVE_DIR),
-        record_video_size=VIEWPORT
-    )
-    page = await context.new_page()
-
     # Start at homepage
-    await page.goto(BASE_URL, wait_until="networkidle")
-    await asyncio.sleep(2)
+    await flow.goto("/", "land on homepage")
 
     # Go to Skills via nav
-    await page.click('text="Skills"')
-    await asyncio.sleep(0.5)
-    skills_link = await page.query_selector('a[href="/skills"]')
-    if skills_link:
-        await skills_link.click()
-    else:
-        await page.goto(f"{BASE_URL}/skills")
-    await asyncio.sleep(2)
+    await flow.click('text="Skills"', "open Skills menu")
+    await flow.click('a[href="/skills"]', "go to skills", fallback_path="/skills")
 
     # Go to Ecosystem via nav
-    await page.click('text="Explore"')
-    await asyncio.sleep(0.5)
-    eco_link = await page.query_selector('a[href="/ecosystem"]')
-    if eco_link:
-        await eco_link.click()
-    else:
-        await page.goto(f"{BASE_URL}/ecosystem")
-    await asyncio.sleep(2)
+    await flow.click('text="Explore"', "open Explore menu")
+    await flow.click('a[href="/ecosystem"]', "go to ecosystem", fallback_path="/ecosystem")
 
     # Scroll ecosystem
-    await page.evaluate("window.scrollBy(0, 300)")
-    await asyncio.sleep(1)
+    await flow.scroll(300, "scroll ecosystem")
 
     # Go to Favorites
-    await page.goto(f"{BASE_URL}/favorites", wait_until="networkidle")
-    await asyncio.sleep(2)
+    await flow.goto("/favorites", "go to favorites")
 
     # Back to home
-    home_link = await page.query_selector('text="Back to Home"')
-    if home_link:
-        await home_link.click()
-    else:
-        await page.goto(BASE_URL)
-    await asyncio.sleep(2)
-
-    await context.close()
-
-    # Rename the video file
-    videos = list(ARCHIVE_DIR.glob("*.webm"))
-    if videos:
-        latest = max(videos, key=lambda p: p.stat().st_mtime)
-        new_name = ARCHIVE_DIR / "03-navigation-flow.webm"
-        latest.rename(new_name)
-        print(f"    Saved: {new_name.name}")
+    await flow.click('text="Back to Home"', "back to home", fallback_path="/")
 
 
-async def record_mobile_flow(browser):
+async def record_mobile_flow(flow: Flow):
     """Record mobile experience."""
-    print("\n Recording: Mobile Experience Flow")
-
-    mobile_viewport = {"width": 390, "height": 844}
-
-    context = await browser.new_context(
-        viewport=mobile_viewport,
-        record_video_dir=str(ARCHIVE_DIR),
-        record_video_size=mobile_viewport
-    )
-    page = await context.new_page()
-
     # Homepage on mobile
-    await page.goto(BASE_URL, wait_until="networkidle")
-    await asyncio.sleep(2)
+    await flow.goto("/", "land on homepage")
 
     # Scroll through homepage
-    await page.evaluate("window.scrollBy(0, 400)")
-    await asyncio.sleep(1)
-    await page.evaluate("window.scrollBy(0, 400)")
-    await asyncio.sleep(1)
+    await flow.scroll(400, "scroll homepage")
+    await flow.scroll(400, "scroll homepage further")
 
     # Open hamburger menu (try multiple selectors)
-    menu_btn = await page.query_selector('button:has-text("Menu")')
-    if not menu_btn:
-        menu_btn = await page.query_selector('[class*="navbar"] button')
-    if menu_btn:
-        await menu_btn.click()
-        await asyncio.sleep(1)
+    await flow.click('button:has-text("Menu"), [class*="navbar"] button', "open menu")
 
     # Go to skills
-    await page.goto(f"{BASE_URL}/skills", wait_until="networkidle")
-    await asyncio.sleep(2)
+    await flow.goto("/skills", "go to skills")
 
     # Scroll through skills
-    await page.evaluate("window.scrollBy(0, 500)")
-    await asyncio.sleep(1)
-    await page.evaluate("window.scrollBy(0, 500)")
-    await asyncio.sleep(1)
+    await flow.scroll(500, "scroll skills")
+    await flow.scroll(500, "scroll skills further")
+
+
+FLOWS = [
+    ("01-first-visit-flow", "First Visit Flow", record_first_visit_flow, VIEWPORT),
+    ("02-skill-discovery-flow", "Skill Discovery Flow", record_skill_discovery_flow, VIEWPORT),
+    ("03-navigation-flow", "Navigation Flow", record_navigation_flow, VIEWPORT),
+    ("04-mobile-experience-flow", "Mobile Experience Flow", record_mobile_flow, MOBILE_VIEWPORT),
+]
+
+
+async def record(browser, filename: str, title: str, run_flow, viewport: dict,
+                 base_url: str, dwell: float) -> Flow:
+    """Record one flow in its own context and save the video as filename."""
+    context = await browser.new_context(
+        viewport=viewport,
+        record_video_dir=str(ARCHIVE_DIR),
+        record_video_size=viewport
+    )
+    page = await context.new_page()
+    flow = Flow(title, page, base_url, dwell)
+    start = time.perf_counter()
 
-    await context.close()
+    try:
+        await run_flow(flow)
+    finally:
+        await context.close()
+        # The video is finalized when its context closes
+        output_path = ARCHIVE_DIR / f"{filename}.webm"
+        await page.video.save_as(output_path)
+        await page.video.delete()
 
-    # Rename the video file
-    videos = list(ARCHIVE_DIR.glob("*.webm"))
-    if videos:
-        latest = max(videos, key=lambda p: p.stat().st_mtime)
-        new_name = ARCHIVE_DIR / "04-mobile-experience-flow.webm"
-        latest.rename(new_name)
-        print(f"    Saved: {new_name.name}")
+    total = time.perf_counter() - start
+    print(f"\n {title}: {output_path.name} ({total:.1f}s)")
+    for step in flow.steps:
+        print(f"    {step['ms']:>6} ms  {step['step']}")
+    return flow
 
 
 async def main():
+    parser = argparse.ArgumentParser(description="Record website user flows")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"Site to record (default: {BASE_URL})")
+    parser.add_argument("--dwell", type=float, default=DEFAULT_DWELL,
+                        help=f"Seconds to hold after each step (default: {DEFAULT_DWELL})")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Some Claude Skills - Video Recording")
     print("=" * 60)
-    print(f"Base URL: {BASE_URL}")
+    print(f"Base URL: {args.base_url}")
     print(f"Archive: {ARCHIVE_DIR}")
 
     # Ensure output directory exists
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
 
+    start = time.perf_counter()
     async with async_playwright() as p:
         browser = await p.chromium.launch()
 
-        await record_first_visit_flow(browser)
-        await record_skill_discovery_flow(browser)
-        await record_navigation_flow(browser)
-        await record_mobile_flow(browser)
+        results = await asyncio.gather(
+            *(record(browser, filename, title, run_flow, viewport, args.base_url, args.dwell)
+              for filename, title, run_flow, viewport in FLOWS),
+            return_exceptions=True
+        )
 
         await browser.close()
 
+    report = {}
+    for (filename, title, _, _), result in zip(FLOWS, results):
+        if isinstance(result, BaseException):
+            # CancelledError is a BaseException and has no message
+            error = str(result) or type(result).__name__
+            print(f"\n {title}: failed: {error}")
+            report[filename] = {"error": error}
+        else:
+            report[filename] = {"steps": result.steps}
+    (ARCHIVE_DIR / "timings.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+
     print("\n" + "=" * 60)
-    print("Video recording complete!")
+    print(f"Video recording complete! ({time.perf_counter() - start:.1f}s)")
     print("=" * 60)
 
     # List all videos
@@ -275,6 +312,8 @@ async def main():
         size_mb = video.stat().st_size / (1024 * 1024)
         print(f"  - {video.name} ({size_mb:.1f} MB)")
 
+    return 1 if any(isinstance(r, BaseException) for r in results) else 0
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Compare archived screenshots of Some Claude Skills website pages.
+Requires: pip install numpy pillow
+
+Pairs every PNG under archive/screenshots/before with the same path under
+archive/screenshots/after (as written by capture-screenshots.py) and
+triages them in a process pool:
+
+1. identical    same file hash, nothing decoded
+2. perceptual   files differ but no pixel's channel delta exceeds
+                --pixel-threshold (e.g. re-encoding noise)
+3. changed      NumPy per-pixel diff (max channel delta > --pixel-threshold)
+                and per-tile change ratios (TILE_SIZE px tiles). A heatmap
+                (changed pixels in red over a dimmed "after" image) is
+                written to archive/screenshots/diff/
+
+Every pair whose files differ is pixel-diffed. The pHash (64-bit DCT hash)
+distance is only used to rank changed pairs, largest visual change first:
+it is computed from a 32x32 downsample, so a changed label or icon on a
+full-page capture rarely flips a bit.
+
+Results are cached by the hashes of both files in
+archive/screenshots/diff/.cache.json, so re-running only compares pairs
+that changed since the last run. The summary is written to
+archive/screenshots/diff/summary.json.
+
+Usage:
+    python .project/scripts/diff-screenshots.py
+    python .project/scripts/diff-screenshots.py --after archive/screenshots/after-redesign --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# Configuration
+SCREENSHOTS_DIR = Path(__file__).parent.parent / "archive" / "screenshots"
+BEFORE_DIR = SCREENSHOTS_DIR / "before"
+AFTER_DIR = SCREENSHOTS_DIR / "after"
+DIFF_DIR = SCREENSHOTS_DIR / "diff"
+
+CACHE_VERSION = 2
+
+# Max per-channel delta (0-255) below which a pixel counts as unchanged
+PIXEL_THRESHOLD = 16
+TILE_SIZE = 32
+# Tiles reported per changed image, worst first
+WORST_TILES = 10
+
+# Per-image options, set in each worker by init_worker()
+OPTIONS = {}
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dct_matrix(n: int) -> np.ndarray:
+    """Orthonormal DCT-II basis, so dct(x) = M @ x @ M.T for an n x n block."""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+DCT_32 = dct_matrix(32)
+
+
+def phash(image: Image.Image) -> int:
+    """64-bit perceptual hash: sign of the low 8x8 DCT terms vs their median."""
+    small = np.asarray(image.convert("L").resize((32, 32), Image.LANCZOS), dtype=np.float64)
+    low = (DCT_32 @ small @ DCT_32.T)[:8, :8].ravel()
+    bits = low[1:] > np.median(low[1:])
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def pad_to(array: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Pad an H x W x C array with zeros (full-page captures differ in height)."""
+    pad_h, pad_w = height - array.shape[0], width - array.shape[1]
+    if pad_h or pad_w:
+        array = np.pad(array, ((0, pad_h), (0, pad_w), (0, 0)))
+    return array
+
+
+def pixel_diff(before: Image.Image, after: Image.Image, threshold: int):
+    """Return (per-pixel max channel delta, changed mask) on a common canvas."""
+    a = np.asarray(before.convert("RGB"), dtype=np.int16)
+    b = np.asarray(after.convert("RGB"), dtype=np.int16)
+    height, width = max(a.shape[0], b.shape[0]), max(a.shape[1], b.shape[1])
+    delta = np.abs(pad_to(a, height, width) - pad_to(b, height, width)).max(axis=2)
+    return delta, delta > threshold
+
+
+def tile_ratios(mask: np.ndarray, tile: int) -> np.ndarray:
+    """Fraction of changed pixels in each tile x tile block."""
+    height, width = mask.shape
+    rows, cols = -(-height // tile), -(-width // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=np.float32)
+    padded[:height, :width] = mask
+    return padded.reshape(rows, tile, cols, tile).mean(axis=(1, 3))
+
+
+def heatmap(after: Image.Image, delta: np.ndarray, mask: np.ndarray) -> Image.Image:
+    """Dimmed grayscale of the after image with changes in red by intensity."""
+    height, width = delta.shape
+    base = np.zeros((height, width), dtype=np.float32)
+    gray = np.asarray(after.convert("L"), dtype=np.float32)
+    base[:gray.shape[0], :gray.shape[1]] = gray
+    base *= 0.35
+
+    out = np.repeat(base[:, :, None], 3, axis=2)
+    intensity = np.where(mask, 0.4 + 0.6 * delta / 255.0, 0.0)
+    out[:, :, 0] = out[:, :, 0] * (1 - intensity) + 255 * intensity
+    out[:, :, 1] *= 1 - intensity
+    out[:, :, 2] *= 1 - intensity
+    return Image.fromarray(out.astype(np.uint8))
+
+
+def init_worker(options: dict) -> None:
+    OPTIONS.update(options)
+
+
+def compare(job: dict) -> dict:
+    """Compare one before/after pair (runs in a worker process)."""
+    rel = job["path"]
+    result = {"path": rel, "before_hash": job["before_hash"], "after_hash": job["after_hash"]}
+
+    with Image.open(Path(job["before_dir"]) / rel) as before, Image.open(Path(job["after_dir"]) / rel) as after:
+        before.load()
+        after.load()
+        result["size_before"] = list(before.size)
+        result["size_after"] = list(after.size)
+
+        # Ranking only: too coarse to decide that a pair is unchanged
+        result["phash_distance"] = bin(phash(before) ^ phash(after)).count("1")
+
+        delta, mask = pixel_diff(before, after, OPTIONS["pixel_threshold"])
+        changed = int(mask.sum())
+        result["changed_pixels"] = changed
+        result["changed_ratio"] = round(changed / mask.size, 6)
+        if not changed and before.size == after.size:
+            result["status"] = "perceptual"
+            return result
+
+        ratios = tile_ratios(mask, OPTIONS["tile_size"])
+        result["status"] = "changed"
+        result["tiles_changed"] = int((ratios > 0).sum())
+        result["tiles_total"] = int(ratios.size)
+        worst = np.argsort(ratios, axis=None)[::-1][:WORST_TILES]
+        result["worst_tiles"] = [
+            {"x": int(i % ratios.shape[1]) * OPTIONS["tile_size"],
+             "y": int(i // ratios.shape[1]) * OPTIONS["tile_size"],
+             "ratio": round(float(ratios.flat[i]), 4)}
+            for i in worst if ratios.flat[i] > 0
+        ]
+
+        heatmap_path = DIFF_DIR / Path(rel).with_suffix(".diff.png")
+        heatmap_path.parent.mkdir(parents=True, exist_ok=True)
+        heatmap(after, delta, mask).save(heatmap_path, optimize=False)
+        result["heatmap"] = str(heatmap_path.relative_to(SCREENSHOTS_DIR))
+
+    return result
+
+
+def load_cache(cache_path: Path, options: dict) -> dict:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != CACHE_VERSION or data.get("options") != options:
+        return {}
+    return data.get("results", {})
+
+
+def save_cache(cache_path: Path, options: dict, results: dict) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "options": options, "results": results}),
+                        encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def list_pngs(root: Path) -> set:
+    return {p.relative_to(root).as_posix() for p in root.rglob("*.png")} if root.exists() else set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff archived website screenshots")
+    parser.add_argument("--after", type=Path, default=AFTER_DIR,
+                        help="Screenshots to compare against before/ (default: archive/screenshots/after)")
+    parser.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--pixel-threshold", type=int, default=PIXEL_THRESHOLD,
+                        help=f"Channel delta that counts as a change (default: {PIXEL_THRESHOLD})")
+    parser.add_argument("--tile-size", type=int, default=TILE_SIZE, help=f"Tile size in px (default: {TILE_SIZE})")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached results")
+    args = parser.parse_args()
+
+    after_dir = args.after.resolve()
+    options = {
+        "pixel_threshold": args.pixel_threshold,
+        "tile_size": args.tile_size,
+    }
+
+    print("=" * 60)
+    print("Some Claude Skills - Screenshot Diff")
+    print("=" * 60)
+    print(f"Before: {BEFORE_DIR}")
+    print(f"After:  {after_dir}")
+
+    if not after_dir.exists():
+        print(f"\nNo screenshots to compare in {after_dir}")
+        return 1
+
+    start = time.perf_counter()
+    before_files, after_files = list_pngs(BEFORE_DIR), list_pngs(after_dir)
+    cache_path = DIFF_DIR / ".cache.json"
+    cache = {} if args.no_cache else load_cache(cache_path, options)
+
+    results = {}
+    jobs = []
+    for rel in sorted(before_files & after_files):
+        before_hash, after_hash = file_hash(BEFORE_DIR / rel), file_hash(after_dir / rel)
+        cached = cache.get(rel)
+        if before_hash == after_hash:
+            results[rel] = {"path": rel, "status": "identical",
+                            "before_hash": before_hash, "after_hash": after_hash}
+        elif cached and cached["before_hash"] == before_hash and cached["after_hash"] == after_hash:
+            results[rel] = cached
+        else:
+            jobs.append({"path": rel, "before_hash": before_hash, "after_hash": after_hash,
+                         "before_dir": str(BEFORE_DIR), "after_dir": str(after_dir)})
+
+    print(f"\n{len(before_files & after_files)} pairs: {len(jobs)} to compare, "
+          f"{len(results)} identical or cached")
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=init_worker,
+                                 initargs=(options,)) as executor:
+            for result in executor.map(compare, jobs):
+                results[result["path"]] = result
+
+    # Largest visual change first
+    changed = sorted((r for r in results.values() if r["status"] == "changed"),
+                     key=lambda r: (-r.get("phash_distance", 0), -r["changed_ratio"], r["path"]))
+    for result in changed:
+        print(f"  changed: {result['path']} ({result['changed_ratio']:.2%} of pixels, "
+              f"{result['tiles_changed']} tiles, pHash distance {result.get('phash_distance', 0)})")
+
+    for rel in sorted(before_files - after_files):
+        results[rel] = {"path": rel, "status": "removed"}
+    for rel in sorted(after_files - before_files):
+        results[rel] = {"path": rel, "status": "added"}
+
+    save_cache(cache_path, options, {rel: r for rel, r in results.items()
+                                     if r["status"] in ("changed", "perceptual")})
+
+    counts = {}
+    for result in results.values():
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    summary = {
+        "before": str(BEFORE_DIR),
+        "after": str(after_dir),
+        "options": options,
+        "counts": counts,
+        "results": [results[rel] for rel in sorted(results)],
+    }
+    DIFF_DIR.mkdir(parents=True, exist_ok=True)
+    (DIFF_DIR / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    print("\n" + "=" * 60)
+    print("Diff complete! " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+          + f" ({time.perf_counter() - start:.1f}s)")
+    print(f"Summary: {DIFF_DIR / 'summary.json'}")
+    print("=" * 60)
+    return 1 if counts.get("changed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Measure Some Claude Skills page performance against a budget.
+Requires: pip install playwright && playwright install chromium
+
+Loads every page x viewport from capture-screenshots.py against a locally
+served build (e.g. `npm run build && npm run serve` in website/) and
+collects, per sample:
+
+- ttfb_ms, dom_content_loaded_ms, load_ms   Navigation Timing
+- lcp_ms                                    Largest Contentful Paint
+- cls                                       Cumulative Layout Shift
+- js_heap_mb                                performance.memory (Chromium)
+- transfer_kb                               document + resource transferSize
+
+Each sample uses a fresh browser context (cold cache). Samples are
+reduced to p50/p75/p95 and the budget percentile is compared against
+.project/perf-budget.json: page/viewport entries override "defaults".
+Results are written to archive/perf/<timestamp>.json. The exit status is
+1 if any metric is over budget.
+
+Usage:
+    python .project/scripts/perf-budget.py
+    python .project/scripts/perf-budget.py --samples 9 --pages skills ecosystem
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+from playwright.async_api import async_playwright
+
+# Page and viewport matrix shared with the screenshot capture
+capture = importlib.import_module("capture-screenshots")
+PAGES = capture.PAGES
+VIEWPORTS = capture.VIEWPORTS
+BASE_URL = capture.BASE_URL
+
+BUDGET_FILE = Path(__file__).parent.parent / "perf-budget.json"
+RESULTS_DIR = Path(__file__).parent.parent / "archive" / "perf"
+
+DEFAULT_SAMPLES = 5
+PERCENTILES = {"p50": 50, "p75": 75, "p95": 95}
+
+# Time allowed after load for late LCP candidates and layout shifts
+SETTLE_MS = 1000
+
+# Buffered observers installed before any page script runs
+OBSERVER_SCRIPT = """
+window.__perf = {lcp: 0, cls: 0};
+new PerformanceObserver(list => {
+    for (const entry of list.getEntries()) window.__perf.lcp = entry.startTime;
+}).observe({type: 'largest-contentful-paint', buffered: true});
+new PerformanceObserver(list => {
+    for (const entry of list.getEntries()) {
+        if (!entry.hadRecentInput) window.__perf.cls += entry.value;
+    }
+}).observe({type: 'layout-shift', buffered: true});
+"""
+
+COLLECT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const transfer = resources.reduce((sum, r) => sum + (r.transferSize || 0), nav.transferSize || 0);
+    return {
+        ttfb_ms: nav.responseStart - nav.startTime,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd - nav.startTime,
+        load_ms: nav.loadEventEnd - nav.startTime,
+        lcp_ms: window.__perf.lcp,
+        cls: window.__perf.cls,
+        js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+        transfer_kb: transfer / 1024,
+    };
+}
+"""
+
+METRICS = ["ttfb_ms", "dom_content_loaded_ms", "load_ms", "lcp_ms", "cls", "js_heap_mb", "transfer_kb"]
+
+
+def percentile(values: list, pct: float) -> float:
+    """Linear-interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def load_budget(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def budget_for(budget: dict, page_name: str, viewport_name: str) -> dict:
+    limits = dict(budget.get("defaults", {}))
+    limits.update(budget.get("pages", {}).get(page_name, {}).get(viewport_name, {}))
+    return limits
+
+
+async def sample(browser, url: str, viewport: dict) -> dict:
+    """Load url once in a fresh context and collect its metrics."""
+    context = await browser.new_context(viewport=viewport)
+    await context.add_init_script(OBSERVER_SCRIPT)
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until="load")
+        await page.wait_for_timeout(SETTLE_MS)
+        return await page.evaluate(COLLECT_SCRIPT)
+    finally:
+        await context.close()
+
+
+async def measure(browser, base_url: str, page_name: str, path: str,
+                  viewport_name: str, samples: int) -> dict:
+    url = f"{base_url}{path}"
+    runs = [await sample(browser, url, VIEWPORTS[viewport_name]) for _ in range(samples)]
+
+    stats = {}
+    for metric in METRICS:
+        values = [run[metric] for run in runs if run.get(metric) is not None]
+        if values:
+            stats[metric] = {name: round(percentile(values, pct), 4) for name, pct in PERCENTILES.items()}
+    return {"page": page_name, "viewport": viewport_name, "url": url, "samples": runs, "stats": stats}
+
+
+def check(result: dict, limits: dict, which: str) -> list:
+    """Metrics of one result that exceed their budget."""
+    over = []
+    for metric, limit in limits.items():
+        value = result["stats"].get(metric, {}).get(which)
+        if value is not None and value > limit:
+            over.append({"metric": metric, "value": value, "budget": limit})
+    return over
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Check page performance against a budget")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"Locally served build (default: {BASE_URL})")
+    parser.add_argument("--samples", "-n", type=int, default=DEFAULT_SAMPLES,
+                        help=f"Loads per page and viewport (default: {DEFAULT_SAMPLES})")
+    parser.add_argument("--pages", nargs="+", help="Only these page names")
+    parser.add_argument("--viewports", nargs="+", choices=list(VIEWPORTS), help="Only these viewports")
+    parser.add_argument("--budget", type=Path, default=BUDGET_FILE, help="Budget file")
+    args = parser.parse_args()
+
+    budget = load_budget(args.budget)
+    which = budget.get("percentile", "p75")
+    pages = [(name, path) for name, path in PAGES if not args.pages or name in args.pages]
+    viewports = args.viewports or list(VIEWPORTS)
+
+    print("=" * 60)
+    print("Some Claude Skills - Performance Budget")
+    print("=" * 60)
+    print(f"Base URL: {args.base_url}")
+    print(f"Budget: {args.budget} ({which} of {args.samples} samples)")
+
+    results = []
+    failures = 0
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        # Sequential on purpose: concurrent loads would skew each other's timings
+        for page_name, path in pages:
+            for viewport_name in viewports:
+                result = await measure(browser, args.base_url, page_name, path, viewport_name, args.samples)
+                result["budget"] = budget_for(budget, page_name, viewport_name)
+                result["over_budget"] = check(result, result["budget"], which)
+                results.append(result)
+
+                status = "FAIL" if result["over_budget"] else "ok"
+                print(f"\n{page_name} ({viewport_name}): {status}")
+                for metric in METRICS:
+                    stats = result["stats"].get(metric)
+                    if not stats:
+                        continue
+                    limit = result["budget"].get(metric)
+                    marker = " !" if any(o["metric"] == metric for o in result["over_budget"]) else ""
+                    print(f"  {metric:<22} p50 {stats['p50']:>9.2f}  p75 {stats['p75']:>9.2f}  "
+                          f"p95 {stats['p95']:>9.2f}" + (f"  budget {limit}" if limit is not None else "") + marker)
+                failures += bool(result["over_budget"])
+
+        await browser.close()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output_path = RESULTS_DIR / f"{datetime.now().strftime('%Y-%m-%d-%H%M%S')}.json"
+    output_path.write_text(json.dumps({
+        "base_url": args.base_url,
+        "percentile": which,
+        "samples": args.samples,
+        "results": results,
+    }, indent=2), encoding="utf-8")
+
+    print("\n" + "=" * 60)
+    print(f"{len(results) - failures}/{len(results)} page/viewport combinations within budget")
+    print(f"Results: {output_path}")
+    print("=" * 60)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
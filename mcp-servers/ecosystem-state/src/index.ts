@@ -5,7 +5,7 @@
  * Exposes tools to query the Founding Council ecosystem:
  * - list_agents: Get all agents with their metadata
  * - list_skills: Get all skills with their metadata
- * - get_capability_graph: Generate relationship graph between agents/skills
+ * - get_capability_graph: Relationship graph between agents/skills/tools
  * - validate_structure: Run validation checks on ecosystem
  * - get_ecosystem_stats: Get statistics about the ecosystem
  *
@@ -29,6 +29,7 @@ import * as path from "path";
 const PROJECT_ROOT = process.env.PROJECT_ROOT || process.cwd();
 const AGENTS_DIR = path.join(PROJECT_ROOT, ".claude/agents");
 const SKILLS_DIR = path.join(PROJECT_ROOT, ".claude/skills");
+const STATE_FILE = path.join(PROJECT_ROOT, ".claude/data/ecosystem-state.json");
 
 // Types
 interface AgentInfo {
@@ -246,6 +247,17 @@ function generateCapabilityGraph(agents: AgentInfo[], skills: SkillInfo[]): obje
   return { nodes, edges };
 }
 
+// Graph and metrics precomputed by scripts/generate_ecosystem_data.py
+async function loadPrecomputedGraph(): Promise<object | null> {
+  try {
+    const state = JSON.parse(await fs.readFile(STATE_FILE, "utf-8"));
+    if (!state.capability_graph) return null;
+    return { ...state.capability_graph, metrics: state.graph_metrics };
+  } catch {
+    return null;
+  }
+}
+
 // Create server
 const server = new Server(
   {
@@ -292,7 +304,7 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
     },
     {
       name: "get_capability_graph",
-      description: "Generate a capability graph showing relationships between agents and skills",
+      description: "Get the capability graph of agents, skills and tools, with degree, PageRank and component metrics when ecosystem-state.json has been generated",
       inputSchema: {
         type: "object",
         properties: {},
@@ -379,9 +391,8 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       }
 
       case "get_capability_graph": {
-        const agents = await loadAgents();
-        const skills = await loadSkills();
-        const graph = generateCapabilityGraph(agents, skills);
+        const graph = (await loadPrecomputedGraph())
+          ?? generateCapabilityGraph(await loadAgents(), await loadSkills());
 
         return {
           content: [
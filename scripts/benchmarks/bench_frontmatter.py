@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Parser Microbenchmark
+
+Compares scripts/frontmatter_parser.py against the four ad-hoc parsers it
+replaced (kept below verbatim as reference implementations):
+
+- scan-and-ingest-skills: hand-rolled line splitting, no YAML
+- validate_skill / validate_agent: content.split('---', 2)
+- generate_ecosystem_data: content.split('---', 2) + yaml.safe_load
+- build_embeddings: python-frontmatter (skipped if not installed)
+
+Usage:
+    python scripts/benchmarks/bench_frontmatter.py
+    python scripts/benchmarks/bench_frontmatter.py --dir .claude/skills --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import frontmatter_parser  # noqa: E402
+
+
+# =============================================================================
+# LEGACY PARSERS
+# =============================================================================
+
+def legacy_scan_and_ingest(content: str):
+    if not content.startswith("---"):
+        return None
+
+    try:
+        end = content.index("---", 3)
+        frontmatter = content[3:end].strip()
+
+        result = {}
+        for line in frontmatter.split("\n"):
+            if ":" in line and not line.startswith(" ") and not line.startswith("-"):
+                key, value = line.split(":", 1)
+                result[key.strip()] = value.strip()
+
+        return result
+    except (ValueError, IndexError):
+        return None
+
+
+def legacy_validate_split(content: str):
+    if not content.startswith('---'):
+        return None
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return None
+    return parts[1], parts[2]
+
+
+def legacy_ecosystem_yaml(content: str):
+    if not content.startswith("---"):
+        return {}, content
+
+    try:
+        parts = content.split("---", 2)
+        if len(parts) >= 3:
+            frontmatter = yaml.safe_load(parts[1]) or {}
+            body = parts[2].strip()
+            return frontmatter, body
+    except yaml.YAMLError:
+        pass
+
+    return {}, content
+
+
+def legacy_python_frontmatter():
+    try:
+        import frontmatter
+    except ImportError:
+        return None
+
+    def parse(content: str):
+        doc = frontmatter.loads(content)
+        return dict(doc.metadata), doc.content
+
+    return parse
+
+
+# =============================================================================
+# CORPUS
+# =============================================================================
+
+SYNTHETIC_DOC = """---
+name: synthetic-skill-{i}
+description: Synthetic skill {i} used for parser benchmarks. Activate on "bench", "parse". NOT for production.
+allowed-tools: Read,Write,Edit,Bash(python:*,npm:*)
+category: Benchmarks
+tags:
+  - synthetic
+  - benchmark
+pairs-with:
+  - skill: synthetic-skill-{j}
+    reason: Adjacent fixture
+---
+
+# Synthetic Skill {i}
+
+{body}
+"""
+
+
+def load_corpus(directory: Path, synthetic: int) -> List[str]:
+    """Load SKILL.md/AGENT.md files, or generate synthetic ones."""
+    docs = []
+    if directory.exists():
+        for pattern in ("*/SKILL.md", "*/AGENT.md", "*.md"):
+            docs.extend(p.read_text(encoding="utf-8", errors="ignore")
+                        for p in directory.glob(pattern))
+
+    if not docs:
+        paragraph = "Guidance paragraph with `code`, lists and --- dashes.\n\n" * 200
+        docs = [SYNTHETIC_DOC.format(i=i, j=(i + 1) % synthetic, body=paragraph)
+                for i in range(synthetic)]
+
+    return docs
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def time_parser(parse: Callable[[str], Any], docs: List[str], repeat: int,
+                before_each: Callable[[], None] = None) -> float:
+    """Return best-of-repeat microseconds per document."""
+    best = float("inf")
+    for _ in range(repeat):
+        if before_each:
+            before_each()
+        start = time.perf_counter()
+        for doc in docs:
+            parse(doc)
+        best = min(best, time.perf_counter() - start)
+    return best / len(docs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parsers")
+    parser.add_argument("--dir", type=Path, default=Path(".claude/skills"),
+                        help="Directory of skills/agents to parse (default: .claude/skills)")
+    parser.add_argument("--synthetic", type=int, default=500,
+                        help="Synthetic documents to generate if --dir is empty")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions (best-of)")
+    args = parser.parse_args()
+
+    docs = load_corpus(args.dir, args.synthetic)
+    total_kb = sum(len(d) for d in docs) / 1024
+
+    candidates: List[Tuple[str, Callable[[str], Any], Callable[[], None]]] = [
+        ("scan-and-ingest (line split)", legacy_scan_and_ingest, None),
+        ("validate_skill/agent (str.split)", legacy_validate_split, None),
+        ("generate_ecosystem_data (split + safe_load)", legacy_ecosystem_yaml, None),
+    ]
+    python_frontmatter = legacy_python_frontmatter()
+    if python_frontmatter:
+        candidates.append(("build_embeddings (python-frontmatter)", python_frontmatter, None))
+    candidates.extend([
+        ("frontmatter_parser.split_frontmatter", frontmatter_parser.split_frontmatter, None),
+        ("frontmatter_parser (cold cache)", frontmatter_parser.parse_frontmatter,
+         frontmatter_parser.clear_cache),
+        ("frontmatter_parser (warm cache)", frontmatter_parser.parse_frontmatter, None),
+    ])
+
+    print(f"Corpus: {len(docs)} documents, {total_kb:,.0f} KB")
+    print(f"libyaml CSafeLoader: {'yes' if frontmatter_parser.HAS_LIBYAML else 'no'}")
+    if not python_frontmatter:
+        print("python-frontmatter not installed, skipping build_embeddings baseline")
+    print()
+
+    results: Dict[str, float] = {}
+    for name, parse, before_each in candidates:
+        results[name] = time_parser(parse, docs, args.repeat, before_each)
+
+    width = max(len(name) for name in results)
+    for name, micros in results.items():
+        print(f"  {name:<{width}}  {micros:10.1f} µs/doc")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
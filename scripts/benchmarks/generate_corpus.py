@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Synthetic Ecosystem Corpus
+
+Builds a realistic .claude/skills + .claude/agents tree of a given size
+for benchmarking the ecosystem scripts. Each skill gets:
+
+- SKILL.md with name/description/allowed-tools/category/tags frontmatter
+  and a body of a few KB (sections, lists, code blocks)
+- a "**Use with**:" line linking the next skill (so links form one big
+  cycle), one or two random skills and, occasionally, a misspelled name
+- 0-3 references/*.md files mentioned from the body, plus an occasional
+  mention of a reference that does not exist
+- sometimes a CHANGELOG.md or a scripts/ directory
+
+Agents (one per ten skills, at least five) alternate between the flat
+(<name>.md) and directory (<name>/AGENT.md) formats; directory agents
+list coordinates_with peers in a ring, which also forms cycles.
+
+Output is deterministic for a given --size and --seed: every entry is
+generated from its own seeded RNG, so the tree can be written by a process
+pool. A corpus.json marker records the parameters; an existing corpus
+with the same marker is reused, and a directory without one is never
+overwritten.
+
+Usage:
+    python scripts/benchmarks/generate_corpus.py --size 1000
+    python scripts/benchmarks/generate_corpus.py --size 100000 --out /tmp/corpus-100k --workers 8
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+CORPUS_VERSION = 1
+MARKER = "corpus.json"
+DEFAULT_ROOT = Path(".cache/bench-corpus")
+
+ADJECTIVES = [
+    "adaptive", "async", "atomic", "bayesian", "civic", "cloud", "creative", "data",
+    "distributed", "edge", "fluent", "graph", "hybrid", "incremental", "kinetic", "lean",
+    "mobile", "neural", "open", "quantum", "reactive", "secure", "sonic", "visual",
+]
+NOUNS = [
+    "api", "audio", "brand", "cache", "chart", "climate", "color", "compiler",
+    "content", "drone", "finance", "font", "game", "health", "image", "legal",
+    "map", "music", "network", "photo", "prompt", "search", "shader", "video",
+]
+ROLES = [
+    "architect", "auditor", "coach", "curator", "designer", "engineer",
+    "expert", "optimizer", "planner", "specialist", "strategist", "writer",
+]
+CATEGORIES = [
+    "security", "testing", "infrastructure", "design", "ml-ai", "career",
+    "audio-video", "documentation", "backend", "frontend",
+]
+TOOLS = ["Read", "Write", "Edit", "Bash", "Grep", "Glob", "WebFetch", "WebSearch", "Task"]
+MCP_TOOLS = [
+    "mcp__firecrawl__firecrawl_search", "mcp__stability-ai__stability-ai-generate-image",
+    "mcp__magic__21st_magic_component_builder", "mcp__SequentialThinking__sequentialthinking",
+]
+WORDS = (
+    "pipeline latency cache index schema budget review pattern layout contrast token "
+    "embedding vector query shard manifest render audit deploy rollout metric trace "
+    "signal baseline regression heuristic workflow checklist prototype component state "
+    "boundary contract fixture dataset threshold throughput accessibility palette grid "
+    "narrative persona journey funnel cohort anomaly forecast constraint tradeoff"
+).split()
+
+
+def skill_name(i: int) -> str:
+    """Unique, deterministic, realistic-looking skill name for index i."""
+    a, rest = i % len(ADJECTIVES), i // len(ADJECTIVES)
+    n, rest = rest % len(NOUNS), rest // len(NOUNS)
+    r, rest = rest % len(ROLES), rest // len(ROLES)
+    name = f"{ADJECTIVES[a]}-{NOUNS[n]}-{ROLES[r]}"
+    return f"{name}-{rest + 1}" if rest else name
+
+
+def agent_name(i: int) -> str:
+    return f"{NOUNS[i % len(NOUNS)]}-{ROLES[(i // len(NOUNS)) % len(ROLES)]}-agent-{i}"
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng, rng.randint(8, 18)) for _ in range(rng.randint(3, 6)))
+
+
+def title(name: str) -> str:
+    return " ".join(part.capitalize() for part in name.split("-"))
+
+
+def make_skill(i: int, size: int, seed: int) -> Dict[str, str]:
+    """Files (relative to the skill directory) of skill i."""
+    rng = random.Random(seed * 1_000_003 + i)
+    name = skill_name(i)
+    files: Dict[str, str] = {}
+
+    # Next skill (closing one cycle through the catalogue) plus random peers
+    peers = [skill_name((i + 1) % size)] if size > 1 else []
+    peers += [skill_name(rng.randrange(size)) for _ in range(rng.randint(1, 2))]
+    if rng.random() < 0.02:
+        peers.append(skill_name(rng.randrange(size)).replace("-", "", 1))
+    peers = [p for p in dict.fromkeys(peers) if p != name]
+
+    tools = rng.sample(TOOLS, rng.randint(3, 6))
+    if rng.random() < 0.3:
+        tools.append(rng.choice(MCP_TOOLS))
+
+    references = [f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{k}.md" for k in range(rng.randint(0, 3))]
+    mentioned = list(references)
+    if rng.random() < 0.05:
+        mentioned.append("missing-guide.md")
+
+    keywords = rng.sample(WORDS, 3)
+    lines = [
+        "---",
+        f"name: {name}",
+        f"description: {sentence(rng, 14)[:-1]}. Activate on \"{keywords[0]}\", \"{keywords[1]}\", "
+        f"\"{keywords[2]}\". NOT for {rng.choice(WORDS)} or {rng.choice(WORDS)} work.",
+        f"allowed-tools: {','.join(tools)}",
+        f"category: {rng.choice(CATEGORIES)}",
+        f"tags: [{', '.join(rng.sample(WORDS, 4))}]",
+        "---",
+        "",
+        f"# {title(name)}",
+        "",
+        paragraph(rng),
+        "",
+    ]
+    if peers:
+        lines += [f"**Use with**: {', '.join(peers[:-1] + [f'{peers[-1]} ({rng.choice(WORDS)})'])}", ""]
+
+    lines += ["## When to Use", ""]
+    lines += [f"- {sentence(rng, rng.randint(5, 10))}" for _ in range(rng.randint(3, 6))]
+    lines += ["", "## Core Patterns", ""]
+    for k in range(rng.randint(2, 5)):
+        lines += [f"### Pattern {k + 1}: {title(rng.choice(WORDS))}", "", paragraph(rng), ""]
+        if rng.random() < 0.6:
+            lines += ["```python", f"def {rng.choice(WORDS)}_{k}(data):",
+                      f"    return [x for x in data if x.{rng.choice(WORDS)}]", "```", ""]
+    lines += ["## Anti-Patterns", ""]
+    lines += [f"- **{title(rng.choice(WORDS))}**: {sentence(rng, 10)}" for _ in range(rng.randint(2, 4))]
+    if mentioned:
+        lines += ["", "## References", ""]
+        lines += [f"- `references/{ref}` - {sentence(rng, 6)}" for ref in mentioned]
+    files["SKILL.md"] = "\n".join(lines) + "\n"
+
+    for ref in references:
+        files[f"references/{ref}"] = f"# {title(ref[:-3])}\n\n" + "\n\n".join(
+            paragraph(rng) for _ in range(rng.randint(2, 8))) + "\n"
+    if rng.random() < 0.3:
+        files["CHANGELOG.md"] = f"# Changelog\n\n## v1.{rng.randint(0, 9)}.0\n\n- {sentence(rng, 8)}\n"
+    if rng.random() < 0.1:
+        files[f"scripts/{rng.choice(WORDS)}.py"] = "#!/usr/bin/env python3\nprint('ok')\n"
+    return files
+
+
+def make_agent(i: int, count: int, seed: int) -> Dict[str, str]:
+    """Files (relative to the agents directory) of agent i."""
+    rng = random.Random(seed * 2_000_003 + i)
+    name = agent_name(i)
+    if i % 2:
+        return {f"{name}.md": "\n".join([
+            "---",
+            f"name: {name}",
+            f"description: {sentence(rng, 12)}",
+            f"tools: {', '.join(rng.sample(TOOLS, 4))}",
+            f"model: {rng.choice(['sonnet', 'opus', 'haiku'])}",
+            "---",
+            "",
+            f"You are {title(name)}. {paragraph(rng)}",
+            "",
+        ])}
+
+    peers = [agent_name((i + 2) % count)] + [agent_name(rng.randrange(count)) for _ in range(rng.randint(0, 2))]
+    peers = [p for p in dict.fromkeys(peers) if p != name]
+    return {f"{name}/AGENT.md": "\n".join([
+        "---",
+        f"name: {name}",
+        f"role: {sentence(rng, 5)[:-1]}",
+        f"allowed-tools: {','.join(rng.sample(TOOLS, 4))}",
+        f"triggers: [{', '.join(repr(w) for w in rng.sample(WORDS, 3))}]",
+        f"coordinates_with: [{', '.join(peers)}]",
+        f"outputs: [{', '.join(rng.sample(WORDS, 2))}]",
+        "---",
+        "",
+        f"# {title(name)}",
+        "",
+        paragraph(rng),
+        "",
+        "## Responsibilities",
+        "",
+        *[f"- {sentence(rng, 8)}" for _ in range(rng.randint(3, 6))],
+        "",
+    ])}
+
+
+def write_files(root: Path, files: Dict[str, str]) -> None:
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def write_skills(job: Dict) -> int:
+    """Write skills [start, stop) (runs in a worker process)."""
+    skills_dir = Path(job["skills_dir"])
+    for i in range(job["start"], job["stop"]):
+        write_files(skills_dir / skill_name(i), make_skill(i, job["size"], job["seed"]))
+    return job["stop"] - job["start"]
+
+
+def agent_count(size: int) -> int:
+    return max(5, size // 10)
+
+
+def ensure_corpus(out: Path, size: int, seed: int = 0, workers: int = 1) -> Path:
+    """Return out, generating the corpus there unless an identical one exists."""
+    marker = {"version": CORPUS_VERSION, "size": size, "seed": seed}
+    marker_path = out / MARKER
+    if marker_path.exists():
+        if json.loads(marker_path.read_text(encoding="utf-8")) == marker:
+            return out
+        shutil.rmtree(out)
+    elif out.exists() and any(out.iterdir()):
+        raise FileExistsError(f"{out} exists and is not a generated corpus")
+
+    claude_dir = out / ".claude"
+    skills_dir = claude_dir / "skills"
+    skills_dir.mkdir(parents=True, exist_ok=True)
+
+    chunk = max(1, min(1000, size // max(1, workers * 4)))
+    jobs = [{"skills_dir": str(skills_dir), "start": s, "stop": min(size, s + chunk), "size": size, "seed": seed}
+            for s in range(0, size, chunk)]
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(write_skills, jobs))
+
+    agents = agent_count(size)
+    for i in range(agents):
+        write_files(claude_dir / "agents", make_agent(i, agents, seed))
+
+    marker_path.write_text(json.dumps(marker), encoding="utf-8")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic skills/agents corpus")
+    parser.add_argument("--size", type=int, required=True, help="Number of skills (e.g. 100, 1000, 10000, 100000)")
+    parser.add_argument("--out", type=Path, help=f"Output directory (default: {DEFAULT_ROOT}/<size>)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1, help="Writer processes")
+    args = parser.parse_args()
+
+    out = (args.out or DEFAULT_ROOT / str(args.size)).resolve()
+    start = time.perf_counter()
+    try:
+        ensure_corpus(out, args.size, args.seed, args.workers)
+    except FileExistsError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"✅ Corpus: {out}")
+    print(f"   {args.size} skills, {agent_count(args.size)} agents ({time.perf_counter() - start:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
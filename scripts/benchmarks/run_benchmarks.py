@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Ecosystem Scripts Benchmark
+
+Times the ecosystem scripts against synthetic corpora from
+generate_corpus.py (generated on first use under .cache/bench-corpus/):
+
+- generate_ecosystem_data  full build (generate_ecosystem_data_noop then
+                           times a no-op incremental run)
+- generate_snapshot        snapshot of the state written above
+- measure-ecosystem        --full metrics collection
+- check_dependencies       dependency and cross-reference check
+- validate_skill           SkillValidator over every skill, in one process
+- build_embeddings         --rebuild into a corpus-local ChromaDB
+- semantic_search          one query against that collection
+
+Every benchmark runs as its own subprocess with the corpus as working
+directory. Wall time and the child's peak RSS (from wait4) are recorded.
+build_embeddings and semantic_search are skipped when chromadb or
+sentence-transformers is not installed. Results are printed as a table
+and appended, one JSON object per benchmark, to
+.cache/benchmarks/results.jsonl together with the git revision, so runs
+can be compared over time.
+
+Usage:
+    python scripts/benchmarks/run_benchmarks.py
+    python scripts/benchmarks/run_benchmarks.py --sizes 100 1000 10000 100000
+    python scripts/benchmarks/run_benchmarks.py --sizes 10000 --only generate_ecosystem_data check_dependencies
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from generate_corpus import DEFAULT_ROOT, ensure_corpus
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRIPTS_DIR.parent
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_RESULTS = Path(".cache/benchmarks/results.jsonl")
+DEFAULT_TIMEOUT = 3600
+
+SEARCH_QUERY = "cache latency budget for a distributed pipeline"
+
+# Runs SkillValidator over every skill in one interpreter, so the benchmark
+# measures validation rather than a process start per skill
+VALIDATE_ALL = """
+import sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from validate_skill import SkillValidator
+failed = 0
+for skill_dir in sorted(Path(".claude/skills").iterdir()):
+    if skill_dir.is_dir():
+        failed += not SkillValidator(skill_dir).validate()
+print(f"{failed} skills failed validation")
+"""
+
+
+@dataclass
+class Benchmark:
+    """One script invocation; cmd is built from the corpus directory."""
+    name: str
+    cmd: Callable[[Path], List[str]]
+    requires: List[str] = field(default_factory=list)
+    # Exit codes that still count as a successful run
+    ok_codes: Tuple[int, ...] = (0,)
+
+
+@dataclass
+class Result:
+    size: int
+    benchmark: str
+    status: str
+    wall_s: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    exit_code: Optional[int] = None
+    detail: str = ""
+
+
+def script(name: str) -> str:
+    return str(SCRIPTS_DIR / name)
+
+
+BENCHMARKS = [
+    Benchmark("generate_ecosystem_data",
+              lambda corpus: [sys.executable, script("generate_ecosystem_data.py"), "--full", "--compact"]),
+    Benchmark("generate_ecosystem_data_noop",
+              lambda corpus: [sys.executable, script("generate_ecosystem_data.py"), "--compact"]),
+    Benchmark("generate_snapshot",
+              lambda corpus: [sys.executable, script("generate_snapshot.py"), "--label", "bench"]),
+    Benchmark("measure-ecosystem",
+              lambda corpus: [sys.executable, script("measure-ecosystem.py"), "--dir", str(corpus),
+                              "--json", "--full"]),
+    Benchmark("check_dependencies",
+              lambda corpus: [sys.executable, script("check_dependencies.py"), "--dir", str(corpus), "--json"],
+              # 1 means issues were found, which the corpus plants on purpose
+              ok_codes=(0, 1)),
+    Benchmark("validate_skill",
+              lambda corpus: [sys.executable, "-c", VALIDATE_ALL, str(SCRIPTS_DIR)]),
+    Benchmark("build_embeddings",
+              lambda corpus: [sys.executable, script("build_embeddings.py"),
+                              "--skills-dir", str(corpus / ".claude" / "skills"),
+                              "--agents-dir", str(corpus / ".claude" / "agents"),
+                              "--chroma-path", str(corpus / ".chroma_db"),
+                              "--rebuild", "--no-export"],
+              requires=["chromadb", "sentence_transformers"]),
+    Benchmark("semantic_search",
+              lambda corpus: [sys.executable, script("semantic_search.py"), SEARCH_QUERY,
+                              "--chroma-path", str(corpus / ".chroma_db")],
+              requires=["chromadb", "sentence_transformers"]),
+]
+
+
+def missing_modules(modules: List[str]) -> List[str]:
+    return [m for m in modules if importlib.util.find_spec(m) is None]
+
+
+def run_benchmark(cmd: List[str], cwd: Path, timeout: float):
+    """Run cmd, returning (exit code, wall seconds, peak RSS MB, stderr tail)."""
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=stderr)
+
+        # wait4 reports the rusage of this child alone (RUSAGE_CHILDREN would
+        # be the maximum over every child waited for so far)
+        waited = {}
+        waiter = threading.Thread(target=lambda: waited.update(rusage=os.wait4(proc.pid, 0)))
+        waiter.start()
+        waiter.join(timeout)
+        if waiter.is_alive():
+            proc.kill()
+            waiter.join()
+            proc.returncode = -9
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        wall = time.perf_counter() - start
+
+        _, status, rusage = waited["rusage"]
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        stderr.seek(0)
+        tail = stderr.read()[-500:].decode("utf-8", "replace")
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = rusage.ru_maxrss / (1024 * 1024) if sys.platform == "darwin" else rusage.ru_maxrss / 1024
+    return proc.returncode, wall, peak, tail
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ecosystem scripts on synthetic corpora")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help=f"Corpus sizes in skills (default: {DEFAULT_SIZES})")
+    parser.add_argument("--only", nargs="+", choices=[b.name for b in BENCHMARKS], metavar="NAME",
+                        help="Only these benchmarks")
+    parser.add_argument("--corpus-root", type=Path, default=REPO_ROOT / DEFAULT_ROOT,
+                        help="Where corpora are generated and cached")
+    parser.add_argument("--results", type=Path, default=REPO_ROOT / DEFAULT_RESULTS,
+                        help="JSON-lines results file to append to")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    args = parser.parse_args()
+
+    benchmarks = [b for b in BENCHMARKS if not args.only or b.name in args.only]
+    revision = git_revision()
+    run_at = datetime.now(timezone.utc).isoformat()
+    results: List[Result] = []
+
+    for size in args.sizes:
+        print(f"\n📦 Corpus: {size} skills")
+        start = time.perf_counter()
+        corpus = ensure_corpus(args.corpus_root / str(size), size, args.seed, os.cpu_count() or 1)
+        print(f"   ready in {time.perf_counter() - start:.1f}s ({corpus})")
+
+        for bench in benchmarks:
+            missing = missing_modules(bench.requires)
+            if missing:
+                result = Result(size, bench.name, "skipped", detail=f"missing {', '.join(missing)}")
+            else:
+                try:
+                    code, wall, peak, stderr = run_benchmark(bench.cmd(corpus), corpus, args.timeout)
+                    ok = code in bench.ok_codes
+                    result = Result(size, bench.name, "ok" if ok else "failed",
+                                    round(wall, 3), round(peak, 1), code, "" if ok else stderr)
+                except subprocess.TimeoutExpired:
+                    result = Result(size, bench.name, "timeout", detail=f"> {args.timeout:.0f}s")
+            results.append(result)
+
+            if result.wall_s is not None:
+                print(f"   {bench.name:<34} {result.wall_s:>9.2f}s {result.peak_rss_mb:>9.1f} MB  {result.status}")
+            else:
+                print(f"   {bench.name:<34} {'-':>10} {'-':>12}  {result.status} ({result.detail})")
+
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.results, "a", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps({"run_at": run_at, "revision": revision, **asdict(result)}) + "\n")
+
+    failures = [r for r in results if r.status in ("failed", "timeout")]
+    print(f"\n📊 {len(results)} results appended to {args.results}")
+    if failures:
+        print(f"❌ {len(failures)} benchmark(s) failed or timed out")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
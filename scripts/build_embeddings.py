@@ -11,6 +11,11 @@ Usage:
     python scripts/build_embeddings.py
     python scripts/build_embeddings.py --skills-dir .claude/skills --agents-dir .claude/agents
     python scripts/build_embeddings.py --rebuild  # Force rebuild from scratch
+    python scripts/build_embeddings.py --export-dtype int8
+
+After each build the collection is also exported to
+.claude/data/embeddings/skill-embeddings.bin, a memory-mappable binary file
+(see embedding_export.py). Use --no-export to skip it.
 """
 
 import os
@@ -18,12 +23,13 @@ import sys
 import json
 import hashlib
 import re
+import struct
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 import click
-import frontmatter
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
@@ -32,6 +38,9 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from embedding_export import DTYPES, EmbeddingExport, write_export
+from frontmatter_parser import parse_frontmatter
+
 console = Console()
 
 # Constants
@@ -39,6 +48,7 @@ EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 EMBEDDING_DIM = 384
 CHROMA_COLLECTION_NAME = "claude_ecosystem"
 DEFAULT_CHROMA_PATH = ".chroma_db"
+DEFAULT_EXPORT_PATH = ".claude/data/embeddings/skill-embeddings.bin"
 
 
 @dataclass
@@ -109,18 +119,20 @@ def parse_document(file_path: Path, doc_type: str) -> Optional[ParsedDocument]:
     Extracts YAML frontmatter and markdown content.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            doc = frontmatter.load(f)
+        metadata, body = parse_frontmatter(
+            file_path.read_text(encoding='utf-8'), lenient=True
+        )
+        content = body.strip()
 
-        name = doc.metadata.get('name', file_path.parent.name)
-        sections = parse_markdown_sections(doc.content)
+        name = metadata.get('name', file_path.parent.name)
+        sections = parse_markdown_sections(content)
 
         return ParsedDocument(
             path=str(file_path),
             doc_type=doc_type,
             name=name,
-            frontmatter=dict(doc.metadata),
-            content=doc.content,
+            frontmatter=metadata,
+            content=content,
             sections=sections
         )
     except Exception as e:
@@ -229,11 +241,48 @@ def find_documents(
     return skill_files, agent_files
 
 
+def export_is_current(collection, export_path: Path, dtype: str) -> bool:
+    """True if export_path holds this collection's vectors in dtype, from EMBEDDING_MODEL."""
+    try:
+        with EmbeddingExport(export_path) as export:
+            info = export.info()
+            return (export.dtype == DTYPES[dtype]
+                    and export.count == collection.count()
+                    and info.get("model") == EMBEDDING_MODEL
+                    and info.get("collection") == CHROMA_COLLECTION_NAME)
+    except (OSError, ValueError, struct.error):
+        # Missing, truncated or not an export (json.JSONDecodeError is a ValueError)
+        return False
+
+
+def export_collection(collection, export_path: Path, dtype: str) -> Dict[str, int]:
+    """Export every vector in the collection to a binary file."""
+    data = collection.get(include=["embeddings", "documents", "metadatas"])
+    ids = data["ids"]
+    # Stable row order, independent of ChromaDB's storage order
+    order = sorted(range(len(ids)), key=lambda i: ids[i])
+    return write_export(
+        export_path,
+        [ids[i] for i in order],
+        (data["embeddings"][i] for i in order),
+        [data["documents"][i] for i in order],
+        [data["metadatas"][i] for i in order],
+        info={
+            "model": EMBEDDING_MODEL,
+            "collection": CHROMA_COLLECTION_NAME,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        dtype=dtype,
+    )
+
+
 def build_embeddings(
     skills_dir: str = ".claude/skills",
     agents_dir: str = ".claude/agents",
     chroma_path: str = DEFAULT_CHROMA_PATH,
-    rebuild: bool = False
+    rebuild: bool = False,
+    export_path: Optional[str] = DEFAULT_EXPORT_PATH,
+    export_dtype: str = "float32"
 ) -> Dict[str, Any]:
     """
     Main function to build embeddings for all skills and agents.
@@ -243,6 +292,8 @@ def build_embeddings(
         agents_dir: Path to agents directory
         chroma_path: Path for ChromaDB persistence
         rebuild: If True, delete existing collection and rebuild
+        export_path: Binary export path, or None to skip the export
+        export_dtype: 'float32' or 'int8' vectors in the export
 
     Returns:
         Statistics about the build process
@@ -346,6 +397,9 @@ def build_embeddings(
 
     if not new_chunks and not rebuild:
         console.print("\n[green]No new content to embed. Database is up to date.[/green]")
+        if export_path and not export_is_current(collection, base_dir / export_path, export_dtype):
+            stats = export_collection(collection, base_dir / export_path, export_dtype)
+            console.print(f"  Exported {stats['count']} vectors to {export_path} ({stats['bytes']:,} bytes)")
         return {
             "total_docs": len(all_docs),
             "total_chunks": len(all_chunks),
@@ -426,6 +480,12 @@ def build_embeddings(
     count = collection.count()
     console.print(f"  Total documents in collection: {count}")
 
+    if export_path:
+        console.print("\n[bold]Exporting binary vectors...[/bold]")
+        export_stats = export_collection(collection, base_dir / export_path, export_dtype)
+        console.print(f"  {export_stats['count']} x {export_stats['dim']} {export_dtype} vectors "
+                      f"-> {export_path} ({export_stats['bytes']:,} bytes)")
+
     return stats
 
 
@@ -450,7 +510,24 @@ def build_embeddings(
     is_flag=True,
     help='Force rebuild from scratch (delete existing collection)'
 )
-def main(skills_dir: str, agents_dir: str, chroma_path: str, rebuild: bool):
+@click.option(
+    '--export-path',
+    default=DEFAULT_EXPORT_PATH,
+    help='Binary vector export path (relative to project root)'
+)
+@click.option(
+    '--export-dtype',
+    type=click.Choice(['float32', 'int8']),
+    default='float32',
+    help='Vector type in the binary export (int8 is 4x smaller)'
+)
+@click.option(
+    '--no-export',
+    is_flag=True,
+    help='Skip the binary vector export'
+)
+def main(skills_dir: str, agents_dir: str, chroma_path: str, rebuild: bool,
+         export_path: str, export_dtype: str, no_export: bool):
     """
     Build embeddings for the Claude Skills Ecosystem.
 
@@ -462,7 +539,9 @@ def main(skills_dir: str, agents_dir: str, chroma_path: str, rebuild: bool):
             skills_dir=skills_dir,
             agents_dir=agents_dir,
             chroma_path=chroma_path,
-            rebuild=rebuild
+            rebuild=rebuild,
+            export_path=None if no_export else export_path,
+            export_dtype=export_dtype
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Build interrupted by user[/yellow]")
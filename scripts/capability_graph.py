@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Capability Graph - Part of The Forge
+
+Graph of agents, skills and tools used by generate_ecosystem_data.py.
+
+Nodes are numbered in insertion order and edges are stored as adjacency
+arrays (compressed sparse rows): the out-neighbours of node i are
+targets[offsets[i]:offsets[i + 1]]. The same layout is serialized to
+ecosystem-state.json so consumers can walk the graph without rebuilding
+it from the edge list.
+
+Precomputed metrics, as arrays aligned with the node list:
+
+- in_degree / out_degree
+- pagerank     PageRank centrality (damping 0.85); dangling nodes spread
+               their rank evenly over all nodes
+- component    index of the node's weakly connected component; components
+               are numbered by decreasing size
+
+Usage:
+    from capability_graph import CapabilityGraph
+
+    graph = CapabilityGraph()
+    graph.add_node("agent:architect", "agent", "architect")
+    graph.add_node("skill:skill-coach", "skill", "skill-coach")
+    graph.add_edge("agent:architect", "skill:skill-coach", "uses_skill")
+    metrics = graph.metrics()
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITERATIONS = 100
+PAGERANK_TOLERANCE = 1e-9
+
+# Decimal places kept for serialized PageRank scores
+PAGERANK_PRECISION = 6
+
+
+class CapabilityGraph:
+    """Directed multigraph of typed nodes with adjacency-array storage."""
+
+    def __init__(self):
+        self.nodes: List[Dict[str, Any]] = []
+        self.index: Dict[str, int] = {}
+        self._edges: List[Tuple[int, int, str]] = []
+        self._seen_edges = set()
+        self._csr: Optional[Tuple[List[int], List[int]]] = None
+
+    def add_node(self, node_id: str, node_type: str, label: str, **attrs: Any) -> int:
+        """Add a node (or return the existing one with this id)."""
+        if node_id in self.index:
+            return self.index[node_id]
+        node = {"id": node_id, "type": node_type, "label": label}
+        node.update(attrs)
+        self.index[node_id] = len(self.nodes)
+        self.nodes.append(node)
+        self._csr = None
+        return self.index[node_id]
+
+    def add_edge(self, source: str, target: str, edge_type: str) -> bool:
+        """Add an edge between existing nodes; False if an end is unknown."""
+        if source not in self.index or target not in self.index:
+            return False
+        edge = (self.index[source], self.index[target], edge_type)
+        if edge in self._seen_edges:
+            return True
+        self._seen_edges.add(edge)
+        self._edges.append(edge)
+        self._csr = None
+        return True
+
+    @property
+    def edges(self) -> List[Dict[str, str]]:
+        """Edges in the {from, to, type} form of capability_graph."""
+        return [
+            {"from": self.nodes[s]["id"], "to": self.nodes[t]["id"], "type": edge_type}
+            for s, t, edge_type in self._edges
+        ]
+
+    # -------------------------------------------------------------------------
+    # Adjacency arrays
+    # -------------------------------------------------------------------------
+
+    def adjacency(self) -> Tuple[List[int], List[int]]:
+        """Return (offsets, targets) of the out-edges, built by counting sort."""
+        if self._csr is None:
+            n = len(self.nodes)
+            offsets = [0] * (n + 1)
+            for source, _, _ in self._edges:
+                offsets[source + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+
+            targets = [0] * len(self._edges)
+            fill = offsets[:-1]
+            for source, target, _ in self._edges:
+                targets[fill[source]] = target
+                fill[source] += 1
+            self._csr = (offsets, targets)
+        return self._csr
+
+    def out_degree(self) -> List[int]:
+        offsets, _ = self.adjacency()
+        return [offsets[i + 1] - offsets[i] for i in range(len(self.nodes))]
+
+    def in_degree(self) -> List[int]:
+        degree = [0] * len(self.nodes)
+        for target in self.adjacency()[1]:
+            degree[target] += 1
+        return degree
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def pagerank(self, damping: float = PAGERANK_DAMPING,
+                 max_iterations: int = PAGERANK_MAX_ITERATIONS,
+                 tolerance: float = PAGERANK_TOLERANCE) -> List[float]:
+        """PageRank by power iteration over the adjacency arrays."""
+        n = len(self.nodes)
+        if n == 0:
+            return []
+        offsets, targets = self.adjacency()
+        out_degree = self.out_degree()
+        dangling = [i for i in range(n) if out_degree[i] == 0]
+
+        rank = [1.0 / n] * n
+        for _ in range(max_iterations):
+            dangling_rank = sum(rank[i] for i in dangling)
+            base = (1.0 - damping + damping * dangling_rank) / n
+            new_rank = [base] * n
+            for source in range(n):
+                degree = out_degree[source]
+                if degree:
+                    share = damping * rank[source] / degree
+                    for k in range(offsets[source], offsets[source + 1]):
+                        new_rank[targets[k]] += share
+            change = sum(abs(a - b) for a, b in zip(new_rank, rank))
+            rank = new_rank
+            if change < tolerance:
+                break
+        return rank
+
+    def components(self) -> List[int]:
+        """Weakly connected component of each node, largest component first."""
+        n = len(self.nodes)
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for source, target, _ in self._edges:
+            a, b = find(source), find(target)
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+
+        roots = [find(i) for i in range(n)]
+        sizes: Dict[int, int] = {}
+        for root in roots:
+            sizes[root] = sizes.get(root, 0) + 1
+        order = sorted(sizes, key=lambda r: (-sizes[r], r))
+        number = {root: i for i, root in enumerate(order)}
+        return [number[root] for root in roots]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Adjacency arrays and per-node metrics, aligned with self.nodes."""
+        offsets, targets = self.adjacency()
+        component = self.components()
+        component_sizes = [0] * (max(component) + 1 if component else 0)
+        for c in component:
+            component_sizes[c] += 1
+
+        return {
+            "node_ids": [node["id"] for node in self.nodes],
+            "adjacency": {"offsets": offsets, "targets": targets},
+            "in_degree": self.in_degree(),
+            "out_degree": self.out_degree(),
+            "pagerank": [round(r, PAGERANK_PRECISION) for r in self.pagerank()],
+            "component": component,
+            "component_sizes": component_sizes,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The {nodes, edges} form stored as capability_graph."""
+        return {"nodes": self.nodes, "edges": self.edges}
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Ecosystem Shards - Part of The Forge
+
+Sharded on-disk layout for the ecosystem state written by
+generate_ecosystem_data.py --sharded, so readers can load the summary or
+a single agent/skill without parsing the whole ecosystem:
+
+    ecosystem/
+    ├── manifest.json        # version, summary, tool_usage, shard list
+    ├── index.json           # {"agents": {name: shard}, "skills": {name: shard}}
+    ├── graph.json           # capability_graph + graph_metrics
+    └── shards/
+        ├── agents-00.json   # [{agent record}, ...] sorted by name
+        └── skills-00.json
+
+Entities are assigned to shards by a hash of their name, so adding or
+removing one skill only rewrites its own shard. The shard count is a power
+of two sized for about SHARD_SIZE entities per shard. Shards whose content
+hash matches the previous manifest are not rewritten.
+
+All files are streamed to disk with JSONEncoder.iterencode and replaced
+atomically; manifest.json is written last.
+
+Usage:
+    from ecosystem_shards import EcosystemShards
+
+    shards = EcosystemShards(Path(".claude/data/ecosystem"))
+    summary = shards.manifest()["summary"]
+    skill = shards.get("skills", "skill-coach")
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SHARDS_VERSION = 1
+
+MANIFEST_FILENAME = "manifest.json"
+INDEX_FILENAME = "index.json"
+GRAPH_FILENAME = "graph.json"
+SHARDS_DIRNAME = "shards"
+
+# Sharded entity collections of the ecosystem state
+ENTITY_KINDS = ["agents", "skills"]
+
+# State sections stored in graph.json instead of the manifest
+GRAPH_SECTIONS = ["capability_graph", "graph_metrics"]
+
+# Target number of entities per shard
+SHARD_SIZE = 128
+
+
+def shard_count(entities: int) -> int:
+    """Smallest power of two giving at most SHARD_SIZE entities per shard."""
+    count = 1
+    while count * SHARD_SIZE < entities:
+        count *= 2
+    return count
+
+
+def shard_of(name: str, count: int) -> int:
+    return zlib.crc32(name.encode("utf-8")) % count
+
+
+def write_json(path: Path, value: Any, indent: Optional[int] = None) -> None:
+    """Stream value to path as JSON, replacing the file atomically."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for chunk in json.JSONEncoder(indent=indent, ensure_ascii=False).iterencode(value):
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+def _hash_json(value: Any) -> str:
+    digest = hashlib.sha1()
+    for chunk in json.JSONEncoder(ensure_ascii=False).iterencode(value):
+        digest.update(chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EcosystemShards:
+    """Reads and writes a sharded ecosystem state directory."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.shards_dir = self.root / SHARDS_DIRNAME
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._index: Optional[Dict[str, Dict[str, str]]] = None
+        self._shards: Dict[str, List[Dict[str, Any]]] = {}
+
+    def exists(self) -> bool:
+        return (self.root / MANIFEST_FILENAME).exists()
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def _read(self, path: Path) -> Any:
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def manifest(self) -> Dict[str, Any]:
+        """Summary-level state (everything but entities and the graph)."""
+        if self._manifest is None:
+            self._manifest = self._read(self.root / MANIFEST_FILENAME)
+        return self._manifest
+
+    def index(self) -> Dict[str, Dict[str, str]]:
+        if self._index is None:
+            self._index = self._read(self.root / INDEX_FILENAME)
+        return self._index
+
+    def shard(self, filename: str) -> List[Dict[str, Any]]:
+        if filename not in self._shards:
+            self._shards[filename] = self._read(self.shards_dir / filename)
+        return self._shards[filename]
+
+    def get(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        """One agent or skill record; reads the index and a single shard."""
+        filename = self.index().get(kind, {}).get(name)
+        if filename is None:
+            return None
+        for entity in self.shard(filename):
+            if entity["name"] == name:
+                return entity
+        return None
+
+    def iter_entities(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """All records of a kind, sorted by name."""
+        entities = []
+        for filename in self.manifest()["shards"].get(kind, {}):
+            entities.extend(self._read(self.shards_dir / filename))
+        # Shards are hash buckets, so restore name order across them
+        yield from sorted(entities, key=lambda e: e["name"])
+
+    def graph(self) -> Dict[str, Any]:
+        return self._read(self.root / GRAPH_FILENAME)
+
+    def load_state(self) -> Dict[str, Any]:
+        """Reassemble the full ecosystem state."""
+        manifest = self.manifest()
+        state = {key: value for key, value in manifest.items() if key not in ("shards", "shards_version")}
+        for kind in ENTITY_KINDS:
+            state[kind] = list(self.iter_entities(kind))
+        state.update(self.graph())
+        return state
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def write(self, state: Dict[str, Any], indent: Optional[int] = None) -> Dict[str, int]:
+        """
+        Write state as shards. Returns {"written": n, "unchanged": n}
+        counted over shard files.
+        """
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            previous = self._read(self.root / MANIFEST_FILENAME).get("shards", {})
+        except (OSError, json.JSONDecodeError):
+            previous = {}
+
+        stats = {"written": 0, "unchanged": 0}
+        shards: Dict[str, Dict[str, str]] = {}
+        index: Dict[str, Dict[str, str]] = {}
+
+        for kind in ENTITY_KINDS:
+            entities = state.get(kind, [])
+            count = shard_count(len(entities))
+            buckets: List[List[Dict[str, Any]]] = [[] for _ in range(count)]
+            for entity in entities:
+                buckets[shard_of(entity["name"], count)].append(entity)
+
+            width = max(2, len(str(count - 1)))
+            shards[kind] = {}
+            index[kind] = {}
+            for number, bucket in enumerate(buckets):
+                filename = f"{kind}-{number:0{width}d}.json"
+                bucket.sort(key=lambda e: e["name"])
+                digest = _hash_json(bucket)
+                if previous.get(kind, {}).get(filename) == digest and (self.shards_dir / filename).exists():
+                    stats["unchanged"] += 1
+                else:
+                    write_json(self.shards_dir / filename, bucket, indent)
+                    stats["written"] += 1
+                shards[kind][filename] = digest
+                for entity in bucket:
+                    index[kind][entity["name"]] = filename
+
+        write_json(self.root / INDEX_FILENAME, index)
+        write_json(self.root / GRAPH_FILENAME, {key: state[key] for key in GRAPH_SECTIONS if key in state}, indent)
+
+        manifest = {
+            key: value for key, value in state.items()
+            if key not in ENTITY_KINDS and key not in GRAPH_SECTIONS
+        }
+        manifest["shards_version"] = SHARDS_VERSION
+        manifest["shards"] = shards
+        write_json(self.root / MANIFEST_FILENAME, manifest, indent)
+
+        # Remove shards left over from a different shard count
+        current = {filename for kind_shards in shards.values() for filename in kind_shards}
+        for path in self.shards_dir.glob("*.json"):
+            if path.name not in current:
+                path.unlink()
+
+        self._manifest, self._index, self._shards = manifest, index, {}
+        return stats
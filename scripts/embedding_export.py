@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Binary Embedding Export
+=======================
+
+Compact, memory-mappable export of the embeddings built by
+build_embeddings.py, for consumers that should not parse megabytes of JSON
+(or open ChromaDB) at startup.
+
+File layout (all integers little-endian, sections 64-byte aligned):
+
+    header      64 bytes, see HEADER_FORMAT
+                magic "SKEMB\\0\\0\\0", version, dtype, count, dim,
+                vectors_offset, scales_offset, rows_offset, info_offset
+    vectors     count x dim matrix, row-major
+                float32, or int8 with one float32 scale per row
+    scales      count x float32 (int8 only): row = int8 values * scale
+    rows        (count + 1) x uint64 offsets into the row blob, followed
+                by the blob: one UTF-8 JSON object per row
+                {"id", "document", "metadata"}
+    info        UTF-8 JSON {"model", "collection", "created_at", ...}
+
+Row i's vector starts at vectors_offset + i * dim * itemsize, and its
+metadata is blob[offsets[i]:offsets[i + 1]], so a reader can fetch a
+single row without decoding the rest. The file is written to a temporary
+path and renamed into place.
+
+Usage:
+    from embedding_export import EmbeddingExport, write_export
+
+    write_export(path, ids, vectors, documents, metadatas, info={"model": ...})
+    with EmbeddingExport(path) as export:
+        vector, row = export.vector(0), export.row(0)
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+MAGIC = b"SKEMB\0\0\0"
+FORMAT_VERSION = 1
+
+DTYPE_FLOAT32 = 0
+DTYPE_INT8 = 1
+DTYPES = {"float32": DTYPE_FLOAT32, "int8": DTYPE_INT8}
+ITEM_SIZE = {DTYPE_FLOAT32: 4, DTYPE_INT8: 1}
+
+# magic, version, dtype, count, dim, then four section offsets
+HEADER_FORMAT = "<8sIIII4Q"
+HEADER_SIZE = 64
+ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def quantize_row(row: Sequence[float]) -> Tuple[array, float]:
+    """Symmetric int8 quantization: returns (values, scale)."""
+    peak = max((abs(x) for x in row), default=0.0)
+    scale = peak / 127.0 if peak else 1.0
+    return array("b", (max(-127, min(127, round(x / scale))) for x in row)), scale
+
+
+def write_export(
+    path: Path,
+    ids: Sequence[str],
+    vectors: Iterable[Sequence[float]],
+    documents: Optional[Sequence[Optional[str]]] = None,
+    metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    info: Optional[Dict[str, Any]] = None,
+    dtype: str = "float32",
+) -> Dict[str, int]:
+    """
+    Write an export atomically. vectors may be any iterable of rows
+    (lists, arrays or numpy rows). Returns {"count", "dim", "bytes"}.
+    """
+    path = Path(path)
+    code = DTYPES[dtype]
+    count = len(ids)
+
+    matrix = array("f")
+    quantized = array("b")
+    scales = array("f")
+    dim = 0
+    rows_seen = 0
+    for row in vectors:
+        row = [float(x) for x in row]
+        if rows_seen == 0:
+            dim = len(row)
+        elif len(row) != dim:
+            raise ValueError(f"Row {rows_seen} has dimension {len(row)}, expected {dim}")
+        if code == DTYPE_INT8:
+            values, scale = quantize_row(row)
+            quantized.extend(values)
+            scales.append(scale)
+        else:
+            matrix.extend(row)
+        rows_seen += 1
+    if rows_seen != count:
+        raise ValueError(f"Got {rows_seen} vectors for {count} ids")
+
+    blob = bytearray()
+    offsets = array("Q", [0])
+    for i, row_id in enumerate(ids):
+        blob += json.dumps({
+            "id": row_id,
+            "document": documents[i] if documents else None,
+            "metadata": metadatas[i] if metadatas else None,
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        offsets.append(len(blob))
+
+    vectors_bytes = _little_endian(quantized if code == DTYPE_INT8 else matrix)
+    vectors_offset = HEADER_SIZE
+    scales_offset = _align(vectors_offset + len(vectors_bytes)) if code == DTYPE_INT8 else 0
+    rows_offset = _align((scales_offset + 4 * count) if scales_offset else vectors_offset + len(vectors_bytes))
+    info_offset = _align(rows_offset + 8 * (count + 1) + len(blob))
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, code, count, dim,
+                         vectors_offset, scales_offset, rows_offset, info_offset)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        def write_at(offset: int, data: bytes) -> None:
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(data)
+
+        write_at(0, header.ljust(HEADER_SIZE, b"\0"))
+        write_at(vectors_offset, vectors_bytes)
+        if scales_offset:
+            write_at(scales_offset, _little_endian(scales))
+        write_at(rows_offset, _little_endian(offsets) + bytes(blob))
+        write_at(info_offset, json.dumps(info or {}, ensure_ascii=False).encode("utf-8"))
+        size = f.tell()
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    return {"count": count, "dim": dim, "bytes": size}
+
+
+class EmbeddingExport:
+    """Memory-mapped reader for an export written by write_export()."""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.dtype, self.count, self.dim, self.vectors_offset,
+         self.scales_offset, self.rows_offset, self.info_offset) = struct.unpack_from(HEADER_FORMAT, self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an embedding export")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported embedding export version {version}")
+        self._blob_offset = self.rows_offset + 8 * (self.count + 1)
+
+    def __enter__(self) -> "EmbeddingExport":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def info(self) -> Dict[str, Any]:
+        return json.loads(bytes(self._map[self.info_offset:]).decode("utf-8"))
+
+    def _row_bytes(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<2Q", self._map, self.rows_offset + 8 * i)
+        return self._map[self._blob_offset + start:self._blob_offset + end]
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """{"id", "document", "metadata"} of row i."""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return json.loads(self._row_bytes(i).decode("utf-8"))
+
+    def vector(self, i: int) -> List[float]:
+        """Row i of the matrix as floats (dequantized for int8)."""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        start = self.vectors_offset + i * self.dim * ITEM_SIZE[self.dtype]
+        if self.dtype == DTYPE_INT8:
+            (scale,) = struct.unpack_from("<f", self._map, self.scales_offset + 4 * i)
+            return [v * scale for v in struct.unpack_from(f"<{self.dim}b", self._map, start)]
+        return list(struct.unpack_from(f"<{self.dim}f", self._map, start))
+
+    def matrix_buffer(self) -> memoryview:
+        """The raw vector matrix, e.g. for numpy.frombuffer(..., "<f4")."""
+        size = self.count * self.dim * ITEM_SIZE[self.dtype]
+        return memoryview(self._map)[self.vectors_offset:self.vectors_offset + size]
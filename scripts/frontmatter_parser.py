@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Parser
+
+Shared YAML frontmatter parsing for SKILL.md and AGENT.md files.
+Used by the validators, the ecosystem generator, the embeddings pipeline
+and the skill ingester so that every script agrees on what a frontmatter
+block is.
+
+- The closing delimiter is located with str.find() from the end of the
+  opening line, so the document body is never split or copied line by line.
+- YAML is loaded with libyaml's CSafeLoader when PyYAML was built with it,
+  falling back to the pure-Python SafeLoader otherwise.
+- Parsed blocks are cached by content hash, so scripts that look at the
+  same file several times (or several scripts in one process) only pay
+  for YAML parsing once.
+
+Usage:
+    from frontmatter_parser import parse_frontmatter
+
+    frontmatter, body = parse_frontmatter(content)
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    HAS_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+    HAS_LIBYAML = False
+
+DELIMITER = "---"
+
+# Maximum number of parsed frontmatter blocks kept in memory
+CACHE_SIZE = 4096
+
+_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """
+    Split a markdown document into its frontmatter text and body.
+
+    Returns (None, content) when the document has no complete frontmatter
+    block. Only the opening line and the closing delimiter are inspected.
+    """
+    if not content.startswith(DELIMITER):
+        return None, content
+
+    first_newline = content.find("\n")
+    if first_newline == -1 or content[len(DELIMITER):first_newline].strip():
+        return None, content
+
+    closing = _find_closing_delimiter(content, first_newline)
+    if closing is None:
+        return None, content
+
+    start, end = closing
+    return content[first_newline + 1:start], content[end:]
+
+
+def _find_closing_delimiter(content: str, pos: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the next line consisting only of '---' after offset pos (a newline).
+
+    Returns (start, end) where start is the first character of the delimiter
+    line and end is the first character after its line break.
+    """
+    marker = "\n" + DELIMITER
+    while True:
+        pos = content.find(marker, pos)
+        if pos == -1:
+            return None
+
+        start = pos + 1
+        line_end = content.find("\n", start)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[start + len(DELIMITER):line_end].strip():
+            return start, min(line_end + 1, len(content))
+
+        pos = line_end
+
+
+def content_hash(text: str) -> bytes:
+    """Hash used as the cache key for a frontmatter block."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def load_yaml(frontmatter: str) -> Dict[str, Any]:
+    """
+    Load a frontmatter block as a YAML mapping.
+
+    Raises yaml.YAMLError for invalid YAML. Non-mapping documents load as an
+    empty dict. The returned dict is a shallow copy of the cached value, so
+    callers may add or replace keys but should not mutate nested values.
+    """
+    key = content_hash(frontmatter)
+    cached = _cache.get(key)
+    if cached is not None:
+        _cache.move_to_end(key)
+        return dict(cached)
+
+    data = yaml.load(frontmatter, Loader=SafeLoader)
+    if not isinstance(data, dict):
+        data = {}
+
+    _cache[key] = data
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+    return dict(data)
+
+
+def parse_simple(frontmatter: str) -> Dict[str, str]:
+    """
+    Line-based fallback for frontmatter that is not valid YAML.
+
+    Only top-level 'key: value' lines are read; values are kept as strings.
+    """
+    result = {}
+    for line in frontmatter.splitlines():
+        if ":" in line and not line.startswith((" ", "\t", "-")):
+            key, value = line.split(":", 1)
+            result[key.strip()] = value.strip()
+    return result
+
+
+def parse_frontmatter(content: str, lenient: bool = False) -> Tuple[Dict[str, Any], str]:
+    """
+    Parse YAML frontmatter from markdown content.
+
+    Returns (frontmatter, body). Documents without frontmatter return
+    ({}, content). Invalid YAML also returns ({}, content), unless lenient
+    is set, in which case top-level keys are recovered with parse_simple().
+    """
+    frontmatter, body = split_frontmatter(content)
+    if frontmatter is None:
+        return {}, content
+
+    try:
+        return load_yaml(frontmatter), body
+    except yaml.YAMLError:
+        if lenient:
+            return parse_simple(frontmatter), body
+        return {}, content
+
+
+def clear_cache() -> None:
+    """Drop all cached frontmatter blocks."""
+    _cache.clear()
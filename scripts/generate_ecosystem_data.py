@@ -6,21 +6,54 @@ Generates ecosystem-state.json containing:
 - Agent metadata and relationships
 - Skill inventory and categorization
 - Tool usage statistics
-- Capability graph data
+- Capability graph of agents, skills and tools, with precomputed
+  adjacency arrays, degree, PageRank and connected components
+  ("graph_metrics", see capability_graph.py)
 - Timestamp for tracking changes
 
+Regeneration is incremental: the previous output is loaded and only agent
+and skill files whose size/mtime (or, failing that, content hash) changed
+are re-parsed. tool_usage and skill_categories are patched with the
+changed records, and the capability graph is reused unless a change
+touches graph fields (names, tools, coordination, "Use with" links).
+File stats are cached in .cache/ecosystem/sources.json; use --full to
+rebuild from scratch.
+
+With --sharded the state is written as a directory of small files (summary
+manifest, name index, per-entity shards; see ecosystem_shards.py) so
+readers can load one skill or the summary on its own.
+
 Usage:
-    python scripts/generate_ecosystem_data.py [--output PATH]
+    python scripts/generate_ecosystem_data.py [--output PATH] [--full]
+    python scripts/generate_ecosystem_data.py --sharded [--output DIR]
 
-Output goes to .claude/data/ecosystem-state.json by default.
+Output goes to .claude/data/ecosystem-state.json by default, or
+.claude/data/ecosystem/ with --sharded.
 """
 
 import json
-import yaml
+import hashlib
+import os
+import re
 import argparse
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
+
+from capability_graph import CapabilityGraph
+from ecosystem_shards import EcosystemShards, write_json
+from frontmatter_parser import parse_frontmatter
+
+# "**Use with**: skill-a (why) | skill-b (why)" lines in skill bodies
+USE_WITH_RE = re.compile(r'\*\*Use with\*\*:\s*(.+)')
+SKILL_REF_RE = re.compile(r'([a-z][a-z0-9-]+)')
+
+STATE_VERSION = "1.0.0"
+SOURCE_CACHE_VERSION = 1
+
+# Record fields that feed build_capability_graph()
+GRAPH_FIELDS = ["name", "role", "category", "tools", "coordinates_with", "use_with"]
 
 
 def find_project_root() -> Path:
@@ -33,26 +66,52 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
-def parse_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
-    """Parse YAML frontmatter from markdown content."""
-    if not content.startswith("---"):
-        return {}, content
+def content_hash(content: str) -> str:
+    """Fingerprint of a source file, used for change detection."""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
 
-    try:
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            body = parts[2].strip()
-            return frontmatter, body
-    except yaml.YAMLError:
-        pass
 
-    return {}, content
+class SourceReader:
+    """
+    Reads agent and skill files, reusing records of unchanged files.
+
+    A previous record is reused when the file's size and mtime match the
+    stat cache, or when its content hash is unchanged.
+    """
 
+    def __init__(self, project_root: Path, previous: Optional[Dict[str, Dict]] = None,
+                 stat_cache: Optional[Dict[str, Dict]] = None):
+        self.project_root = project_root
+        self.previous = previous or {}
+        self.stat_cache = stat_cache or {}
+        self.new_stat_cache: Dict[str, Dict] = {}
+        self.parsed = 0
+        self.reused = 0
 
-def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
+    def read(self, path: Path, parse: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        rel = str(path.relative_to(self.project_root))
+        st = path.stat()
+        self.new_stat_cache[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+        previous = self.previous.get(rel)
+        known = self.stat_cache.get(rel)
+        if previous and known and known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+            self.reused += 1
+            return previous
+
+        content = path.read_text(encoding="utf-8")
+        if previous and previous.get("content_hash") == content_hash(content):
+            self.reused += 1
+            return previous
+
+        self.parsed += 1
+        return parse(content)
+
+
+def load_agents(agents_dir: Path, reader: Optional[SourceReader] = None) -> List[Dict[str, Any]]:
     """Load all agent definitions from both flat and directory formats."""
     agents = []
+    reader = reader or SourceReader(agents_dir.parent.parent)
 
     if not agents_dir.exists():
         return agents
@@ -68,17 +127,19 @@ def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
         if dir_version.exists():
             continue
 
-        content = md_file.read_text(encoding="utf-8")
-        frontmatter, body = parse_frontmatter(content)
+        def parse_flat(content: str, md_file: Path = md_file) -> Dict[str, Any]:
+            frontmatter, body = parse_frontmatter(content)
+            return {
+                "name": frontmatter.get("name", md_file.stem),
+                "description": frontmatter.get("description", ""),
+                "tools": parse_tools(frontmatter.get("tools")),
+                "model": frontmatter.get("model"),
+                "format": "flat",
+                "path": str(md_file.relative_to(agents_dir.parent.parent)),
+                "content_hash": content_hash(content),
+            }
 
-        agents.append({
-            "name": frontmatter.get("name", md_file.stem),
-            "description": frontmatter.get("description", ""),
-            "tools": parse_tools(frontmatter.get("tools")),
-            "model": frontmatter.get("model"),
-            "format": "flat",
-            "path": str(md_file.relative_to(agents_dir.parent.parent)),
-        })
+        agents.append(reader.read(md_file, parse_flat))
 
     # Load directory format agents (*/AGENT.md)
     for subdir in agents_dir.iterdir():
@@ -89,27 +150,30 @@ def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
         if not agent_md.exists():
             continue
 
-        content = agent_md.read_text(encoding="utf-8")
-        frontmatter, body = parse_frontmatter(content)
-
-        agents.append({
-            "name": frontmatter.get("name", subdir.name),
-            "role": frontmatter.get("role"),
-            "description": extract_description(body),
-            "tools": parse_tools(frontmatter.get("allowed-tools")),
-            "triggers": frontmatter.get("triggers", []),
-            "coordinates_with": frontmatter.get("coordinates_with", []),
-            "outputs": frontmatter.get("outputs", []),
-            "format": "directory",
-            "path": str(agent_md.relative_to(agents_dir.parent.parent)),
-        })
+        def parse_directory(content: str, agent_md: Path = agent_md) -> Dict[str, Any]:
+            frontmatter, body = parse_frontmatter(content)
+            return {
+                "name": frontmatter.get("name", agent_md.parent.name),
+                "role": frontmatter.get("role"),
+                "description": extract_description(body),
+                "tools": parse_tools(frontmatter.get("allowed-tools")),
+                "triggers": frontmatter.get("triggers", []),
+                "coordinates_with": frontmatter.get("coordinates_with", []),
+                "outputs": frontmatter.get("outputs", []),
+                "format": "directory",
+                "path": str(agent_md.relative_to(agents_dir.parent.parent)),
+                "content_hash": content_hash(content),
+            }
+
+        agents.append(reader.read(agent_md, parse_directory))
 
     return sorted(agents, key=lambda a: a["name"])
 
 
-def load_skills(skills_dir: Path) -> List[Dict[str, Any]]:
+def load_skills(skills_dir: Path, reader: Optional[SourceReader] = None) -> List[Dict[str, Any]]:
     """Load all skill definitions."""
     skills = []
+    reader = reader or SourceReader(skills_dir.parent.parent)
 
     if not skills_dir.exists():
         return skills
@@ -126,22 +190,52 @@ def load_skills(skills_dir: Path) -> List[Dict[str, Any]]:
         if not skill_md.exists():
             continue
 
-        content = skill_md.read_text(encoding="utf-8")
-        frontmatter, body = parse_frontmatter(content)
-
-        skills.append({
-            "name": frontmatter.get("name", subdir.name),
-            "description": frontmatter.get("description", ""),
-            "category": frontmatter.get("category"),
-            "tools": parse_tools(frontmatter.get("tools")),
+        def parse_skill(content: str, skill_md: Path = skill_md) -> Dict[str, Any]:
+            frontmatter, body = parse_frontmatter(content)
+            return {
+                "name": frontmatter.get("name", skill_md.parent.name),
+                "description": frontmatter.get("description", ""),
+                "category": frontmatter.get("category"),
+                "tools": parse_tools(frontmatter.get("allowed-tools") or frontmatter.get("tools")),
+                "use_with": extract_use_with(body),
+                "has_references": False,
+                "has_examples": False,
+                "path": str(skill_md.relative_to(skills_dir.parent.parent)),
+                "content_hash": content_hash(content),
+            }
+
+        skill = reader.read(skill_md, parse_skill)
+        # Directory flags are not part of the file, so always re-check them
+        flags = {
             "has_references": (subdir / "references").exists(),
             "has_examples": (subdir / "examples").exists(),
-            "path": str(skill_md.relative_to(skills_dir.parent.parent)),
-        })
+        }
+        if any(skill[key] != value for key, value in flags.items()):
+            skill = dict(skill, **flags)
+        skills.append(skill)
 
     return sorted(skills, key=lambda s: s["name"])
 
 
+def split_tools(tools: str) -> List[str]:
+    """Split a comma-separated tool list, keeping "Bash(git:*,npm:*)" whole."""
+    parts = []
+    depth = 0
+    current = []
+    for char in tools:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif char == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [p for p in parts if p]
+
+
 def parse_tools(tools: Any) -> List[str]:
     """Parse tools from various formats."""
     if not tools:
@@ -149,10 +243,29 @@ def parse_tools(tools: Any) -> List[str]:
     if isinstance(tools, list):
         return tools
     if isinstance(tools, str):
-        return [t.strip() for t in tools.split(",")]
+        return split_tools(tools)
     return []
 
 
+def tool_base_name(tool: str) -> str:
+    """Tool name without its argument pattern: "Bash(git:*)" -> "Bash"."""
+    return tool.split("(", 1)[0].strip()
+
+
+def extract_use_with(body: str) -> List[str]:
+    """Skill names referenced on a "**Use with**:" line (unresolved)."""
+    match = USE_WITH_RE.search(body)
+    if not match:
+        return []
+    # Drop the parenthesized explanations before picking out names
+    line = re.sub(r"\([^)]*\)", " ", match.group(1))
+    refs = []
+    for ref in SKILL_REF_RE.findall(line):
+        if ref not in refs:
+            refs.append(ref)
+    return refs
+
+
 def extract_description(body: str) -> str:
     """Extract first paragraph as description from markdown body."""
     lines = body.strip().split("\n")
@@ -186,48 +299,129 @@ def calculate_tool_usage(agents: List[Dict], skills: List[Dict]) -> Dict[str, in
     return dict(sorted(usage.items(), key=lambda x: x[1], reverse=True))
 
 
-def build_capability_graph(agents: List[Dict], skills: List[Dict]) -> Dict[str, Any]:
-    """Build a capability graph showing relationships."""
-    nodes = []
-    edges = []
+def build_capability_graph(agents: List[Dict], skills: List[Dict]) -> CapabilityGraph:
+    """
+    Build one graph of agents, skills and the tools they use.
+
+    Edges: agent -coordinates_with-> agent, skill -use_with-> skill and
+    agent/skill -uses_tool-> tool. References to unknown agents or skills
+    are dropped.
+    """
+    graph = CapabilityGraph()
+
+    for agent in agents:
+        graph.add_node(f"agent:{agent['name']}", "agent", agent["name"], role=agent.get("role"))
+    for skill in skills:
+        graph.add_node(f"skill:{skill['name']}", "skill", skill["name"], category=skill.get("category"))
+
+    for kind, entities in (("agent", agents), ("skill", skills)):
+        for entity in entities:
+            for tool in entity.get("tools", []):
+                name = tool_base_name(tool)
+                if name:
+                    graph.add_node(f"tool:{name}", "tool", name)
+                    graph.add_edge(f"{kind}:{entity['name']}", f"tool:{name}", "uses_tool")
 
-    # Add agent nodes
     for agent in agents:
-        nodes.append({
-            "id": f"agent:{agent['name']}",
-            "type": "agent",
-            "label": agent["name"],
-            "role": agent.get("role"),
-        })
-
-        # Add coordination edges
         for other in agent.get("coordinates_with", []):
-            edges.append({
-                "from": f"agent:{agent['name']}",
-                "to": f"agent:{other}",
-                "type": "coordinates_with",
-            })
+            graph.add_edge(f"agent:{agent['name']}", f"agent:{other}", "coordinates_with")
 
-    # Add skill nodes
     for skill in skills:
-        nodes.append({
-            "id": f"skill:{skill['name']}",
-            "type": "skill",
-            "label": skill["name"],
-            "category": skill.get("category"),
-        })
+        for ref in skill.get("use_with", []):
+            if ref != skill["name"]:
+                graph.add_edge(f"skill:{skill['name']}", f"skill:{ref}", "use_with")
+
+    return graph
+
 
-    return {"nodes": nodes, "edges": edges}
+def count_categories(skills: Iterable[Dict]) -> Counter:
+    return Counter(skill.get("category") or "uncategorized" for skill in skills)
 
 
-def generate_ecosystem_state(project_root: Path) -> Dict[str, Any]:
-    """Generate the complete ecosystem state."""
+def count_tools(entities: Iterable[Dict]) -> Counter:
+    return Counter(tool for entity in entities for tool in entity.get("tools", []))
+
+
+def patch_counts(counts: Dict[str, int], removed: Counter, added: Counter) -> Counter:
+    """Apply removed/added counts to a previous count table."""
+    patched = Counter(counts)
+    patched.subtract(removed)
+    patched.update(added)
+    return Counter({key: n for key, n in patched.items() if n > 0})
+
+
+def graph_fields(entity: Dict[str, Any]) -> Tuple:
+    return tuple(json.dumps(entity.get(field), sort_keys=True) for field in GRAPH_FIELDS)
+
+
+def diff_records(previous: List[Dict], current: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Records only in previous (removed or old versions) and only in current."""
+    old = {r["path"]: r for r in previous}
+    new = {r["path"]: r for r in current}
+    removed = [r for path, r in old.items() if path not in new or (new[path] is not r and new[path] != r)]
+    added = [r for path, r in new.items() if path not in old or (old[path] is not r and old[path] != r)]
+    return removed, added
+
+
+def load_previous_state(output_path: Path, project_root: Path) -> Optional[Dict[str, Any]]:
+    """The previous output, if it was generated by this version for this project."""
+    try:
+        if output_path.is_dir():
+            state = EcosystemShards(output_path).load_state()
+        else:
+            state = json.loads(output_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError, KeyError):
+        return None
+    if state.get("version") != STATE_VERSION or state.get("project_root") != str(project_root):
+        return None
+    if "graph_metrics" not in state:
+        return None
+    return state
+
+
+def load_stat_cache(cache_path: Path, output_path: Path) -> Dict[str, Dict]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != SOURCE_CACHE_VERSION or data.get("output") != str(output_path):
+        return {}
+    return data.get("files", {})
+
+
+def save_stat_cache(cache_path: Path, output_path: Path, files: Dict[str, Dict]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps({"version": SOURCE_CACHE_VERSION, "output": str(output_path), "files": files}),
+        encoding="utf-8"
+    )
+    os.replace(tmp_path, cache_path)
+
+
+def generate_ecosystem_state(
+    project_root: Path,
+    previous: Optional[Dict[str, Any]] = None,
+    reader: Optional[SourceReader] = None
+) -> Dict[str, Any]:
+    """
+    Generate the complete ecosystem state.
+
+    With a previous state (see load_previous_state()), unchanged records
+    are reused and derived sections are patched. Returns previous itself
+    when nothing changed.
+    """
     claude_dir = project_root / ".claude"
     agents_dir = claude_dir / "agents"
     skills_dir = claude_dir / "skills"
 
-    agents = load_agents(agents_dir)
-    skills = load_skills(skills_dir)
+    if reader is None:
+        reader = SourceReader(project_root)
+    if previous is not None:
+        reader.previous = {r["path"]: r for kind in ("agents", "skills") for r in previous.get(kind, [])}
+
+    agents = load_agents(agents_dir, reader)
+    skills = load_skills(skills_dir, reader)
 
     # Calculate statistics
     agents_by_format = {
@@ -235,29 +429,52 @@ def generate_ecosystem_state(project_root: Path) -> Dict[str, Any]:
         "directory": len([a for a in agents if a["format"] == "directory"]),
     }
 
-    skill_categories: Dict[str, int] = {}
-    for skill in skills:
-        cat = skill.get("category") or "uncategorized"
-        skill_categories[cat] = skill_categories.get(cat, 0) + 1
-
-    tool_usage = calculate_tool_usage(agents, skills)
-    capability_graph = build_capability_graph(agents, skills)
+    if previous is None:
+        skill_categories = count_categories(skills)
+        tool_usage = calculate_tool_usage(agents, skills)
+        graph = build_capability_graph(agents, skills)
+        capability_graph, graph_metrics = graph.to_dict(), graph.metrics()
+    else:
+        agents_removed, agents_added = diff_records(previous["agents"], agents)
+        skills_removed, skills_added = diff_records(previous["skills"], skills)
+        if not (agents_removed or agents_added or skills_removed or skills_added):
+            return previous
+
+        skill_categories = patch_counts(
+            previous["summary"]["skill_categories"],
+            count_categories(skills_removed), count_categories(skills_added)
+        )
+        usage = patch_counts(
+            previous["tool_usage"],
+            count_tools(agents_removed + skills_removed), count_tools(agents_added + skills_added)
+        )
+        tool_usage = dict(sorted(usage.items(), key=lambda x: x[1], reverse=True))
+
+        # The graph (and its global metrics) only changes if graph fields do
+        old_fields = sorted(graph_fields(r) for r in agents_removed + skills_removed)
+        new_fields = sorted(graph_fields(r) for r in agents_added + skills_added)
+        if old_fields == new_fields:
+            capability_graph, graph_metrics = previous["capability_graph"], previous["graph_metrics"]
+        else:
+            graph = build_capability_graph(agents, skills)
+            capability_graph, graph_metrics = graph.to_dict(), graph.metrics()
 
     return {
-        "version": "1.0.0",
+        "version": STATE_VERSION,
         "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "project_root": str(project_root),
         "summary": {
             "total_agents": len(agents),
             "total_skills": len(skills),
             "agents_by_format": agents_by_format,
-            "skill_categories": skill_categories,
+            "skill_categories": dict(skill_categories),
             "unique_tools": len(tool_usage),
         },
         "agents": agents,
         "skills": skills,
         "tool_usage": tool_usage,
         "capability_graph": capability_graph,
+        "graph_metrics": graph_metrics,
     }
 
 
@@ -279,6 +496,16 @@ def main():
         action="store_true",
         help="Compact JSON output"
     )
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="Write a sharded state directory (default: .claude/data/ecosystem/)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the previous output and re-parse every file"
+    )
     args = parser.parse_args()
 
     project_root = find_project_root()
@@ -289,24 +516,38 @@ def main():
     else:
         data_dir = project_root / ".claude" / "data"
         data_dir.mkdir(parents=True, exist_ok=True)
-        output_path = data_dir / "ecosystem-state.json"
+        output_path = data_dir / ("ecosystem" if args.sharded else "ecosystem-state.json")
 
-    # Generate state
-    state = generate_ecosystem_state(project_root)
+    # Generate state, reusing the previous output where files are unchanged
+    cache_path = project_root / ".cache" / "ecosystem" / "sources.json"
+    previous = None if args.full else load_previous_state(output_path, project_root)
+    stat_cache = load_stat_cache(cache_path, output_path) if previous else {}
+    reader = SourceReader(project_root, stat_cache=stat_cache)
+    state = generate_ecosystem_state(project_root, previous, reader)
 
-    # Write output
-    indent = None if args.compact else 2
-    output_path.write_text(
-        json.dumps(state, indent=indent, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    if state is previous:
+        print(f"✅ Ecosystem state up to date: {output_path}")
+    else:
+        # Write output (streamed, not built as one string)
+        indent = None if args.compact else 2
+        if args.sharded:
+            stats = EcosystemShards(output_path).write(state, indent)
+            print(f"✅ Ecosystem state generated: {output_path}/ "
+                  f"({stats['written']} shard(s) written, {stats['unchanged']} unchanged)")
+        else:
+            write_json(output_path, state, indent)
+            print(f"✅ Ecosystem state generated: {output_path}")
+    save_stat_cache(cache_path, output_path, reader.new_stat_cache)
 
     # Print summary
     summary = state["summary"]
-    print(f"✅ Ecosystem state generated: {output_path}")
+    print(f"   📄 {reader.parsed} file(s) parsed, {reader.reused} unchanged")
     print(f"   📊 {summary['total_agents']} agents, {summary['total_skills']} skills")
     print(f"   🔧 {summary['unique_tools']} unique tools in use")
     print(f"   📁 {summary['agents_by_format']['flat']} flat, {summary['agents_by_format']['directory']} directory format")
+    metrics = state["graph_metrics"]
+    print(f"   🕸️  {len(metrics['node_ids'])} graph nodes, {len(metrics['adjacency']['targets'])} edges, "
+          f"{len(metrics['component_sizes'])} components")
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@ from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional
 
+from snapshot_index import load_index, entries_since
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .claude directory."""
@@ -27,39 +29,49 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
-def load_snapshots(snapshots_dir: Path, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
-    """Load all snapshots since a given date."""
-    if not snapshots_dir.exists():
-        return []
+def load_snapshots(
+    snapshots_dir: Path,
+    since: Optional[datetime] = None,
+    include_data: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Load snapshots since a given date.
 
+    Snapshots are selected through the snapshot index, so only files inside
+    the window are opened. Each result carries the index "summary" and
+    "changes"; the full snapshot document is added under "data" unless
+    include_data is False.
+    """
     snapshots = []
-    for json_file in sorted(snapshots_dir.glob("*.json")):
-        try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-
-            # Parse timestamp
-            ts_str = data.get("timestamp", "")
-            if ts_str:
-                # Handle both formats: "2024-12-07 18:00 UTC" and ISO format
-                try:
-                    ts = datetime.strptime(ts_str, "%Y-%m-%d %H:%M UTC")
-                except ValueError:
-                    ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-
-                # Filter by date if specified
-                if since and ts < since:
-                    continue
-
-            snapshots.append({
-                "file": json_file.name,
-                "data": data
-            })
-        except (json.JSONDecodeError, OSError, ValueError):
-            continue
+    for entry in entries_since(load_index(snapshots_dir), since):
+        snapshot = dict(entry)
+        if include_data:
+            try:
+                snapshot["data"] = json.loads(
+                    (snapshots_dir / entry["file"]).read_text(encoding="utf-8")
+                )
+            except (json.JSONDecodeError, OSError):
+                continue
+        snapshots.append(snapshot)
 
     return snapshots
 
 
+def snapshot_summary(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary counts of a snapshot, from the index entry when available."""
+    if "summary" in snapshot:
+        return snapshot["summary"]
+    data = snapshot["data"]
+    return (data.get("state") or data["meta"])["summary"]
+
+
+def snapshot_changes(snapshot: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Delta name lists of a snapshot, from the index entry when available."""
+    if "changes" in snapshot:
+        return snapshot["changes"]
+    return snapshot["data"].get("delta", {})
+
+
 def calculate_trends(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate trends from snapshot series."""
     if len(snapshots) < 2:
@@ -68,8 +80,8 @@ def calculate_trends(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
             "message": "Need at least 2 snapshots for trend analysis"
         }
 
-    first = snapshots[0]["data"]["state"]["summary"]
-    last = snapshots[-1]["data"]["state"]["summary"]
+    first = snapshot_summary(snapshots[0])
+    last = snapshot_summary(snapshots[-1])
 
     return {
         "has_trends": True,
@@ -98,7 +110,7 @@ def collect_changes(snapshots: List[Dict[str, Any]]) -> Dict[str, List[str]]:
     all_changed_skills = []
 
     for snapshot in snapshots:
-        delta = snapshot["data"].get("delta", {})
+        delta = snapshot_changes(snapshot)
 
         all_new_skills.extend(delta.get("new_skills", []))
         all_new_agents.extend(delta.get("new_agents", []))
@@ -346,8 +358,8 @@ def main():
         since = datetime.now(timezone.utc) - timedelta(days=30)
         report_type = "monthly"
 
-    # Load snapshots
-    snapshots = load_snapshots(snapshots_dir, since)
+    # Reports only need index summaries and deltas, not full snapshots
+    snapshots = load_snapshots(snapshots_dir, since, include_data=False)
 
     # Generate report
     if args.weekly:
@@ -8,7 +8,9 @@ Compares against previous snapshot to identify changes.
 Usage:
     python scripts/generate_snapshot.py [--output PATH] [--label LABEL]
 
-Output goes to .claude/archive/snapshots/ by default.
+Output goes to .claude/archive/snapshots/ by default. JSON snapshots are
+delta-encoded against a periodic base; use snapshot_store.SnapshotStore to
+reconstruct the full state of any snapshot.
 """
 
 import json
@@ -17,6 +19,10 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
 
+from ecosystem_shards import EcosystemShards
+from snapshot_index import load_index, update_index
+from snapshot_store import SnapshotStore, state_refs
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .claude directory."""
@@ -29,67 +35,88 @@ def find_project_root() -> Path:
 
 
 def load_ecosystem_state(state_file: Path) -> Optional[Dict[str, Any]]:
-    """Load ecosystem state JSON."""
+    """Load ecosystem state JSON (a single file or a sharded directory)."""
     if not state_file.exists():
         return None
     try:
+        if state_file.is_dir():
+            return EcosystemShards(state_file).load_state()
         return json.loads(state_file.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+    except (json.JSONDecodeError, OSError, KeyError):
         return None
 
 
-def find_previous_snapshot(snapshots_dir: Path) -> Optional[Dict[str, Any]]:
-    """Find the most recent snapshot file."""
-    if not snapshots_dir.exists():
-        return None
+def find_previous_snapshot(store: SnapshotStore) -> Optional[Tuple[str, Dict[str, Dict[str, str]]]]:
+    """
+    Find the most recent snapshot.
 
-    snapshot_files = sorted(snapshots_dir.glob("*.json"))
-    if not snapshot_files:
+    Returns (filename, refs) where refs maps entity names to fingerprints.
+    Only the snapshot and its base are read, not the entity records.
+    """
+    entries = load_index(store.snapshots_dir)
+    if not entries:
         return None
 
-    # Load most recent
-    latest = snapshot_files[-1]
+    latest = entries[-1]["file"]
     try:
-        return json.loads(latest.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        return latest, store.refs(latest)
+    except (json.JSONDecodeError, OSError, KeyError):
         return None
 
 
-def calculate_delta(current: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate changes since previous snapshot."""
+def unique_snapshot_name(snapshots_dir: Path, stem: str) -> str:
+    """stem, or stem-2, stem-3, ... if a snapshot with that name already exists."""
+    name = stem
+    counter = 2
+    while (snapshots_dir / f"{name}.json").exists() or (snapshots_dir / f"{name}.md").exists():
+        name = f"{stem}-{counter}"
+        counter += 1
+    return name
+
+
+def index_entities(entities: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index agent or skill records by name."""
+    return {e["name"]: e for e in entities}
+
+
+def diff_fingerprints(
+    current: Dict[str, str],
+    previous: Dict[str, str]
+) -> Tuple[List[str], List[str], List[str]]:
+    """Return (added, removed, changed) names between two fingerprint maps."""
+    added = sorted(current.keys() - previous.keys())
+    removed = sorted(previous.keys() - current.keys())
+    changed = sorted(
+        name for name, fingerprint in current.items()
+        if name in previous and previous[name] != fingerprint
+    )
+    return added, removed, changed
+
+
+def calculate_delta(
+    current: Dict[str, Dict[str, str]],
+    previous: Optional[Dict[str, Dict[str, str]]]
+) -> Dict[str, Any]:
+    """
+    Calculate changes between the current and previous ecosystem states.
+
+    Both states are given as entity refs (see snapshot_store.state_refs()).
+    """
     if previous is None:
         return {
             "is_initial": True,
             "skills_added": len(current["skills"]),
             "agents_added": len(current["agents"]),
-            "new_skills": [s["name"] for s in current["skills"]],
-            "new_agents": [a["name"] for a in current["agents"]],
+            "new_skills": list(current["skills"]),
+            "new_agents": list(current["agents"]),
         }
 
-    # Calculate diffs
-    prev_skill_names = {s["name"] for s in previous["skills"]}
-    curr_skill_names = {s["name"] for s in current["skills"]}
-
-    prev_agent_names = {a["name"] for a in previous["agents"]}
-    curr_agent_names = {a["name"] for a in current["agents"]}
-
-    new_skills = sorted(curr_skill_names - prev_skill_names)
-    removed_skills = sorted(prev_skill_names - curr_skill_names)
-
-    new_agents = sorted(curr_agent_names - prev_agent_names)
-    removed_agents = sorted(prev_agent_names - curr_agent_names)
-
-    # Detect changed skills (by comparing description/tools)
-    changed_skills = []
-    for curr_skill in current["skills"]:
-        name = curr_skill["name"]
-        if name in prev_skill_names and name not in new_skills:
-            prev_skill = next((s for s in previous["skills"] if s["name"] == name), None)
-            if prev_skill and (
-                curr_skill.get("description") != prev_skill.get("description") or
-                curr_skill.get("tools") != prev_skill.get("tools")
-            ):
-                changed_skills.append(name)
+    new_skills, removed_skills, changed_skills = diff_fingerprints(
+        current["skills"], previous.get("skills", {})
+    )
+    new_agents, removed_agents, changed_agents = diff_fingerprints(
+        current["agents"], previous.get("agents", {})
+    )
 
     return {
         "is_initial": False,
@@ -98,11 +125,13 @@ def calculate_delta(current: Dict[str, Any], previous: Optional[Dict[str, Any]])
         "agents_added": len(new_agents),
         "agents_removed": len(removed_agents),
         "skills_changed": len(changed_skills),
+        "agents_changed": len(changed_agents),
         "new_skills": new_skills,
         "removed_skills": removed_skills,
         "new_agents": new_agents,
         "removed_agents": removed_agents,
         "changed_skills": changed_skills,
+        "changed_agents": changed_agents,
     }
 
 
@@ -113,6 +142,8 @@ def generate_snapshot_markdown(
 ) -> str:
     """Generate human-readable markdown snapshot."""
     summary = state["summary"]
+    skills_by_name = index_entities(state["skills"])
+    agents_by_name = index_entities(state["agents"])
 
     # Header
     lines = [
@@ -151,7 +182,7 @@ def generate_snapshot_markdown(
             lines.append("### New Skills")
             lines.append("")
             for skill_name in delta["new_skills"]:
-                skill = next((s for s in state["skills"] if s["name"] == skill_name), None)
+                skill = skills_by_name.get(skill_name)
                 if skill:
                     desc = skill.get("description", "")[:100]
                     lines.append(f"- **{skill_name}**: {desc}{'...' if len(skill.get('description', '')) > 100 else ''}")
@@ -161,7 +192,7 @@ def generate_snapshot_markdown(
             lines.append("### New Agents")
             lines.append("")
             for agent_name in delta["new_agents"]:
-                agent = next((a for a in state["agents"] if a["name"] == agent_name), None)
+                agent = agents_by_name.get(agent_name)
                 if agent:
                     role = agent.get("role", "")
                     lines.append(f"- **{agent_name}**: {role}")
@@ -171,7 +202,14 @@ def generate_snapshot_markdown(
             lines.append("### Updated Skills")
             lines.append("")
             for skill_name in delta["changed_skills"]:
-                lines.append(f"- **{skill_name}**: Description or tools updated")
+                lines.append(f"- **{skill_name}**: Content updated")
+            lines.append("")
+
+        if delta.get("changed_agents"):
+            lines.append("### Updated Agents")
+            lines.append("")
+            for agent_name in delta["changed_agents"]:
+                lines.append(f"- **{agent_name}**: Content updated")
             lines.append("")
 
         if delta["removed_skills"]:
@@ -240,6 +278,9 @@ def main():
 
     # Load current ecosystem state
     state_file = project_root / ".claude" / "data" / "ecosystem-state.json"
+    if not state_file.exists():
+        # Written by generate_ecosystem_data.py --sharded
+        state_file = project_root / ".claude" / "data" / "ecosystem"
     if not state_file.exists():
         print("❌ No ecosystem state found. Run generate_ecosystem_data.py first.")
         return 1
@@ -257,35 +298,35 @@ def main():
 
     snapshots_dir.mkdir(parents=True, exist_ok=True)
 
+    store = SnapshotStore(snapshots_dir)
+
     # Find previous snapshot
-    previous = find_previous_snapshot(snapshots_dir)
+    previous = find_previous_snapshot(store)
+    previous_file, previous_refs = previous if previous else (None, None)
 
     # Calculate delta
-    delta = calculate_delta(state, previous)
+    refs = state_refs(state)
+    delta = calculate_delta(refs, previous_refs)
 
     # Generate timestamp
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    file_timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H%M")
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S UTC")
+    file_timestamp = now.strftime("%Y-%m-%d-%H%M%S")
 
-    # Add label if provided
+    # Add label if provided; never reuse an existing name, since later
+    # delta snapshots may use that file as their base
     if args.label:
-        filename = f"{file_timestamp}-{args.label}"
+        filename = unique_snapshot_name(snapshots_dir, f"{file_timestamp}-{args.label}")
     else:
-        filename = file_timestamp
-
-    # Create snapshot data
-    snapshot_data = {
-        "timestamp": timestamp,
-        "state": state,
-        "delta": delta,
-    }
+        filename = unique_snapshot_name(snapshots_dir, file_timestamp)
 
-    # Write JSON snapshot
+    # Write JSON snapshot (delta-encoded, see snapshot_store.py)
     json_path = snapshots_dir / f"{filename}.json"
-    json_path.write_text(
-        json.dumps(snapshot_data, indent=2, ensure_ascii=False),
-        encoding="utf-8"
+    document = store.write(
+        json_path.name, timestamp, state, delta, refs,
+        previous_file=previous_file, previous_refs=previous_refs
     )
+    update_index(snapshots_dir, json_path.name, document)
 
     # Write markdown snapshot
     markdown = generate_snapshot_markdown(state, delta, timestamp)
@@ -306,6 +347,8 @@ def main():
             changes.append(f"+{delta['agents_added']} agents")
         if delta["skills_changed"]:
             changes.append(f"~{delta['skills_changed']} updated")
+        if delta["agents_changed"]:
+            changes.append(f"~{delta['agents_changed']} agents updated")
 
         if changes:
             print(f"   📈 Changes: {', '.join(changes)}")
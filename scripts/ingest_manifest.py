@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Ingest Manifest
+
+Content-addressed bookkeeping for scan-and-ingest-skills.py. The manifest
+maps each source skill directory to the content hash of its files and to
+the skill it was ingested as:
+
+    {
+      "version": 1,
+      "sources": {
+        "/Users/me/coding/app/.claude/skills/foo": {
+          "skill": "foo",
+          "status": "ingested",
+          "tree_hash": "9f2c...",
+          "files": {"SKILL.md": {"hash": "...", "size": 812, "mtime_ns": ...}}
+        }
+      }
+    }
+
+Each scan classifies a source as one of:
+
+- new        never seen, name not taken: ingest it
+- changed    ingested before, content differs: copy the changed files
+- moved      content (or skill name) of a source whose old path is gone:
+             update the manifest, copy files only if they changed
+- duplicate  same content as another source: skip
+- adopted    skill already in the repo with exactly the content the source
+             would be ingested as (renames and ingest patches applied),
+             but not in the manifest (ingested before it existed): record
+             the source as its baseline
+- existing   skill name already taken by another source, or by a repo
+             skill whose content differs: skip
+- unchanged  nothing to do
+
+File hashes are reused while a file's size and mtime are unchanged, so an
+unchanged source costs one stat per file.
+
+Usage:
+    from ingest_manifest import IngestManifest
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+MANIFEST_VERSION = 1
+
+HASH_CHUNK_SIZE = 1 << 20
+
+NEW = "new"
+CHANGED = "changed"
+MOVED = "moved"
+DUPLICATE = "duplicate"
+EXISTING = "existing"
+ADOPTED = "adopted"
+UNCHANGED = "unchanged"
+
+# Source file names that are stored under a different name in the repo
+RENAMED_FILES = {"skill.md": "SKILL.md"}
+
+FileTable = Dict[str, Dict[str, int]]
+
+
+@dataclass
+class Decision:
+    """How one source skill directory should be handled."""
+    status: str
+    source: str
+    skill: Optional[str]
+    files: FileTable
+    tree_hash: str
+    previous_files: FileTable = field(default_factory=dict)
+    duplicate_of: Optional[str] = None
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_source(source_dir: Path, skip_dirs: Set[str],
+                previous: Optional[FileTable] = None) -> FileTable:
+    """
+    Hash every file below a source skill directory.
+
+    Hashes from previous are reused for files whose size and mtime match.
+    """
+    previous = previous or {}
+    files: FileTable = {}
+
+    for root, dirs, names in os.walk(source_dir):
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        for name in names:
+            path = Path(root) / name
+            rel = path.relative_to(source_dir).as_posix()
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            known = previous.get(rel)
+            if known and known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+                digest = known["hash"]
+            else:
+                digest = hash_file(path)
+            files[rel] = {"hash": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    return files
+
+
+def tree_hash(files: FileTable) -> str:
+    """Hash of a directory's file names and contents."""
+    digest = hashlib.sha256()
+    for rel in sorted(files):
+        digest.update(rel.encode("utf-8") + b"\0" + files[rel]["hash"].encode("ascii") + b"\0")
+    return digest.hexdigest()
+
+
+def destination_name(rel: str) -> str:
+    """Path of a source file inside the ingested skill directory."""
+    head, _, name = rel.rpartition("/")
+    if not head:
+        return RENAMED_FILES.get(name, name)
+    return rel
+
+
+def destination_tree_hash(files: FileTable) -> str:
+    """tree_hash() of a source as it would look once ingested (renames applied)."""
+    return tree_hash({destination_name(rel): info for rel, info in files.items()})
+
+
+def sync_files(source_dir: Path, dest_dir: Path, files: FileTable,
+               previous_files: FileTable) -> Tuple[List[str], List[str]]:
+    """
+    Copy files that differ from what was last ingested into dest_dir.
+
+    Files that are identical to the previous ingest and still present in
+    dest_dir are skipped. Files removed upstream are removed from dest_dir.
+    Returns (copied, removed) destination paths relative to dest_dir.
+    """
+    copied = []
+    for rel, info in files.items():
+        dest = dest_dir / destination_name(rel)
+        known = previous_files.get(rel)
+        if known and known["hash"] == info["hash"] and dest.exists():
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_dir / rel, dest)
+        copied.append(destination_name(rel))
+
+    removed = []
+    for rel in previous_files.keys() - files.keys():
+        dest = dest_dir / destination_name(rel)
+        if dest.exists():
+            dest.unlink()
+            removed.append(destination_name(rel))
+
+    return copied, removed
+
+
+class IngestManifest:
+    """Source path -> content hash -> destination skill."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.sources: Dict[str, Dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.sources = data.get("sources", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        self._by_hash: Dict[str, str] = {}
+        self._by_skill: Dict[str, str] = {}
+        for source, record in self.sources.items():
+            self._index(source, record)
+
+    def _index(self, source: str, record: Dict) -> None:
+        if record["status"] == "ingested":
+            self._by_hash.setdefault(record["tree_hash"], source)
+            self._by_skill[record["skill"]] = source
+
+    def _unindex(self, source: str, record: Dict) -> None:
+        if self._by_hash.get(record["tree_hash"]) == source:
+            del self._by_hash[record["tree_hash"]]
+        if self._by_skill.get(record["skill"]) == source:
+            del self._by_skill[record["skill"]]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "sources": self.sources}, indent=1, sort_keys=True),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.path)
+
+    def scan(self, source_dir: Path, skip_dirs: Set[str]) -> FileTable:
+        """Hash a source directory, reusing hashes of unchanged files."""
+        record = self.sources.get(str(source_dir))
+        return scan_source(source_dir, skip_dirs, record["files"] if record else None)
+
+    def classify(
+        self,
+        source_dir: Path,
+        files: FileTable,
+        skill_name: Callable[[], Optional[str]],
+        skill_hash: Callable[[str], Optional[str]],
+        ingested_hash: Optional[Callable[[str], str]] = None,
+    ) -> Decision:
+        """
+        Classify a source skill directory from its scanned files.
+
+        skill_name is only called for sources the manifest does not know;
+        skill_hash returns the tree_hash() of the repo's copy of a skill, or
+        None if the repo has no such skill. ingested_hash returns the
+        tree_hash() the source would have once ingested under a name,
+        including any edits ingest makes to the copied files; it defaults
+        to destination_tree_hash(files). Decisions are only visible to
+        later calls once recorded.
+        """
+        source = str(source_dir)
+        record = self.sources.get(source)
+        digest = tree_hash(files)
+
+        if record and record["tree_hash"] == digest:
+            return Decision(UNCHANGED, source, record.get("skill"), files, digest, record["files"])
+        if record and record["status"] == "ingested":
+            return Decision(CHANGED, source, record["skill"], files, digest, record["files"])
+
+        # Same content as a known source
+        owner = self._by_hash.get(digest)
+        if owner and owner != source:
+            owner_record = self.sources[owner]
+            if not os.path.exists(owner):
+                return Decision(MOVED, source, owner_record["skill"], files, digest, owner_record["files"])
+            return Decision(DUPLICATE, source, owner_record["skill"], files, digest,
+                            duplicate_of=owner_record["skill"])
+
+        name = skill_name()
+        if not name:
+            return Decision(NEW, source, None, files, digest)
+
+        owner = self._by_skill.get(name)
+        if owner and owner != source:
+            # Same skill, moved and edited upstream
+            if not os.path.exists(owner):
+                return Decision(MOVED, source, name, files, digest, self.sources[owner]["files"])
+            return Decision(EXISTING, source, name, files, digest)
+
+        existing = skill_hash(name)
+        if existing is None:
+            return Decision(NEW, source, name, files, digest)
+        if existing == (ingested_hash(name) if ingested_hash else destination_tree_hash(files)):
+            # A skill ingested before the manifest existed: take the current
+            # source as its baseline so later upstream changes are picked up
+            return Decision(ADOPTED, source, name, files, digest, files)
+        # Same name, different content: never let this source write into it
+        return Decision(EXISTING, source, name, files, digest)
+
+    def record(self, decision: Decision) -> Dict[str, Optional[Dict]]:
+        """
+        Store the outcome of a decision.
+
+        Returns the records it replaced, for restore() if processing the
+        decision fails afterwards.
+        """
+        previous = self.sources.get(decision.source)
+        replaced = {decision.source: previous}
+
+        if decision.status == UNCHANGED and previous:
+            # Refresh the stat cache only
+            previous["files"] = decision.files
+            return {}
+
+        if decision.status == MOVED:
+            old = self._by_skill.get(decision.skill)
+            if old and old != decision.source:
+                replaced[old] = self.sources.pop(old)
+                self._unindex(old, replaced[old])
+
+        if previous:
+            self._unindex(decision.source, previous)
+
+        status = {DUPLICATE: "duplicate", EXISTING: "existing"}.get(decision.status, "ingested")
+        record = {
+            "skill": decision.skill,
+            "status": status,
+            "tree_hash": decision.tree_hash,
+            "files": decision.files,
+        }
+        if decision.duplicate_of:
+            record["duplicate_of"] = decision.duplicate_of
+
+        self.sources[decision.source] = record
+        self._index(decision.source, record)
+        return replaced
+
+    def restore(self, replaced: Dict[str, Optional[Dict]]) -> None:
+        """Undo record() using the records it returned."""
+        for source, record in replaced.items():
+            current = self.sources.pop(source, None)
+            if current:
+                self._unindex(source, current)
+            if record:
+                self.sources[source] = record
+                self._index(source, record)
+
+    def forget_missing(self, seen: Iterable[str]) -> List[str]:
+        """Drop non-ingested sources that were not seen in this scan."""
+        seen = set(seen)
+        dropped = [s for s, r in self.sources.items() if s not in seen and r["status"] != "ingested"]
+        for source in dropped:
+            del self.sources[source]
+        return dropped
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Keyword Category Classifier
+
+Classifies documents into categories with a compiled Aho-Corasick automaton.
+All keywords of all categories are matched in a single linear pass over the
+lowercased text, so classification cost does not grow with the size of the
+taxonomy.
+
+Matching uses word-boundary semantics: a keyword only counts when it is not
+embedded in a larger word, so 'ml' or 'ai' no longer fire inside 'html' or
+'email'. A trailing '*' turns a keyword into a word prefix ('test*' matches
+'test', 'tests' and 'testing').
+
+The category table is a JSON object mapping category names to keyword lists,
+see scripts/categories.json.
+
+Usage:
+    python scripts/keyword_classifier.py path/to/SKILL.md
+    python scripts/keyword_classifier.py path/to/SKILL.md --categories my-categories.json
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+DEFAULT_CATEGORIES_FILE = Path(__file__).parent / "categories.json"
+
+PREFIX_WILDCARD = "*"
+
+
+def load_categories(path: Path = DEFAULT_CATEGORIES_FILE) -> Dict[str, List[str]]:
+    """Load a category -> keywords table from a JSON file."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"Category file must contain a JSON object: {path}")
+    return {str(category): [str(k) for k in keywords] for category, keywords in data.items()}
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordClassifier:
+    """Multi-keyword Aho-Corasick automaton with per-category hit counts."""
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.categories: List[str] = list(categories)
+
+        # goto[state] maps a character to the next state; missing means root
+        self._goto: List[Dict[str, int]] = [{}]
+        # outputs[state] lists (category index, keyword length, is_prefix)
+        self._outputs: List[List[Tuple[int, int, bool]]] = [[]]
+
+        for index, keywords in enumerate(categories.values()):
+            for keyword in keywords:
+                self._add_keyword(index, keyword)
+
+        self._compile()
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_CATEGORIES_FILE) -> "KeywordClassifier":
+        return cls(load_categories(path))
+
+    def _add_keyword(self, category_index: int, keyword: str) -> None:
+        keyword = keyword.strip().lower()
+        is_prefix = keyword.endswith(PREFIX_WILDCARD)
+        keyword = keyword.rstrip(PREFIX_WILDCARD)
+        if not keyword:
+            return
+
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._outputs.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+
+        output = (category_index, len(keyword), is_prefix)
+        if output not in self._outputs[state]:
+            self._outputs[state].append(output)
+
+    def _compile(self) -> None:
+        """Compute failure links and fold them into a deterministic goto table."""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                fail[child] = target if target != child else 0
+                self._outputs[child].extend(self._outputs[fail[child]])
+
+            # Inherit transitions from the failure state so scanning never
+            # has to walk failure links (states are visited in BFS order,
+            # so the failure state is already complete)
+            if state:
+                for ch, target in self._goto[fail[state]].items():
+                    self._goto[state].setdefault(ch, target)
+
+    def classify(self, text: str) -> Dict[str, int]:
+        """Return keyword hit counts per category (categories with no hits omitted)."""
+        text = text.lower()
+        goto = self._goto
+        outputs = self._outputs
+        last = len(text) - 1
+        hits = [0] * len(self.categories)
+
+        state = 0
+        for i, ch in enumerate(text):
+            state = goto[state].get(ch, 0)
+            if not outputs[state]:
+                continue
+            for category_index, length, is_prefix in outputs[state]:
+                start = i - length + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if not is_prefix and i < last and _is_word_char(text[i + 1]):
+                    continue
+                hits[category_index] += 1
+
+        return {self.categories[i]: count for i, count in enumerate(hits) if count}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify a document into keyword categories")
+    parser.add_argument("file", type=Path, help="Markdown file to classify")
+    parser.add_argument("--categories", type=Path, default=DEFAULT_CATEGORIES_FILE,
+                        help="Category table JSON (default: scripts/categories.json)")
+    args = parser.parse_args()
+
+    classifier = KeywordClassifier.from_file(args.categories)
+    hits = classifier.classify(args.file.read_text(encoding="utf-8", errors="ignore"))
+
+    for category, count in sorted(hits.items(), key=lambda x: -x[1]):
+        print(f"{category}: {count}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,21 +5,36 @@ Ecosystem Growth Metrics Collector
 Measures the health and growth of the Claude Skills ecosystem.
 Run periodically to track progress over time.
 
+Every run is appended to the metrics/metrics.db time-series store; query
+history with scripts/metrics_store.py.
+
 Usage:
     python scripts/measure-ecosystem.py
     python scripts/measure-ecosystem.py --output metrics/YYYY-MM-DD.json
+    python scripts/measure-ecosystem.py --full  # Ignore previous metrics, re-analyze all skills
 """
 
 import argparse
+import hashlib
+import io
 import json
 import os
-import re
 import sys
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from keyword_classifier import KeywordClassifier, DEFAULT_CATEGORIES_FILE, load_categories
+from metrics_store import MetricsStore, DEFAULT_DB_PATH
+
+READ_BUFFER_SIZE = 1 << 20
+
+# Bump when analyze_skill() computes anything differently, so stored records
+# are re-analyzed instead of reused
+ANALYZER_VERSION = 2
+
 @dataclass
 class SkillMetrics:
     """Metrics for a single skill"""
@@ -31,6 +46,9 @@ class SkillMetrics:
     total_lines: int
     has_examples: bool
     categories: List[str]
+    category_hits: Dict[str, int]
+    source_mtime_ns: int = 0
+    analysis_key: str = ''
 
 @dataclass
 class EcosystemMetrics:
@@ -61,82 +79,111 @@ class EcosystemMetrics:
     skills: List[SkillMetrics]
 
 
+def _is_guidance_line(line: bytes) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith(b'#')
+
+
 def count_lines(filepath: Path) -> int:
     """Count non-empty, non-comment lines in a file"""
     try:
-        content = filepath.read_text(encoding='utf-8', errors='ignore')
-        lines = [l for l in content.split('\n')
-                 if l.strip() and not l.strip().startswith('#')]
-        return len(lines)
-    except Exception:
+        with open(filepath, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            return sum(1 for line in f if _is_guidance_line(line))
+    except OSError:
         return 0
 
 
-def extract_categories(skill_md: Path) -> List[str]:
-    """Extract categories from SKILL.md description"""
+def extract_categories(content: str, classifier: KeywordClassifier) -> Dict[str, int]:
+    """Count category keyword hits in SKILL.md content, strongest first"""
+    hits = classifier.classify(content)
+    return dict(sorted(hits.items(), key=lambda x: -x[1]))
+
+
+def analysis_key(categories: Dict[str, List[str]]) -> str:
+    """Analyzer version plus a hash of the category table a record was built with"""
+    table = json.dumps(categories, sort_keys=True).encode('utf-8')
+    return f"{ANALYZER_VERSION}:{hashlib.sha256(table).hexdigest()[:16]}"
+
+
+def scan_dir(path: str) -> List[os.DirEntry]:
+    """List a directory with os.scandir, returning [] if it doesn't exist"""
     try:
-        content = skill_md.read_text()
-        # Look for category hints in description
-        categories = []
-
-        category_patterns = {
-            'security': r'security|vulnerability|owasp|audit|cve',
-            'testing': r'test|tdd|coverage|jest|pytest|playwright',
-            'infrastructure': r'deploy|ci\/cd|docker|kubernetes|devops',
-            'design': r'design|ui|ux|css|component|visual',
-            'ml-ai': r'machine learning|ml|ai|model|embedding|clip|neural',
-            'career': r'career|resume|cv|portfolio|job',
-            'audio-video': r'audio|video|sound|music|voice|media',
-            'documentation': r'document|docs|readme|technical writing',
-            'backend': r'api|backend|database|server|rest|graphql',
-            'frontend': r'react|vue|frontend|browser|dom|css',
-        }
-
-        for category, pattern in category_patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
-                categories.append(category)
-
-        return categories if categories else ['uncategorized']
-    except Exception:
-        return ['unknown']
-
-
-def analyze_skill(skill_dir: Path) -> Optional[SkillMetrics]:
-    """Analyze a single skill directory"""
-    skill_md = skill_dir / 'SKILL.md'
-    if not skill_md.exists():
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def analyze_skill(skill_dir: os.DirEntry, classifier: KeywordClassifier,
+                  previous: Optional[dict] = None, key: str = '') -> Optional[SkillMetrics]:
+    """
+    Analyze a single skill directory.
+
+    Only stats files to fingerprint the skill; if the fingerprint and the
+    analysis key (analyzer version and category table) match the previous
+    metrics record for this skill, that record is reused without reading
+    any file.
+    """
+    entries = {e.name: e for e in scan_dir(skill_dir.path)}
+    skill_md = entries.get('SKILL.md')
+    if skill_md is None or not skill_md.is_file():
         return None
 
-    # Count reference files
-    refs_dir = skill_dir / 'references'
-    reference_count = len(list(refs_dir.glob('*.md'))) if refs_dir.exists() else 0
+    refs_path = os.path.join(skill_dir.path, 'references')
+    scripts_path = os.path.join(skill_dir.path, 'scripts')
+    references = [e for e in scan_dir(refs_path) if e.name.endswith('.md')]
+    scripts = [e for e in scan_dir(scripts_path) if not e.name.startswith('.')]
+
+    # Directory mtimes catch added/removed files, file mtimes catch edits
+    stamped = [skill_dir, skill_md] + references
+    for name in ('references', 'scripts', 'CHANGELOG.md'):
+        if name in entries:
+            stamped.append(entries[name])
+    source_mtime_ns = max(e.stat().st_mtime_ns for e in stamped)
+
+    if (previous and previous.get('source_mtime_ns') == source_mtime_ns
+            and previous.get('analysis_key') == key):
+        try:
+            return SkillMetrics(**previous)
+        except TypeError:
+            pass  # Record from an older schema, re-analyze
 
-    # Count scripts
-    scripts_dir = skill_dir / 'scripts'
-    script_count = len(list(scripts_dir.glob('*'))) if scripts_dir.exists() else 0
+    data = Path(skill_md.path).read_bytes()
+    content = data.decode('utf-8', errors='ignore')
 
     # Count total lines
-    total_lines = count_lines(skill_md)
-    if refs_dir.exists():
-        for ref in refs_dir.glob('*.md'):
-            total_lines += count_lines(ref)
+    total_lines = sum(1 for line in io.BytesIO(data) if _is_guidance_line(line))
+    for ref in references:
+        total_lines += count_lines(Path(ref.path))
 
     # Check for examples in SKILL.md
-    content = skill_md.read_text()
     has_examples = '```' in content  # Code blocks indicate examples
 
+    category_hits = extract_categories(content, classifier)
+
     return SkillMetrics(
         name=skill_dir.name,
         has_skill_md=True,
-        has_changelog=(skill_dir / 'CHANGELOG.md').exists(),
-        reference_count=reference_count,
-        script_count=script_count,
+        has_changelog='CHANGELOG.md' in entries,
+        reference_count=len(references),
+        script_count=len(scripts),
         total_lines=total_lines,
         has_examples=has_examples,
-        categories=extract_categories(skill_md)
+        categories=list(category_hits) or ['uncategorized'],
+        category_hits=category_hits,
+        source_mtime_ns=source_mtime_ns,
+        analysis_key=key
     )
 
 
+def load_previous_metrics(db_path: Path) -> Dict[str, dict]:
+    """Load the latest per-skill records from the metrics store"""
+    if not db_path.exists():
+        return {}
+    with MetricsStore(db_path) as store:
+        return store.latest_skills()
+
+
 def count_agents(base_dir: Path) -> int:
     """Count custom agents defined"""
     agents_dir = base_dir / '.claude' / 'agents'
@@ -145,21 +192,37 @@ def count_agents(base_dir: Path) -> int:
     return len([f for f in agents_dir.glob('*.md') if f.is_file()])
 
 
-def collect_metrics(base_dir: Path) -> EcosystemMetrics:
-    """Collect all ecosystem metrics"""
+def collect_metrics(base_dir: Path,
+                    categories_file: Path = DEFAULT_CATEGORIES_FILE,
+                    previous: Optional[Dict[str, dict]] = None,
+                    workers: Optional[int] = None) -> EcosystemMetrics:
+    """
+    Collect all ecosystem metrics.
+
+    Skills are analyzed concurrently on a thread pool. Records in previous
+    (keyed by skill name) are reused for skills whose files are unchanged.
+    """
     skills_dir = base_dir / '.claude' / 'skills'
+    category_table = load_categories(categories_file)
+    classifier = KeywordClassifier(category_table)
+    key = analysis_key(category_table)
+    previous = previous or {}
 
     skills: List[SkillMetrics] = []
     categories: Dict[str, int] = {}
 
-    if skills_dir.exists():
-        for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir():
-                skill = analyze_skill(skill_dir)
-                if skill:
-                    skills.append(skill)
-                    for cat in skill.categories:
-                        categories[cat] = categories.get(cat, 0) + 1
+    skill_dirs = [e for e in scan_dir(str(skills_dir)) if e.is_dir()]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda d: analyze_skill(d, classifier, previous.get(d.name), key),
+            skill_dirs
+        )
+        for skill in results:
+            if skill:
+                skills.append(skill)
+                for cat in skill.categories:
+                    categories[cat] = categories.get(cat, 0) + 1
 
     total_skills = len(skills)
     total_agents = count_agents(base_dir)
@@ -185,7 +248,7 @@ def collect_metrics(base_dir: Path) -> EcosystemMetrics:
         skills_with_scripts=sum(1 for s in skills if s.script_count > 0),
 
         categories=dict(sorted(categories.items(), key=lambda x: -x[1])),
-        skills=[asdict(s) for s in sorted(skills, key=lambda x: -x.total_lines)]
+        skills=[vars(s).copy() for s in sorted(skills, key=lambda x: -x.total_lines)]
     )
 
 
@@ -233,27 +296,36 @@ def main():
     parser.add_argument('--output', '-o', help='Output JSON file path')
     parser.add_argument('--json', action='store_true', help='Output JSON only')
     parser.add_argument('--dir', default='.', help='Base directory to analyze')
+    parser.add_argument('--categories', type=Path, default=DEFAULT_CATEGORIES_FILE,
+                        help='Category keyword table (default: scripts/categories.json)')
+    parser.add_argument('--workers', type=int, help='Thread pool size for skill analysis')
+    parser.add_argument('--full', action='store_true',
+                        help='Re-analyze every skill instead of reusing unchanged ones')
     args = parser.parse_args()
 
     base_dir = Path(args.dir).resolve()
-    metrics = collect_metrics(base_dir)
+    db_path = base_dir / DEFAULT_DB_PATH
+    previous = {} if args.full else load_previous_metrics(db_path)
+    metrics = collect_metrics(base_dir, args.categories, previous, args.workers)
+
+    # Skill records are already plain dicts, so a shallow conversion avoids
+    # asdict() deep-copying every record
+    metrics_dict = {f.name: getattr(metrics, f.name) for f in fields(metrics)}
 
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(asdict(metrics), indent=2))
+        output_path.write_text(json.dumps(metrics_dict, indent=2))
         print(f"Metrics saved to: {output_path}")
 
     if args.json:
-        print(json.dumps(asdict(metrics), indent=2))
+        print(json.dumps(metrics_dict, indent=2))
     else:
         print_summary(metrics)
 
-    # Always save to metrics directory with date
-    metrics_dir = base_dir / 'metrics'
-    metrics_dir.mkdir(exist_ok=True)
-    dated_file = metrics_dir / f"{datetime.now().strftime('%Y-%m-%d')}.json"
-    dated_file.write_text(json.dumps(asdict(metrics), indent=2))
+    # Always append to the metrics time-series store
+    with MetricsStore(db_path) as store:
+        store.append(metrics_dict)
 
     return 0
 
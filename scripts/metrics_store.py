@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Ecosystem Metrics Time-Series Store
+
+Append-only history of measure-ecosystem.py runs in a single SQLite file
+(metrics/metrics.db by default), replacing one full JSON dump per day.
+
+- Skill and metric names are dictionary-encoded into integer ids.
+- Per-skill samples are stored only when a value changes, so history grows
+  with the volume of change rather than with skills x runs. A series is a
+  list of change points: each value holds until the next point.
+- Samples are clustered by (skill, metric, run), so "metric X for skill Y
+  over time" is a single index range scan.
+- Ecosystem-wide totals are small and stored for every run.
+- Imported runs remember their source file; a (source, timestamp) pair is
+  unique, so importing the same file twice is a no-op.
+- Runs are ordered by timestamp, not insertion order. A run older than the
+  newest stored one (e.g. a legacy import into a live store) is diffed
+  against the values in effect at its timestamp, and the next run gets
+  change points restoring its own values, so later history and
+  skill_latest are untouched.
+
+Usage:
+    python scripts/metrics_store.py series total_lines --skill security-auditor
+    python scripts/metrics_store.py series total_skills
+    python scripts/metrics_store.py runs
+    python scripts/metrics_store.py import metrics/2025-12-*.json
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_DB_PATH = Path("metrics") / "metrics.db"
+
+# Pseudo-metric recording whether a skill exists (1) or was removed (0)
+PRESENT = "present"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    version TEXT,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS metric_names (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS skill_samples (
+    skill_id INTEGER NOT NULL,
+    metric_id INTEGER NOT NULL,
+    run_id INTEGER NOT NULL,
+    value,
+    PRIMARY KEY (skill_id, metric_id, run_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS skill_latest (
+    skill_id INTEGER NOT NULL,
+    metric_id INTEGER NOT NULL,
+    value,
+    PRIMARY KEY (skill_id, metric_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ecosystem_samples (
+    metric_id INTEGER NOT NULL,
+    run_id INTEGER NOT NULL,
+    value,
+    PRIMARY KEY (metric_id, run_id)
+) WITHOUT ROWID;
+"""
+
+# Live runs have a NULL source, and NULLs never collide in a UNIQUE index
+RUNS_INDEX = "CREATE UNIQUE INDEX IF NOT EXISTS runs_source_timestamp ON runs (source, timestamp)"
+
+_MISSING = object()
+
+# Top-level EcosystemMetrics fields that are not time-series values
+RUN_FIELDS = {"timestamp", "version", "skills"}
+
+
+def encode_value(value: Any) -> Any:
+    """Store numbers natively and everything else as JSON text."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)) or value is None:
+        return value
+    return json.dumps(value)
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+class MetricsStore:
+    """SQLite-backed time-series store for ecosystem metrics."""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self._skill_ids: Dict[str, int] = dict(
+            self.conn.execute("SELECT name, id FROM skills"))
+        self._metric_ids: Dict[str, int] = dict(
+            self.conn.execute("SELECT name, id FROM metric_names"))
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _migrate(self) -> None:
+        """Add the runs.source column to stores created before it existed."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(runs)")}
+        with self.conn:
+            if "source" not in columns:
+                self.conn.execute("ALTER TABLE runs ADD COLUMN source TEXT")
+            self.conn.execute(RUNS_INDEX)
+
+    # -------------------------------------------------------------------------
+    # Dictionary encoding
+    # -------------------------------------------------------------------------
+
+    def _intern(self, table: str, ids: Dict[str, int], name: str) -> int:
+        if name not in ids:
+            cursor = self.conn.execute(f"INSERT INTO {table} (name) VALUES (?)", (name,))
+            ids[name] = cursor.lastrowid
+        return ids[name]
+
+    def _skill_id(self, name: str) -> int:
+        return self._intern("skills", self._skill_ids, name)
+
+    def _metric_id(self, name: str) -> int:
+        return self._intern("metric_names", self._metric_ids, name)
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def append(self, metrics: Dict[str, Any], source: Optional[str] = None) -> Optional[int]:
+        """
+        Append one EcosystemMetrics record (as a dict) and return its run id.
+
+        Only skill values that differ from the value in effect at the run's
+        timestamp are written. Skills missing from this run are marked as
+        removed. When source is given and a run with the same source and
+        timestamp is already stored, nothing is written and None is returned.
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO runs (timestamp, version, source) VALUES (?, ?, ?)",
+                (metrics["timestamp"], metrics.get("version"), source)
+            )
+            if cursor.rowcount == 0:
+                return None
+            run_id = cursor.lastrowid
+
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO ecosystem_samples (metric_id, run_id, value) VALUES (?, ?, ?)",
+                [(self._metric_id(k), run_id, encode_value(v))
+                 for k, v in metrics.items() if k not in RUN_FIELDS]
+            )
+
+            # Runs are ordered by (timestamp, id); the next run exists only
+            # when this one is older than the newest stored run
+            next_run = self.conn.execute(
+                "SELECT id FROM runs WHERE (timestamp, id) > (?, ?) ORDER BY timestamp, id LIMIT 1",
+                (metrics["timestamp"], run_id)
+            ).fetchone()
+            if next_run is None:
+                latest: Dict[Tuple[int, int], Any] = {
+                    (skill_id, metric_id): value
+                    for skill_id, metric_id, value in self.conn.execute(
+                        "SELECT skill_id, metric_id, value FROM skill_latest")
+                }
+            else:
+                latest = self._values_before(metrics["timestamp"], run_id)
+
+            changed: List[Tuple[int, int, Any]] = []
+            present_id = self._metric_id(PRESENT)
+            seen = set()
+
+            for record in metrics.get("skills", []):
+                skill_id = self._skill_id(record["name"])
+                seen.add(skill_id)
+                values = {k: v for k, v in record.items() if k != "name"}
+                values[PRESENT] = 1
+                for key, value in values.items():
+                    metric_id = self._metric_id(key)
+                    value = encode_value(value)
+                    if latest.get((skill_id, metric_id), _MISSING) != value:
+                        changed.append((skill_id, metric_id, value))
+
+            for (skill_id, metric_id), value in latest.items():
+                if metric_id == present_id and value == 1 and skill_id not in seen:
+                    changed.append((skill_id, present_id, 0))
+
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO skill_samples (skill_id, metric_id, run_id, value) VALUES (?, ?, ?, ?)",
+                [(s, m, run_id, v) for s, m, v in changed]
+            )
+            if next_run is None:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO skill_latest (skill_id, metric_id, value) VALUES (?, ?, ?)",
+                    changed
+                )
+            else:
+                self._restore_at(next_run[0], changed, latest, present_id)
+
+        return run_id
+
+    def _values_before(self, timestamp: str, run_id: int) -> Dict[Tuple[int, int], Any]:
+        """Skill values in effect just before the run at (timestamp, run_id)."""
+        values: Dict[Tuple[int, int], Any] = {}
+        for skill_id, metric_id, value in self.conn.execute(
+                "SELECT s.skill_id, s.metric_id, s.value FROM skill_samples s "
+                "JOIN runs r ON r.id = s.run_id "
+                "WHERE (r.timestamp, r.id) < (?, ?) ORDER BY r.timestamp, r.id",
+                (timestamp, run_id)):
+            values[(skill_id, metric_id)] = value
+        return values
+
+    def _restore_at(self, next_run_id: int, changed: List[Tuple[int, int, Any]],
+                    before: Dict[Tuple[int, int], Any], present_id: int) -> None:
+        """
+        Keep the values of the run after an inserted older run intact.
+
+        Every value the inserted run changed gets a change point at the next
+        run restoring what was in effect there, unless the next run already
+        has one; a change point there that now repeats the inserted value is
+        dropped.
+        """
+        at_next: Dict[Tuple[int, int], Any] = {
+            (skill_id, metric_id): value
+            for skill_id, metric_id, value in self.conn.execute(
+                "SELECT skill_id, metric_id, value FROM skill_samples WHERE run_id = ?", (next_run_id,))
+        }
+        restore = []
+        redundant = []
+        for skill_id, metric_id, value in changed:
+            key = (skill_id, metric_id)
+            if key in at_next:
+                if at_next[key] == value:
+                    redundant.append((skill_id, metric_id, next_run_id))
+                continue
+            previous = before.get(key, _MISSING)
+            if previous is not _MISSING:
+                restore.append((skill_id, metric_id, next_run_id, previous))
+            elif metric_id == present_id:
+                # The skill did not exist yet at the next run
+                restore.append((skill_id, metric_id, next_run_id, 0))
+
+        self.conn.executemany(
+            "INSERT INTO skill_samples (skill_id, metric_id, run_id, value) VALUES (?, ?, ?, ?)",
+            restore
+        )
+        self.conn.executemany(
+            "DELETE FROM skill_samples WHERE skill_id = ? AND metric_id = ? AND run_id = ?",
+            redundant
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def runs(self) -> List[Tuple[int, str]]:
+        """All runs as (run_id, timestamp), oldest first."""
+        return list(self.conn.execute("SELECT id, timestamp FROM runs ORDER BY timestamp, id"))
+
+    def skill_series(self, metric: str, skill: str,
+                     since: Optional[str] = None) -> List[Tuple[str, Any]]:
+        """
+        Change points of one skill metric as (timestamp, value), oldest first.
+
+        Each value holds until the next change point. The value in effect at
+        'since' is included as the first point.
+        """
+        skill_id = self._skill_ids.get(skill)
+        metric_id = self._metric_ids.get(metric)
+        if skill_id is None or metric_id is None:
+            return []
+
+        rows = self.conn.execute(
+            "SELECT r.timestamp, s.value FROM skill_samples s "
+            "JOIN runs r ON r.id = s.run_id "
+            "WHERE s.skill_id = ? AND s.metric_id = ? ORDER BY r.timestamp, s.run_id",
+            (skill_id, metric_id)
+        )
+        return _clip_series([(ts, decode_value(v)) for ts, v in rows], since)
+
+    def ecosystem_series(self, metric: str,
+                         since: Optional[str] = None) -> List[Tuple[str, Any]]:
+        """One ecosystem-wide metric for every run as (timestamp, value)."""
+        metric_id = self._metric_ids.get(metric)
+        if metric_id is None:
+            return []
+
+        query = ("SELECT r.timestamp, e.value FROM ecosystem_samples e "
+                 "JOIN runs r ON r.id = e.run_id WHERE e.metric_id = ?")
+        params: Tuple = (metric_id,)
+        if since:
+            query += " AND r.timestamp >= ?"
+            params += (since,)
+        rows = self.conn.execute(query + " ORDER BY r.timestamp, e.run_id", params)
+        return [(ts, decode_value(v)) for ts, v in rows]
+
+    def latest_skills(self) -> Dict[str, Dict[str, Any]]:
+        """Reconstruct the most recent record of every present skill."""
+        names = {v: k for k, v in self._skill_ids.items()}
+        metrics = {v: k for k, v in self._metric_ids.items()}
+
+        records: Dict[int, Dict[str, Any]] = {}
+        for skill_id, metric_id, value in self.conn.execute(
+                "SELECT skill_id, metric_id, value FROM skill_latest"):
+            records.setdefault(skill_id, {})[metrics[metric_id]] = decode_value(value)
+
+        return {
+            names[skill_id]: {"name": names[skill_id], **{k: v for k, v in record.items() if k != PRESENT}}
+            for skill_id, record in records.items()
+            if record.get(PRESENT) == 1
+        }
+
+    def import_json(self, paths: Iterable[Path]) -> int:
+        """
+        Import legacy metrics/YYYY-MM-DD.json files in timestamp order.
+
+        Files already imported (same file name and timestamp) are skipped.
+        Returns the number of runs actually added.
+        """
+        records = [(Path(p).name, json.loads(Path(p).read_text(encoding="utf-8"))) for p in paths]
+        records.sort(key=lambda r: r[1].get("timestamp", ""))
+        return sum(self.append(record, source=name) is not None for name, record in records)
+
+
+def _clip_series(points: List[Tuple[str, Any]], since: Optional[str]) -> List[Tuple[str, Any]]:
+    if not since:
+        return points
+    before = [p for p in points if p[0] < since]
+    after = [p for p in points if p[0] >= since]
+    return before[-1:] + after
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the ecosystem metrics store")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH,
+                        help="Store path (default: metrics/metrics.db)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    series = subparsers.add_parser("series", help="Print a metric over time")
+    series.add_argument("metric", help="Metric name, e.g. total_lines or total_skills")
+    series.add_argument("--skill", help="Skill name (omit for ecosystem-wide metrics)")
+    series.add_argument("--since", help="ISO timestamp lower bound")
+    series.add_argument("--json", action="store_true", help="Output JSON")
+
+    subparsers.add_parser("runs", help="List recorded runs")
+
+    importer = subparsers.add_parser("import", help="Import legacy dated JSON files")
+    importer.add_argument("files", nargs="+", type=Path)
+
+    args = parser.parse_args()
+
+    with MetricsStore(args.db) as store:
+        if args.command == "import":
+            count = store.import_json(args.files)
+            print(f"✅ Imported {count} metrics file(s) into {args.db}")
+            if count < len(args.files):
+                print(f"   {len(args.files) - count} already imported, skipped")
+        elif args.command == "runs":
+            for run_id, timestamp in store.runs():
+                print(f"{run_id:>6}  {timestamp}")
+        else:
+            if args.skill:
+                points = store.skill_series(args.metric, args.skill, args.since)
+            else:
+                points = store.ecosystem_series(args.metric, args.since)
+
+            if args.json:
+                print(json.dumps([{"timestamp": ts, "value": v} for ts, v in points], indent=2))
+            elif not points:
+                print(f"No data for {args.metric}" + (f" / {args.skill}" if args.skill else ""))
+            else:
+                for ts, value in points:
+                    print(f"{ts}  {value}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
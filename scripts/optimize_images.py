@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Optimize Images
+Requires: pip install pillow
+
+Generates responsive variants of the website's hero images. For every
+source image matched under website/static/img (by default the *-hero*.png
+files used by the skill docs and components), each width in --widths
+that is not wider than the source is encoded in every --formats format:
+
+    website/static/img/skills/foo-hero.png
+      -> website/static/img/responsive/skills/foo-hero-480.webp
+      -> website/static/img/responsive/skills/foo-hero-960.webp
+      -> website/static/img/responsive/skills/foo-hero-1600.avif
+      ...
+
+Images are encoded in a process pool. A content-hash manifest
+(.cache/images/manifest.json) records each source's hash, the encoding
+options and the variants written, so a re-run only re-encodes sources
+whose content or options changed. Hashes are reused while a file's size
+and mtime are unchanged. Variants of removed sources are deleted; when a
+source fails to encode, variants it had newly written are removed, its
+previous variants and mapping entry are kept and it is retried on the
+next run.
+
+The docs get a mapping from each original URL to its variants, written
+to website/src/data/responsiveImages.json:
+
+    {
+      "/img/skills/foo-hero.png": {
+        "width": 1792, "height": 1024,
+        "sources": {
+          "avif": "/img/responsive/skills/foo-hero-480.avif 480w, ...",
+          "webp": "/img/responsive/skills/foo-hero-480.webp 480w, ..."
+        },
+        "fallback": "/img/responsive/skills/foo-hero-960.webp"
+      }
+    }
+
+AVIF needs a Pillow build with AVIF support (Pillow 11.3+); without it
+AVIF is skipped with a warning.
+
+Usage:
+    python scripts/optimize_images.py
+    python scripts/optimize_images.py --widths 640 1280 --formats webp --workers 8
+    python scripts/optimize_images.py --pattern "covers/*.png" --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PIL import Image, features
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+
+STATIC_DIR = Path("website/static")
+IMG_DIR = STATIC_DIR / "img"
+OUTPUT_DIR = IMG_DIR / "responsive"
+MANIFEST_PATH = Path(".cache/images/manifest.json")
+MAPPING_PATH = Path("website/src/data/responsiveImages.json")
+
+DEFAULT_PATTERNS = ["**/*-hero*.png"]
+DEFAULT_WIDTHS = [480, 960, 1600]
+DEFAULT_FORMATS = ["avif", "webp"]
+
+# Encoder settings per format: (Pillow format name, save kwargs)
+ENCODERS = {
+    "webp": ("WEBP", {"quality": 80, "method": 6}),
+    "avif": ("AVIF", {"quality": 60, "speed": 6}),
+    "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+# Width served by <img src> when srcset is not supported
+FALLBACK_WIDTH = 960
+
+
+def find_project_root() -> Path:
+    """Find the project root by looking for .claude directory."""
+    current = Path.cwd()
+    while current != current.parent:
+        if (current / ".claude").exists():
+            return current
+        current = current.parent
+    return Path.cwd()
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def options_key(widths: List[int], formats: List[str]) -> str:
+    """Fingerprint of everything besides the source that affects the output."""
+    settings = {fmt: ENCODERS[fmt] for fmt in formats}
+    return hashlib.sha1(json.dumps([widths, settings], sort_keys=True).encode()).hexdigest()[:12]
+
+
+def available_formats(formats: List[str]) -> List[str]:
+    """Drop formats this Pillow build cannot encode."""
+    usable = []
+    for fmt in formats:
+        if fmt == "avif" and not features.check("avif"):
+            print("⚠️  Pillow was built without AVIF support; skipping avif")
+            continue
+        usable.append(fmt)
+    return usable
+
+
+def variant_path(rel: str, width: int, fmt: str) -> Path:
+    """Output path (relative to the static dir) of one variant."""
+    source = Path(rel).relative_to(IMG_DIR.relative_to(STATIC_DIR))
+    return OUTPUT_DIR.relative_to(STATIC_DIR) / source.parent / f"{source.stem}-{width}.{fmt}"
+
+
+def has_alpha(image: Image.Image) -> bool:
+    """True if the image has any pixel that is not fully opaque."""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        return image.convert("RGBA").getchannel("A").getextrema()[0] < 255
+    return False
+
+
+def encode(job: Dict) -> Dict:
+    """Encode all variants of one source image (runs in a worker process)."""
+    static_dir = Path(job["static_dir"])
+    outputs = []
+
+    # Variants this call created; removed again if a later variant fails,
+    # since no manifest entry will reference them
+    created: List[Path] = []
+
+    try:
+        with Image.open(static_dir / job["rel"]) as image:
+            image.load()
+            width, height = image.size
+            base = image.convert("RGBA" if has_alpha(image) else "RGB")
+
+            # Widths wider than the source are replaced by the source width
+            targets = sorted({min(w, width) for w in job["widths"]})
+            for target in targets:
+                resized = base if target == width else base.resize(
+                    (target, round(height * target / width)), Image.LANCZOS)
+                for fmt in job["formats"]:
+                    pil_format, params = ENCODERS[fmt]
+                    frame = resized.convert("RGB") if pil_format == "JPEG" else resized
+                    out_rel = variant_path(job["rel"], target, fmt)
+                    out_path = static_dir / out_rel
+                    out_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = out_path.with_name(out_path.name + ".tmp")
+                    existed = out_path.exists()
+                    try:
+                        frame.save(tmp_path, format=pil_format, **params)
+                        os.replace(tmp_path, out_path)
+                    except BaseException:
+                        tmp_path.unlink(missing_ok=True)
+                        raise
+                    if not existed:
+                        created.append(out_path)
+                    outputs.append({
+                        "path": out_rel.as_posix(),
+                        "format": fmt,
+                        "width": target,
+                        "bytes": out_path.stat().st_size,
+                    })
+    except BaseException:
+        for path in created:
+            path.unlink(missing_ok=True)
+        raise
+
+    return {
+        "rel": job["rel"],
+        "hash": job["hash"],
+        "size": job["size"],
+        "mtime_ns": job["mtime_ns"],
+        "width": width,
+        "height": height,
+        "outputs": outputs,
+    }
+
+
+def load_manifest(path: Path) -> Dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("images", {})
+
+
+def save_json(path: Path, data: Dict, indent: Optional[int] = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=indent, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def build_mapping(images: Dict) -> Dict:
+    """Map each original URL to srcset strings per format."""
+    mapping = {}
+    for rel, entry in sorted(images.items()):
+        by_format: Dict[str, List[Dict]] = {}
+        for output in entry["outputs"]:
+            by_format.setdefault(output["format"], []).append(output)
+
+        sources = {}
+        for fmt, outputs in by_format.items():
+            outputs.sort(key=lambda o: o["width"])
+            sources[fmt] = ", ".join(f"/{o['path']} {o['width']}w" for o in outputs)
+
+        # The most widely supported format, at the width closest to FALLBACK_WIDTH
+        fallback_format = next((f for f in ("jpg", "webp", "avif") if f in by_format), None)
+        fallback = None
+        if fallback_format:
+            best = min(by_format[fallback_format], key=lambda o: abs(o["width"] - FALLBACK_WIDTH))
+            fallback = f"/{best['path']}"
+
+        mapping[f"/{rel}"] = {
+            "width": entry["width"],
+            "height": entry["height"],
+            "sources": sources,
+            "fallback": fallback,
+        }
+    return mapping
+
+
+def remove_outputs(static_dir: Path, outputs: List[Dict], keep: set) -> int:
+    removed = 0
+    for output in outputs:
+        if output["path"] not in keep:
+            try:
+                (static_dir / output["path"]).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate responsive variants of hero images")
+    parser.add_argument("--pattern", action="append", dest="patterns",
+                        help=f"Glob under website/static/img (repeatable, default: {DEFAULT_PATTERNS})")
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS,
+                        help=f"Variant widths in px (default: {DEFAULT_WIDTHS})")
+    parser.add_argument("--formats", nargs="+", choices=list(ENCODERS), default=DEFAULT_FORMATS,
+                        help=f"Output formats (default: {DEFAULT_FORMATS})")
+    parser.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--force", action="store_true", help="Re-encode every image")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be encoded")
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    static_dir = project_root / STATIC_DIR
+    img_dir = project_root / IMG_DIR
+    manifest_path = project_root / MANIFEST_PATH
+    output_dir = project_root / OUTPUT_DIR
+
+    formats = available_formats(args.formats)
+    if not formats:
+        print("❌ No usable output formats")
+        return 1
+    widths = sorted(set(args.widths))
+    options = options_key(widths, formats)
+
+    print("🖼️  Optimizing hero images")
+    print(f"   Widths: {widths}  Formats: {formats}")
+
+    start = time.perf_counter()
+    sources = set()
+    for pattern in args.patterns or DEFAULT_PATTERNS:
+        for path in img_dir.glob(pattern):
+            if path.is_file() and output_dir not in path.parents:
+                sources.add(path)
+
+    previous = load_manifest(manifest_path)
+    images = {}
+    jobs = []
+    for path in sorted(sources):
+        rel = path.relative_to(static_dir).as_posix()
+        stat = path.stat()
+        entry = previous.get(rel)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            digest = entry["hash"]
+        else:
+            digest = hash_file(path)
+
+        if (not args.force and entry and entry["hash"] == digest and entry.get("options") == options
+                and all((static_dir / o["path"]).exists() for o in entry["outputs"])):
+            images[rel] = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            continue
+        jobs.append({
+            "rel": rel, "hash": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "widths": widths, "formats": formats, "static_dir": str(static_dir),
+        })
+
+    print(f"   {len(sources)} sources: {len(jobs)} to encode, {len(images)} unchanged")
+    if args.dry_run:
+        for job in jobs:
+            print(f"   would encode {job['rel']}")
+        return 0
+
+    failures = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {executor.submit(encode, job): job["rel"] for job in jobs}
+            for future in as_completed(futures):
+                rel = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"   ❌ {rel}: {e}")
+                    failures += 1
+                    # Keep serving the last good variants; the old hash
+                    # makes the next run retry this source
+                    if rel in previous:
+                        images[rel] = previous[rel]
+                    continue
+                result["options"] = options
+                images[rel] = result
+                print(f"   ✅ {rel} -> {len(result['outputs'])} variants")
+
+    # Delete variants that are no longer produced (removed sources, changed widths/formats)
+    keep = {o["path"] for entry in images.values() for o in entry["outputs"]}
+    removed = sum(remove_outputs(static_dir, entry.get("outputs", []), keep)
+                  for entry in previous.values())
+
+    save_json(manifest_path, {"version": MANIFEST_VERSION, "images": images})
+    save_json(project_root / MAPPING_PATH, build_mapping(images), indent=2)
+
+    original_bytes = sum(entry["size"] for entry in images.values())
+    # Bytes a browser downloads at the fallback width in the smallest format
+    served_bytes = 0
+    for entry in images.values():
+        if entry["outputs"]:
+            closest = min({o["width"] for o in entry["outputs"]}, key=lambda w: abs(w - FALLBACK_WIDTH))
+            served_bytes += min(o["bytes"] for o in entry["outputs"] if o["width"] == closest)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n📦 Originals: {original_bytes / 1048576:.1f} MB")
+    if original_bytes:
+        print(f"📉 Served at ~{FALLBACK_WIDTH}px: {served_bytes / 1048576:.1f} MB "
+              f"({served_bytes / original_bytes:.0%} of originals)")
+    if removed:
+        print(f"🧹 Removed {removed} stale variants")
+    print(f"🗺️  Mapping: {MAPPING_PATH}")
+    print(f"⏱️  {elapsed:.1f}s ({len(jobs)} encoded)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Patch Skill Docs
+
+Applies registered transforms to the skill docs under website/docs/skills
+in one pass per file:
+
+- hero         Insert the skill's hero image (/img/skills/<id>-hero.png)
+               after an inline <SkillHeader /> or else after the first
+               "# " heading. Docs served at /docs/skills/<folder> (index.md,
+               <folder>/<folder>.md, flat <folder>.md, or a slug pointing
+               there) are skipped: the DocItem/Content theme wrapper
+               already renders their SkillHeader, hero included.
+- skillheader  Fix inline <SkillHeader /> props the way validate-skill-props.js
+               expects: skillId= becomes fileName=, deprecated difficulty=
+               and category= props are dropped, and double quotes inside
+               description="..." are escaped as &quot;.
+
+Skill ids and hero images are discovered from the filesystem (the doc's
+folder name, and website/static/img/skills/<id>-hero.*), so nothing is
+hard-coded. Each file is read and split into lines once, with fenced
+code blocks marked so transforms never edit code examples. Files are
+processed in a worker pool and only written when their content changed,
+so re-running is a no-op. --dry-run prints unified diffs instead.
+
+Usage:
+    python scripts/patch_skill_docs.py --dry-run
+    python scripts/patch_skill_docs.py --transform skillheader
+    python scripts/patch_skill_docs.py --skill adhd_design_expert --workers 4
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+DOCS_DIR = Path("website/docs/skills")
+# URL of DOCS_DIR (Docusaurus routeBasePath "docs" + the folder)
+DOCS_ROUTE = "/docs/skills"
+# Folder-index file names, as Docusaurus treats them (case-insensitive)
+INDEX_STEMS = {"index", "readme"}
+HERO_DIR = Path("website/static/img/skills")
+HERO_EXTENSIONS = [".png", ".webp", ".jpg"]
+
+DEPRECATED_HEADER_PROPS = ["difficulty", "category"]
+
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+SLUG_RE = re.compile(r"^slug:\s*['\"]?([^'\"\s]*)['\"]?\s*$")
+# The closing quote is the first one followed by another prop, the tag end or end of line
+DESCRIPTION_RE = re.compile(r'(description=")(.*?)("(?=\s+\w+=|\s*/?>|\s*$))')
+
+
+def find_project_root() -> Path:
+    """Find the project root by looking for .claude directory."""
+    current = Path.cwd()
+    while current != current.parent:
+        if (current / ".claude").exists():
+            return current
+        current = current.parent
+    return Path.cwd()
+
+
+# =============================================================================
+# Parsed doc
+# =============================================================================
+
+@dataclass
+class Doc:
+    """A skill doc split into lines, with fenced code lines marked."""
+    rel: str
+    folder: str
+    skill_id: str
+    route: str
+    lines: List[str]
+    fenced: List[bool] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, docs_dir: Path, path: Path, text: str) -> "Doc":
+        rel = path.relative_to(docs_dir)
+        folder = rel.parts[0] if len(rel.parts) > 1 else rel.stem
+        lines = text.split("\n")
+
+        fenced = []
+        in_fence = False
+        for line in lines:
+            if FENCE_RE.match(line):
+                fenced.append(True)
+                in_fence = not in_fence
+            else:
+                fenced.append(in_fence)
+
+        return cls(
+            rel=rel.as_posix(),
+            folder=folder,
+            skill_id=folder.replace("_", "-"),
+            route=doc_route(rel, lines),
+            lines=lines,
+            fenced=fenced,
+        )
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def is_skill_page(self) -> bool:
+        """True if the doc is served at the skill's own page, /docs/skills/<folder>."""
+        return re.match(rf"^{DOCS_ROUTE}/{re.escape(self.folder)}/?$", self.route) is not None
+
+    def body_start(self) -> int:
+        """Index of the first line after the frontmatter."""
+        if self.lines and self.lines[0].strip() == "---":
+            for i in range(1, len(self.lines)):
+                if self.lines[i].strip() == "---":
+                    return i + 1
+        return 0
+
+    def prose(self):
+        """(index, line) of body lines outside fenced code."""
+        for i in range(self.body_start(), len(self.lines)):
+            if not self.fenced[i]:
+                yield i, self.lines[i]
+
+    def find_skill_header(self) -> Optional[Tuple[int, int]]:
+        """Line span [start, end] of the first inline <SkillHeader ... />."""
+        for i, line in self.prose():
+            if "<SkillHeader" in line:
+                for j in range(i, len(self.lines)):
+                    if "/>" in self.lines[j]:
+                        return i, j
+                return None
+        return None
+
+    def first_heading(self) -> Optional[int]:
+        for i, line in self.prose():
+            if line.startswith("# "):
+                return i
+        return None
+
+    def insert(self, index: int, new_lines: List[str]) -> None:
+        self.lines[index:index] = new_lines
+        self.fenced[index:index] = [False] * len(new_lines)
+
+    def replace(self, start: int, end: int, new_lines: List[str]) -> None:
+        """Replace lines start..end (inclusive); new lines are never fenced."""
+        self.lines[start:end + 1] = new_lines
+        self.fenced[start:end + 1] = [False] * len(new_lines)
+
+
+def doc_route(rel: Path, lines: List[str]) -> str:
+    """
+    URL a doc is served at, following Docusaurus' rules: a frontmatter slug
+    wins; otherwise index.md, README.md and a file named after its folder
+    are served at the folder's URL.
+    """
+    dirs = list(rel.parts[:-1])
+    if lines and lines[0].strip() == "---":
+        for line in lines[1:]:
+            if line.strip() == "---":
+                break
+            match = SLUG_RE.match(line)
+            if match:
+                slug = match.group(1)
+                if slug.startswith("/"):
+                    return "/docs" + slug
+                return "/".join([DOCS_ROUTE, *dirs, slug])
+
+    stem = rel.stem
+    if stem.lower() in INDEX_STEMS or (dirs and stem == dirs[-1]):
+        return "/".join([DOCS_ROUTE, *dirs])
+    return "/".join([DOCS_ROUTE, *dirs, stem])
+
+
+# =============================================================================
+# Transforms
+# =============================================================================
+
+# name -> fn(doc, context) returning True if it changed the doc
+TRANSFORMS: Dict[str, Callable[[Doc, Dict], bool]] = {}
+
+
+def transform(name: str):
+    def register(fn):
+        TRANSFORMS[name] = fn
+        return fn
+    return register
+
+
+@transform("hero")
+def insert_hero(doc: Doc, context: Dict) -> bool:
+    hero = context["heroes"].get(doc.skill_id)
+    if not hero or doc.is_skill_page:
+        return False
+
+    # Any existing reference to this skill's hero counts, whatever its alt text or format
+    marker = f"/img/skills/{doc.skill_id}-hero"
+    if any(marker in line for _, line in doc.prose()):
+        return False
+
+    header = doc.find_skill_header()
+    anchor = header[1] if header else doc.first_heading()
+    if anchor is None:
+        return False
+
+    block = ["", f"![Hero Banner]({hero})"]
+    # Keep one blank line between the hero and what follows
+    if anchor + 1 < len(doc.lines) and doc.lines[anchor + 1].strip():
+        block.append("")
+    doc.insert(anchor + 1, block)
+    return True
+
+
+@transform("skillheader")
+def fix_skill_header(doc: Doc, context: Dict) -> bool:
+    span = doc.find_skill_header()
+    if not span:
+        return False
+    start, end = span
+    original = doc.lines[start:end + 1]
+    fixed = []
+
+    for line in original:
+        line = line.replace("skillId=", "fileName=")
+        if any(re.match(rf"\s*{prop}=", line) for prop in DEPRECATED_HEADER_PROPS):
+            continue
+        for prop in DEPRECATED_HEADER_PROPS:
+            line = re.sub(rf'\s+{prop}=(?:"[^"]*"|\{{[^}}]*\}})', "", line)
+
+        match = DESCRIPTION_RE.search(line)
+        if match:
+            inner = match.group(2).replace('"', "&quot;")
+            line = line[:match.start()] + match.group(1) + inner + match.group(3) + line[match.end():]
+        fixed.append(line)
+
+    if fixed == original:
+        return False
+    doc.replace(start, end, fixed)
+    return True
+
+
+# =============================================================================
+# Discovery and processing
+# =============================================================================
+
+def discover_docs(docs_dir: Path, skills: Optional[List[str]] = None) -> List[Path]:
+    """Top-level skill docs: <folder>/index.md, <folder>/<folder>.md and flat *.md files."""
+    paths = []
+    for path in sorted(docs_dir.glob("*.md")):
+        if not skills or path.stem in skills:
+            paths.append(path)
+    for folder in sorted(p for p in docs_dir.iterdir() if p.is_dir()):
+        if skills and folder.name not in skills:
+            continue
+        for name in ("index.md", f"{folder.name}.md"):
+            if (folder / name).is_file():
+                paths.append(folder / name)
+    return paths
+
+
+def discover_heroes(hero_dir: Path) -> Dict[str, str]:
+    """skill id -> hero image URL, preferring formats in HERO_EXTENSIONS order."""
+    heroes = {}
+    if not hero_dir.exists():
+        return heroes
+    for ext in reversed(HERO_EXTENSIONS):
+        for path in hero_dir.glob(f"*-hero{ext}"):
+            heroes[path.name[:-len(f"-hero{ext}")]] = f"/img/skills/{path.name}"
+    return heroes
+
+
+# Set in each worker by init_worker()
+CONTEXT: Dict = {}
+
+
+def init_worker(context: Dict) -> None:
+    CONTEXT.update(context)
+
+
+def process(path_str: str) -> Dict:
+    """Parse one doc, run the selected transforms and write it if it changed."""
+    path = Path(path_str)
+    docs_dir = Path(CONTEXT["docs_dir"])
+    try:
+        original = path.read_text(encoding="utf-8")
+        doc = Doc.parse(docs_dir, path, original)
+        applied = [name for name in CONTEXT["transforms"] if TRANSFORMS[name](doc, CONTEXT)]
+        updated = doc.text
+    except Exception as e:
+        return {"rel": path_str, "error": str(e)}
+
+    result = {"rel": doc.rel, "applied": applied, "changed": updated != original}
+    if not result["changed"]:
+        return result
+
+    if CONTEXT["dry_run"]:
+        result["diff"] = "".join(difflib.unified_diff(
+            original.splitlines(keepends=True), updated.splitlines(keepends=True),
+            fromfile=f"a/{doc.rel}", tofile=f"b/{doc.rel}"))
+    else:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(updated, encoding="utf-8")
+        os.replace(tmp_path, path)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply batch fixes to skill docs")
+    parser.add_argument("--transform", "-t", action="append", choices=list(TRANSFORMS),
+                        help="Transform to apply (repeatable, default: all)")
+    parser.add_argument("--skill", action="append", help="Only this skill folder (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Print diffs instead of writing")
+    parser.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    docs_dir = project_root / DOCS_DIR
+    if not docs_dir.exists():
+        print(f"❌ Docs directory not found: {docs_dir}")
+        return 1
+
+    paths = discover_docs(docs_dir, args.skill)
+    context = {
+        "docs_dir": str(docs_dir),
+        "heroes": discover_heroes(project_root / HERO_DIR),
+        "transforms": args.transform or list(TRANSFORMS),
+        "dry_run": args.dry_run,
+    }
+
+    print(f"🔧 Patching {len(paths)} docs with: {', '.join(context['transforms'])}")
+    if args.dry_run:
+        print("   (dry run, nothing is written)")
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=init_worker,
+                             initargs=(context,)) as executor:
+        results = list(executor.map(process, [str(p) for p in paths], chunksize=16))
+
+    changed = errors = 0
+    counts = {name: 0 for name in context["transforms"]}
+    for result in results:
+        if "error" in result:
+            errors += 1
+            print(f"   ❌ {result['rel']}: {result['error']}")
+            continue
+        for name in result["applied"]:
+            counts[name] += 1
+        if result["changed"]:
+            changed += 1
+            if args.dry_run:
+                sys.stdout.write(result["diff"])
+            else:
+                print(f"   ✅ {result['rel']} ({', '.join(result['applied'])})")
+
+    verb = "would change" if args.dry_run else "changed"
+    print(f"\n📊 {changed} {verb}, {len(results) - changed - errors} unchanged, {errors} errors")
+    for name, count in counts.items():
+        print(f"   {name}: {count}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Pipeline Logger
+
+Buffered, rotating JSON-lines logging for long-running scripts such as
+scan-and-ingest-skills.py.
+
+- Records are kept in memory and written to the log file in batches: when
+  the buffer fills, when an ERROR is logged, and at every phase boundary.
+  The file is opened once per run instead of once per message.
+- The file rotates at MAX_BYTES, keeping BACKUP_COUNT old files.
+- Each line is a JSON object with ts, level, phase and msg, plus any
+  keyword fields passed to the logging call.
+- phase() times a block and logs its duration and counters on exit.
+- In summary mode, skip() only counts skipped items per reason; the counts
+  are logged once when the phase ends instead of one line per item.
+
+Console output keeps the "[timestamp] [LEVEL] message" format.
+
+Usage:
+    logger = PipelineLogger("skill-scan", Path("logs/skill-scan.jsonl"), summary=True)
+    with logger.phase("crawl"):
+        logger.info("Found skill files", count=12)
+        logger.skip("existing", "some-skill")
+    logger.close()
+"""
+
+import json
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+
+# Records buffered in memory before a write
+BUFFER_CAPACITY = 1000
+
+LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "phase": getattr(record, "phase", None),
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """The scripts' traditional "[timestamp] [LEVEL] message" format."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        level = "WARN" if record.levelno == logging.WARNING else record.levelname
+        return f"[{timestamp}] [{level}] {record.getMessage()}"
+
+
+class PipelineLogger:
+    """JSON-lines logger with buffering, phases and skip aggregation."""
+
+    def __init__(
+        self,
+        name: str,
+        log_file: Path,
+        level: int = logging.INFO,
+        summary: bool = False,
+        console: bool = True,
+        max_bytes: int = MAX_BYTES,
+        backup_count: int = BACKUP_COUNT,
+        capacity: int = BUFFER_CAPACITY,
+    ):
+        self.summary = summary
+        self._phase: Optional[str] = None
+        self._counters: Counter = Counter()
+        self._skips: Counter = Counter()
+        self._lock = threading.Lock()
+
+        self._logger = logging.Logger(name, level)
+
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(JsonLinesFormatter())
+        self._file_handler = file_handler
+        self._buffer = logging.handlers.MemoryHandler(
+            capacity, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+        )
+        self._logger.addHandler(self._buffer)
+
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(ConsoleFormatter())
+            self._logger.addHandler(console_handler)
+
+    # -------------------------------------------------------------------------
+    # Logging
+    # -------------------------------------------------------------------------
+
+    def log(self, level: int, message: str, **fields: Any) -> None:
+        self._logger.log(level, message, extra={"phase": self._phase, "fields": fields})
+
+    def debug(self, message: str, **fields: Any) -> None:
+        self.log(logging.DEBUG, message, **fields)
+
+    def info(self, message: str, **fields: Any) -> None:
+        self.log(logging.INFO, message, **fields)
+
+    def warning(self, message: str, **fields: Any) -> None:
+        self.log(logging.WARNING, message, **fields)
+
+    def error(self, message: str, **fields: Any) -> None:
+        self.log(logging.ERROR, message, **fields)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter reported when the current phase ends."""
+        with self._lock:
+            self._counters[counter] += amount
+
+    def skip(self, reason: str, message: str, level: int = logging.INFO, **fields: Any) -> None:
+        """Log a skipped item, or only count it in summary mode."""
+        with self._lock:
+            self._skips[reason] += 1
+        if not self.summary:
+            self.log(level, message, skip=reason, **fields)
+
+    # -------------------------------------------------------------------------
+    # Phases
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a pipeline phase; log its counters and flush on exit."""
+        outer = (self._phase, self._counters, self._skips)
+        self._phase = name
+        self._counters = Counter()
+        self._skips = Counter()
+        start = time.perf_counter()
+        self.debug(f"Phase started: {name}", event="phase_start")
+
+        try:
+            yield
+        finally:
+            fields: Dict[str, Any] = {
+                "event": "phase_end",
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            }
+            if self._counters:
+                fields["counters"] = dict(self._counters)
+            if self._skips:
+                fields["skipped"] = dict(self._skips)
+
+            message = f"Phase finished: {name} ({fields['duration_ms'] / 1000:.2f}s)"
+            if self.summary and self._skips:
+                message += ", skipped " + ", ".join(f"{n} {r}" for r, n in sorted(self._skips.items()))
+            self.info(message, **fields)
+
+            self._phase, self._counters, self._skips = outer
+            self.flush()
+
+    def flush(self) -> None:
+        self._buffer.flush()
+
+    def close(self) -> None:
+        """Flush buffered records and close the log file."""
+        for handler in list(self._logger.handlers):
+            handler.close()
+            self._logger.removeHandler(handler)
+        self._file_handler.close()
@@ -3,26 +3,54 @@
 Skill Scanner and Ingester
 Scans ~/coding/ recursively for Claude skills and ingests them into the website.
 
+Sources are tracked in an ingest manifest (see ingest_manifest.py), so
+updated upstream skills are re-ingested, moved sources are recognized and
+identical copies under other paths are skipped. Only changed files are
+copied.
+
 Run manually: python3 scripts/scan-and-ingest-skills.py
 Run with --dry-run to see what would be ingested without making changes.
+Run with --log-summary to log skip counts per phase instead of one line per
+skipped skill. The structured log is logs/skill-scan.jsonl (see
+pipeline_log.py).
 """
 
-import os
+import hashlib
 import re
 import sys
 import json
-import shutil
+import logging
+import time
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from frontmatter_parser import parse_frontmatter
+from ingest_manifest import (
+    ADOPTED, CHANGED, DUPLICATE, EXISTING, MOVED, NEW, UNCHANGED, Decision, FileTable, IngestManifest,
+    destination_name, scan_source, sync_files, tree_hash
+)
+from pipeline_log import LEVELS, PipelineLogger
+from skill_crawler import DEFAULT_WORKERS, SkillCrawler
+
 # Configuration
 SCAN_ROOT = Path.home() / "coding"
 REPO_ROOT = Path(__file__).parent.parent
 SKILLS_DIR = REPO_ROOT / ".claude" / "skills"
 HERO_IMAGES_DIR = REPO_ROOT / "website" / "static" / "img" / "skills"
-LOG_FILE = REPO_ROOT / "logs" / "skill-scan.log"
+LOG_FILE = REPO_ROOT / "logs" / "skill-scan.jsonl"
+CACHE_DIR = REPO_ROOT / ".cache" / "skill-scan"
+DIR_CACHE_FILE = CACHE_DIR / "directories.json"
+MANIFEST_FILE = CACHE_DIR / "ingest-manifest.json"
+RESULTS_FILE = REPO_ROOT / "logs" / "skill-ingest-results.jsonl"
+
+# Site data regenerated by npm run skills:generate
+GENERATED_PATHS = ["website/src/data", "website/docs/skills"]
+
+# Copy, frontmatter and hero checks are I/O bound
+DEFAULT_INGEST_WORKERS = 8
 
 # Directories to skip
 SKIP_DIRS = {
@@ -35,53 +63,37 @@ SKIP_DIRS = {
 SKILL_PATTERNS = ["SKILL.md", "skill.md"]
 
 
-def log(message: str, level: str = "INFO"):
-    """Log message to console and file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    formatted = f"[{timestamp}] [{level}] {message}"
-    print(formatted)
+logger = PipelineLogger("skill-scan", LOG_FILE)
 
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(LOG_FILE, "a") as f:
-        f.write(formatted + "\n")
 
+def log(message: str, level: str = "INFO", **fields):
+    """Log message to console and the JSON-lines scan log (buffered)."""
+    logger.log(LEVELS[level], message, **fields)
 
-def find_skill_files() -> list[Path]:
-    """Recursively find all skill files in ~/coding/."""
-    skill_files = []
 
-    for root, dirs, files in os.walk(SCAN_ROOT):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for pattern in SKILL_PATTERNS:
-            if pattern in files:
-                skill_path = Path(root) / pattern
-                skill_files.append(skill_path)
+def find_skill_files(
+    max_depth: int | None = None,
+    workers: int = DEFAULT_WORKERS,
+    use_cache: bool = True
+) -> list[Path]:
+    """Find all skill files in ~/coding/ (see skill_crawler.py)."""
+    crawler = SkillCrawler(
+        SCAN_ROOT,
+        SKILL_PATTERNS,
+        SKIP_DIRS,
+        max_depth=max_depth,
+        workers=workers,
+        cache_path=DIR_CACHE_FILE if use_cache else None,
+    )
+    skill_files = crawler.crawl()
+    crawler.save_cache()
 
+    log(f"Crawled {crawler.stats['listed']} directories, "
+        f"{crawler.stats['cached']} unchanged, {crawler.stats['pruned']} pruned",
+        **crawler.stats)
     return skill_files
 
 
-def parse_frontmatter(content: str) -> dict | None:
-    """Extract YAML frontmatter from skill file."""
-    if not content.startswith("---"):
-        return None
-
-    try:
-        end = content.index("---", 3)
-        frontmatter = content[3:end].strip()
-
-        result = {}
-        for line in frontmatter.split("\n"):
-            if ":" in line and not line.startswith(" ") and not line.startswith("-"):
-                key, value = line.split(":", 1)
-                result[key.strip()] = value.strip()
-
-        return result
-    except (ValueError, IndexError):
-        return None
-
-
 def sanitize_skill_name(name: str) -> str:
     """Sanitize skill name to be filesystem and URL safe."""
     # Convert to lowercase
@@ -99,18 +111,38 @@ def sanitize_skill_name(name: str) -> str:
 
 def get_skill_name(skill_path: Path, content: str) -> str | None:
     """Extract skill name from frontmatter or directory name."""
-    frontmatter = parse_frontmatter(content)
+    frontmatter, _ = parse_frontmatter(content, lenient=True)
 
-    if frontmatter and "name" in frontmatter:
-        return sanitize_skill_name(frontmatter["name"])
+    if frontmatter.get("name"):
+        return sanitize_skill_name(str(frontmatter["name"]))
 
     # Use parent directory name as fallback
     return sanitize_skill_name(skill_path.parent.name)
 
 
-def skill_exists(skill_name: str) -> bool:
-    """Check if skill already exists in our repo."""
-    return (SKILLS_DIR / skill_name).exists()
+def skill_tree_hash(skill_name: str) -> str | None:
+    """Content hash of a skill already in our repo, None if it does not exist."""
+    skill_dir = SKILLS_DIR / skill_name
+    if not skill_dir.exists():
+        return None
+    return tree_hash(scan_source(skill_dir, SKIP_DIRS))
+
+
+def ingested_tree_hash(source_dir: Path, files: FileTable, skill_name: str) -> str:
+    """
+    tree_hash() of a source as ingest_skill() would leave it in our repo:
+    files renamed by sync_files() and frontmatter added to SKILL.md.
+    """
+    ingested = {}
+    for rel, info in files.items():
+        dest = destination_name(rel)
+        if dest == "SKILL.md":
+            content = (source_dir / rel).read_text()
+            if needs_frontmatter(content):
+                patched = (generate_frontmatter(skill_name, content) + content).encode("utf-8")
+                info = dict(info, hash=hashlib.sha256(patched).hexdigest())
+        ingested[dest] = info
+    return tree_hash(ingested)
 
 
 def needs_frontmatter(content: str) -> bool:
@@ -151,29 +183,27 @@ tags:
     return frontmatter
 
 
-def copy_skill(skill_path: Path, skill_name: str, dry_run: bool = False) -> bool:
-    """Copy skill directory to our repo."""
-    source_dir = skill_path.parent
-    dest_dir = SKILLS_DIR / skill_name
+def copy_skill(decision: Decision, dry_run: bool = False) -> tuple[list[str], list[str]] | None:
+    """
+    Copy a source skill's changed files into our repo.
+
+    Only files whose content differs from the last ingest (per the
+    manifest) are copied. Returns (copied, removed) paths, or None on failure.
+    """
+    source_dir = Path(decision.source)
+    dest_dir = SKILLS_DIR / decision.skill
 
     if dry_run:
         log(f"[DRY RUN] Would copy {source_dir} -> {dest_dir}")
-        return True
+        return [], []
 
     try:
-        # Copy entire skill directory
-        shutil.copytree(source_dir, dest_dir, dirs_exist_ok=True)
-
-        # Rename skill.md to SKILL.md if needed
-        skill_md = dest_dir / "skill.md"
-        if skill_md.exists():
-            skill_md.rename(dest_dir / "SKILL.md")
-
-        log(f"Copied skill: {skill_name}")
-        return True
+        copied, removed = sync_files(source_dir, dest_dir, decision.files, decision.previous_files)
+        log(f"Copied skill: {decision.skill} ({len(copied)} file(s) copied, {len(removed)} removed)")
+        return copied, removed
     except Exception as e:
-        log(f"Failed to copy {skill_name}: {e}", "ERROR")
-        return False
+        log(f"Failed to copy {decision.skill}: {e}", "ERROR")
+        return None
 
 
 def add_frontmatter_if_needed(skill_name: str, dry_run: bool = False) -> bool:
@@ -216,15 +246,75 @@ def generate_hero_image(skill_name: str, dry_run: bool = False) -> bool:
     return False
 
 
-def run_skill_generation(dry_run: bool = False) -> bool:
-    """Run the skill generation script."""
+def ingest_skill(decision: Decision, dry_run: bool = False) -> dict:
+    """
+    Copy, frontmatter-patch and hero-check one new, changed or moved skill.
+
+    Runs on the ingest worker pool; returns the skill's result record.
+    """
+    start = time.perf_counter()
+    result = {
+        "skill": decision.skill,
+        "source": decision.source,
+        "status": decision.status,
+        "outcome": "failed",
+        "copied": [],
+        "removed": [],
+        "hero_image": None,
+        "error": None,
+    }
+
+    try:
+        log(f"Processing {decision.status} skill: {decision.skill}")
+
+        # Copy changed files
+        synced = copy_skill(decision, dry_run)
+        if synced is None:
+            result["error"] = "copy failed"
+            return result
+        result["copied"], result["removed"] = synced
+
+        # Add frontmatter if needed
+        add_frontmatter_if_needed(decision.skill, dry_run)
+
+        if decision.status == NEW:
+            # Note: Hero image generation needs manual intervention or Claude API
+            result["hero_image"] = generate_hero_image(decision.skill, dry_run)
+            result["outcome"] = "added"
+        elif result["copied"] or result["removed"] or dry_run:
+            result["outcome"] = "updated"
+        else:
+            result["outcome"] = "moved"
+    except Exception as e:
+        log(f"Failed to ingest {decision.skill}: {e}", "ERROR")
+        result["error"] = str(e)
+    finally:
+        result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+    return result
+
+
+def write_results(results: list[dict], run_timestamp: str) -> None:
+    """Append this run's per-skill results to the JSON-lines result log."""
+    if not results:
+        return
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_FILE, "a", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps({"run": run_timestamp, **result}) + "\n")
+
+
+def run_skill_generation(skill_ids: list[str], dry_run: bool = False) -> bool:
+    """Run the skill generation script, regenerating docs for skill_ids only."""
+    cmd = ["npm", "run", "skills:generate", "--", f"--only={','.join(sorted(skill_ids))}"]
+
     if dry_run:
-        log("[DRY RUN] Would run npm run skills:generate")
+        log(f"[DRY RUN] Would run {' '.join(cmd)}")
         return True
 
     try:
         result = subprocess.run(
-            ["npm", "run", "skills:generate"],
+            cmd,
             cwd=REPO_ROOT / "website",
             capture_output=True,
             text=True,
@@ -232,7 +322,7 @@ def run_skill_generation(dry_run: bool = False) -> bool:
         )
 
         if result.returncode == 0:
-            log("Skill generation completed successfully")
+            log(f"Skill generation completed successfully ({len(skill_ids)} skill(s))")
             return True
         else:
             log(f"Skill generation failed: {result.stderr}", "ERROR")
@@ -243,7 +333,7 @@ def run_skill_generation(dry_run: bool = False) -> bool:
 
 
 def git_commit_and_push(skills_added: list[str], dry_run: bool = False) -> bool:
-    """Commit and push changes."""
+    """Commit and push the ingested skills and the files generated from them."""
     if not skills_added:
         log("No new skills to commit")
         return True
@@ -253,8 +343,10 @@ def git_commit_and_push(skills_added: list[str], dry_run: bool = False) -> bool:
         return True
 
     try:
-        # Stage all changes
-        subprocess.run(["git", "add", "-A"], cwd=REPO_ROOT, check=True)
+        # Stage the ingested skills and generated site data only
+        paths = [str(SKILLS_DIR.relative_to(REPO_ROOT) / name) for name in skills_added]
+        paths += GENERATED_PATHS
+        subprocess.run(["git", "add", "--", *paths], cwd=REPO_ROOT, check=True)
 
         # Commit
         skill_list = ", ".join(skills_added[:5])
@@ -282,64 +374,124 @@ def main():
     parser = argparse.ArgumentParser(description="Scan and ingest Claude skills")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
     parser.add_argument("--no-push", action="store_true", help="Don't push changes to remote")
+    parser.add_argument("--max-depth", type=int, help="Maximum directory depth below the scan root")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Crawler threads")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the directory-mtime cache")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_INGEST_WORKERS,
+                        help=f"Ingest worker threads (default: {DEFAULT_INGEST_WORKERS})")
+    parser.add_argument("--log-summary", action="store_true",
+                        help="Count skipped skills per reason instead of logging each one")
     args = parser.parse_args()
+    logger.summary = args.log_summary
+
+    try:
+        return run_scan(args)
+    finally:
+        logger.close()
 
+
+def run_scan(args: argparse.Namespace) -> int:
+    """Crawl, ingest, regenerate and commit (see main)."""
     log("=" * 60)
     log("Starting skill scan" + (" (DRY RUN)" if args.dry_run else ""))
     log(f"Scanning: {SCAN_ROOT}")
     log("=" * 60)
 
     # Find all skill files
-    skill_files = find_skill_files()
-    log(f"Found {len(skill_files)} skill files")
+    with logger.phase("crawl"):
+        skill_files = find_skill_files(args.max_depth, args.workers, not args.no_cache)
+        log(f"Found {len(skill_files)} skill files", count=len(skill_files))
 
-    # Process each skill
+    run_timestamp = datetime.now().isoformat(timespec="seconds")
+    manifest = IngestManifest(MANIFEST_FILE)
     skills_added = []
+    skills_updated = []
     skills_skipped = []
     skills_failed = []
-
-    for skill_path in skill_files:
-        content = skill_path.read_text()
-        skill_name = get_skill_name(skill_path, content)
-
-        if not skill_name:
-            log(f"Could not determine name for {skill_path}", "WARN")
-            skills_failed.append(str(skill_path))
-            continue
-
-        if skill_exists(skill_name):
-            log(f"Skipping existing skill: {skill_name}")
-            skills_skipped.append(skill_name)
-            continue
-
-        log(f"Processing new skill: {skill_name}")
-
-        # Copy skill directory
-        if not copy_skill(skill_path, skill_name, args.dry_run):
-            skills_failed.append(skill_name)
-            continue
-
-        # Add frontmatter if needed
-        add_frontmatter_if_needed(skill_name, args.dry_run)
-
-        # Note: Hero image generation needs manual intervention or Claude API
-        generate_hero_image(skill_name, args.dry_run)
-
-        skills_added.append(skill_name)
-
-    # Run skill generation
-    if skills_added and not args.dry_run:
-        run_skill_generation(args.dry_run)
+    results = []
+    pending = []
+
+    with logger.phase("ingest"):
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            # Hash sources concurrently (stat-only for unchanged files)
+            scanned = executor.map(lambda p: manifest.scan(p.parent, SKIP_DIRS), skill_files)
+
+            # Classify each skill against the ingest manifest. Decisions are
+            # recorded as they are made so later sources in this run see them
+            # (duplicates, name clashes); failed ingests are rolled back below.
+            for skill_path, files in zip(skill_files, scanned):
+                decision = manifest.classify(
+                    skill_path.parent,
+                    files,
+                    lambda: get_skill_name(skill_path, skill_path.read_text()),
+                    skill_tree_hash,
+                    lambda name: ingested_tree_hash(skill_path.parent, files, name),
+                )
+
+                if not decision.skill:
+                    log(f"Could not determine name for {skill_path}", "WARN")
+                    skills_failed.append(str(skill_path))
+                    continue
+
+                replaced = manifest.record(decision)
+
+                if decision.status in (NEW, CHANGED, MOVED):
+                    future = executor.submit(ingest_skill, decision, args.dry_run)
+                    pending.append((future, replaced))
+                    continue
+
+                if decision.status == UNCHANGED:
+                    logger.skip("unchanged", f"Skipping unchanged skill: {decision.skill}",
+                                logging.DEBUG, skill=decision.skill)
+                elif decision.status == EXISTING:
+                    logger.skip("existing", f"Skipping existing skill: {decision.skill}",
+                                skill=decision.skill, source=decision.source)
+                elif decision.status == DUPLICATE:
+                    logger.skip("duplicate", f"Skipping duplicate of {decision.duplicate_of}: {decision.source}",
+                                skill=decision.skill, source=decision.source)
+                elif decision.status == ADOPTED:
+                    log(f"Tracking existing skill: {decision.skill} <- {decision.source}",
+                        skill=decision.skill, source=decision.source)
+                skills_skipped.append(decision.skill)
+                if decision.status != UNCHANGED:
+                    results.append({"skill": decision.skill, "source": decision.source,
+                                    "status": decision.status, "outcome": "skipped"})
+
+            # Collect ingest results
+            for future, replaced in pending:
+                result = future.result()
+                results.append(result)
+                logger.count(result["outcome"])
+                if result["outcome"] == "failed":
+                    manifest.restore(replaced)
+                    skills_failed.append(result["skill"])
+                elif result["outcome"] == "added":
+                    skills_added.append(result["skill"])
+                elif result["outcome"] == "updated":
+                    skills_updated.append(result["skill"])
+
+        if not args.dry_run:
+            manifest.forget_missing(str(p.parent) for p in skill_files)
+            manifest.save()
+            write_results(results, run_timestamp)
+
+    # Run skill generation for the changed skills only
+    changed = skills_added + skills_updated
+    if changed and not args.dry_run:
+        with logger.phase("generate"):
+            run_skill_generation(changed, args.dry_run)
 
     # Commit and push
     if not args.no_push:
-        git_commit_and_push(skills_added, args.dry_run)
+        with logger.phase("git"):
+            git_commit_and_push(changed, args.dry_run)
 
     # Summary
     log("=" * 60)
     log("SCAN COMPLETE")
     log(f"  Added: {len(skills_added)}")
-    log(f"  Skipped (existing): {len(skills_skipped)}")
+    log(f"  Updated: {len(skills_updated)}")
+    log(f"  Skipped (existing, duplicate or unchanged): {len(skills_skipped)}")
     log(f"  Failed: {len(skills_failed)}")
 
     if skills_added:
@@ -347,6 +499,11 @@ def main():
         for skill in skills_added:
             log(f"  - {skill}")
 
+    if skills_updated:
+        log("Updated skills:")
+        for skill in skills_updated:
+            log(f"  - {skill}")
+
     if skills_failed:
         log("Failed skills:", "WARN")
         for skill in skills_failed:
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Skill Crawler
+
+Concurrent filesystem crawler used by scan-and-ingest-skills.py to find
+SKILL.md files under a workspace root (~/coding by default).
+
+- A cold crawl (no cached listings) walks on the calling thread, at
+  os.walk speed, and fills the cache. With a warm cache, directories are
+  checked by a bounded thread pool (min(32, CPUs + 4) threads, as
+  ThreadPoolExecutor defaults to; one CPU walks on the calling thread
+  too). Each task walks a batch of directories
+  and hands the rest back to the pool, so large top-level trees are
+  spread over all workers instead of being walked by one.
+- --compare also times a plain os.walk over the same tree.
+- Directories named in skip_dirs, or ignored by a .gitignore on the way
+  down, are pruned before they are listed.
+- Recursion stops at max_depth levels below the root.
+- A persistent cache stores each directory's mtime with its listing. When
+  the mtime is unchanged (no entries added, removed or renamed) the cached
+  listing is reused instead of calling scandir; subdirectories are still
+  stat'ed, since a change deeper down only updates the mtime of the
+  directory it happened in.
+
+Supported .gitignore syntax: comments, blank lines, '!' negation, leading
+'/' anchoring, trailing '/' and fnmatch wildcards ('**' behaves like '*').
+
+Usage:
+    python scripts/skill_crawler.py ~/coding --max-depth 8 --cache .cache/crawl.json
+    python scripts/skill_crawler.py ~/coding --cache .cache/crawl.json --compare
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+CACHE_VERSION = 1
+
+# ThreadPoolExecutor's default; on one CPU the threads only add switching
+# overhead (a warm crawl of 21k dirs: 0.14s on the calling thread, 0.19s
+# with 5 threads)
+DEFAULT_WORKERS = min(32, os.cpu_count() + 4) if (os.cpu_count() or 1) > 1 else 1
+
+# Directories a worker lists before handing its remaining work back
+BATCH_SIZE = 256
+
+GITIGNORE = ".gitignore"
+
+
+class GitignoreRules:
+    """Patterns of one .gitignore file, matched against directory paths."""
+
+    def __init__(self, base: str, patterns: List[str]):
+        self.base = base
+        self.patterns = patterns
+        self._rules: List[Tuple["re.Pattern[str]", bool, bool]] = []
+
+        for pattern in patterns:
+            negate = pattern.startswith("!")
+            if negate:
+                pattern = pattern[1:]
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            pattern = pattern.lstrip("/").replace("**/", "*").replace("/**", "/*")
+            if pattern:
+                self._rules.append((re.compile(fnmatch.translate(pattern)), negate, anchored))
+
+    @staticmethod
+    def parse(text: str) -> List[str]:
+        patterns = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                patterns.append(line)
+        return patterns
+
+    def match(self, path: str, name: str) -> Optional[bool]:
+        """True/False if a rule decides whether path is ignored, else None."""
+        result = None
+        relative = None
+        for regex, negate, anchored in self._rules:
+            if anchored:
+                if relative is None:
+                    relative = os.path.relpath(path, self.base).replace(os.sep, "/")
+                matched = regex.match(relative)
+            else:
+                matched = regex.match(name)
+            if matched:
+                result = not negate
+        return result
+
+
+def is_ignored(path: str, name: str, rules: Tuple[GitignoreRules, ...]) -> bool:
+    """Apply .gitignore rules from the outermost to the innermost file."""
+    ignored = False
+    for rule_set in rules:
+        decision = rule_set.match(path, name)
+        if decision is not None:
+            ignored = decision
+    return ignored
+
+
+class SkillCrawler:
+    """Finds skill files below a root directory."""
+
+    def __init__(
+        self,
+        root: Path,
+        patterns: List[str],
+        skip_dirs: Set[str],
+        max_depth: Optional[int] = None,
+        workers: int = DEFAULT_WORKERS,
+        cache_path: Optional[Path] = None,
+        respect_gitignore: bool = True,
+    ):
+        self.root = Path(root)
+        self.patterns = set(patterns)
+        self.skip_dirs = set(skip_dirs)
+        self.max_depth = max_depth
+        self.workers = workers
+        self.cache_path = cache_path
+        self.respect_gitignore = respect_gitignore
+
+        self._cache: Dict[str, Dict] = self._load_cache()
+        self._new_cache: Dict[str, Dict] = {}
+        self.stats = {"listed": 0, "cached": 0, "pruned": 0}
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path:
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != CACHE_VERSION or data.get("root") != str(self.root):
+            return {}
+        return data.get("dirs", {})
+
+    def save_cache(self) -> None:
+        """Persist listings of the directories seen by the last crawl."""
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": CACHE_VERSION, "root": str(self.root), "dirs": self._new_cache}),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.cache_path)
+
+    # -------------------------------------------------------------------------
+    # Listing
+    # -------------------------------------------------------------------------
+
+    def _list_dir(self, path: str, stats: Dict[str, int]) -> Optional[Dict]:
+        """Return {mtime_ns, dirs, files, gitignore} for a directory."""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._cache.get(path)
+        if cached and cached["mtime_ns"] == mtime_ns:
+            if cached.get("gitignore") is not None:
+                try:
+                    gitignore_mtime = os.stat(os.path.join(path, GITIGNORE)).st_mtime_ns
+                except OSError:
+                    gitignore_mtime = None
+                if gitignore_mtime != cached.get("gitignore_mtime_ns"):
+                    cached = None
+            if cached:
+                stats["cached"] += 1
+                return cached
+
+        dirs = []
+        files = []
+        has_gitignore = False
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif entry.name in self.patterns:
+                            files.append(entry.name)
+                        elif entry.name == GITIGNORE:
+                            has_gitignore = True
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+
+        listing = {"mtime_ns": mtime_ns, "dirs": dirs, "files": files, "gitignore": None}
+        if has_gitignore:
+            gitignore_path = os.path.join(path, GITIGNORE)
+            try:
+                listing["gitignore"] = GitignoreRules.parse(
+                    Path(gitignore_path).read_text(encoding="utf-8", errors="ignore"))
+                listing["gitignore_mtime_ns"] = os.stat(gitignore_path).st_mtime_ns
+            except OSError:
+                pass
+
+        stats["listed"] += 1
+        return listing
+
+    def _visit(self, path: str, depth: int, rules: Tuple[GitignoreRules, ...],
+               found: List[str], stack: List[Tuple[str, int, Tuple]], stats: Dict[str, int]) -> None:
+        """List one directory, adding its skill files and subdirectories."""
+        listing = self._list_dir(path, stats)
+        if listing is None:
+            return
+        self._new_cache[path] = listing
+
+        if self.respect_gitignore and listing["gitignore"]:
+            rules = rules + (GitignoreRules(path, listing["gitignore"]),)
+
+        for name in listing["files"]:
+            found.append(os.path.join(path, name))
+
+        if self.max_depth is not None and depth >= self.max_depth:
+            return
+        for name in listing["dirs"]:
+            child = os.path.join(path, name)
+            if name in self.skip_dirs or (rules and is_ignored(child, name, rules)):
+                stats["pruned"] += 1
+                continue
+            stack.append((child, depth + 1, rules))
+
+    def _walk(self, start: List[Tuple[str, int, Tuple]]
+              ) -> Tuple[List[str], List[Tuple[str, int, Tuple]], Dict[str, int]]:
+        """
+        Walk depth-first from the given directories for up to BATCH_SIZE
+        directories; return (skill files, directories left to visit, stats).
+
+        Stats are counted per batch and merged by crawl() on the calling
+        thread, so workers never update shared counters.
+        """
+        found: List[str] = []
+        stack = list(start)
+        stats = dict.fromkeys(self.stats, 0)
+        for _ in range(BATCH_SIZE):
+            if not stack:
+                break
+            self._visit(*stack.pop(), found, stack, stats)
+        return found, stack, stats
+
+    def crawl(self) -> List[Path]:
+        """Return all skill files below the root, sorted by path."""
+        self._new_cache = {}
+        found: List[str] = []
+
+        # Threads only pay off when most directories are a stat plus a
+        # cached listing; a cold crawl is bound by scandir itself
+        if not self._cache or self.workers <= 1:
+            stack: List[Tuple[str, int, Tuple]] = [(str(self.root), 0, ())]
+            while stack:
+                self._visit(*stack.pop(), found, stack, self.stats)
+            return sorted(Path(p) for p in found)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending: Set[Future] = {executor.submit(self._walk, [(str(self.root), 0, ())])}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, remaining, stats = future.result()
+                    found.extend(files)
+                    for key, count in stats.items():
+                        self.stats[key] += count
+                    # Split unfinished work so idle workers can pick it up
+                    if remaining:
+                        chunk = max(1, len(remaining) // self.workers)
+                        for i in range(0, len(remaining), chunk):
+                            pending.add(executor.submit(self._walk, remaining[i:i + chunk]))
+
+        return sorted(Path(p) for p in found)
+
+
+def walk_baseline(root: Path, patterns: List[str], skip_dirs: Set[str]) -> List[Path]:
+    """Plain os.walk over the same tree (no gitignore, no cache), for --compare."""
+    found = []
+    for path, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        found.extend(os.path.join(path, name) for name in files if name in patterns)
+    return sorted(Path(p) for p in found)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find skill files below a directory")
+    parser.add_argument("root", type=Path, help="Directory to crawl")
+    parser.add_argument("--max-depth", type=int, help="Maximum directory depth below root")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Crawler threads")
+    parser.add_argument("--cache", type=Path, help="Directory-mtime cache file")
+    parser.add_argument("--no-gitignore", action="store_true", help="Do not prune .gitignore'd directories")
+    parser.add_argument("--compare", action="store_true", help="Also time a plain os.walk of the root")
+    args = parser.parse_args()
+
+    crawler = SkillCrawler(
+        args.root, ["SKILL.md", "skill.md"], {".git", "node_modules"},
+        max_depth=args.max_depth, workers=args.workers, cache_path=args.cache,
+        respect_gitignore=not args.no_gitignore,
+    )
+    start = time.perf_counter()
+    files = crawler.crawl()
+    elapsed = time.perf_counter() - start
+    crawler.save_cache()
+
+    for path in files:
+        print(path)
+    print(f"{len(files)} skill file(s) in {elapsed:.2f}s "
+          f"(listed {crawler.stats['listed']}, cached {crawler.stats['cached']}, "
+          f"pruned {crawler.stats['pruned']})", file=sys.stderr)
+
+    if args.compare:
+        start = time.perf_counter()
+        baseline = walk_baseline(args.root, ["SKILL.md", "skill.md"], {".git", "node_modules"})
+        print(f"os.walk: {len(baseline)} skill file(s) in {time.perf_counter() - start:.2f}s",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Snapshot Index - Part of The Archivist
+
+Maintains .claude/archive/snapshots/index.json, a small summary of every
+snapshot written by generate_snapshot.py:
+
+    {
+      "version": 1,
+      "snapshots": [
+        {
+          "file": "2024-12-07-1800.json",
+          "timestamp": "2024-12-07T18:00:00+00:00",
+          "summary": {"total_skills": 51, "total_agents": 9, "unique_tools": 12},
+          "changes": {"new_skills": [...], "new_agents": [...], "changed_skills": [...]}
+        }
+      ]
+    }
+
+Entries are sorted by timestamp, so progress reports can select a time
+window and compute trends without opening snapshot files. Snapshots that
+are missing from the index (e.g. written by an older generate_snapshot.py)
+are summarized and added the next time the index is loaded.
+
+Usage:
+    python scripts/snapshot_index.py            # Rebuild the index
+    python scripts/snapshot_index.py --dir PATH
+"""
+
+import argparse
+import bisect
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+SUMMARY_FIELDS = ["total_skills", "total_agents", "unique_tools"]
+CHANGE_FIELDS = ["new_skills", "new_agents", "changed_skills"]
+
+
+def find_project_root() -> Path:
+    """Find the project root by looking for .claude directory."""
+    current = Path.cwd()
+    while current != current.parent:
+        if (current / ".claude").exists():
+            return current
+        current = current.parent
+    return Path.cwd()
+
+
+def parse_timestamp(ts_str: str) -> Optional[datetime]:
+    """Parse snapshot timestamps ("2024-12-07 18:00[:05] UTC" or ISO) as aware UTC."""
+    if not ts_str:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M UTC", "%Y-%m-%d %H:%M:%S UTC"):
+        try:
+            return datetime.strptime(ts_str, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    try:
+        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def timestamp_from_filename(filename: str) -> Optional[datetime]:
+    """Parse the YYYY-MM-DD-HHMM prefix of a snapshot filename."""
+    try:
+        return datetime.strptime(filename[:15], "%Y-%m-%d-%H%M").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def summarize_snapshot(filename: str, snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the index entry for one snapshot document."""
+    ts = parse_timestamp(snapshot.get("timestamp", "")) or timestamp_from_filename(filename)
+    if ts is None:
+        return None
+
+    # Full-state snapshots keep the summary under "state", delta-encoded
+    # ones under "meta"
+    summary = (snapshot.get("state") or snapshot.get("meta") or {}).get("summary", {})
+    delta = snapshot.get("delta", {})
+
+    return {
+        "file": filename,
+        "timestamp": ts.isoformat(),
+        "summary": {field: summary.get(field, 0) for field in SUMMARY_FIELDS},
+        "changes": {field: delta.get(field, []) for field in CHANGE_FIELDS},
+    }
+
+
+def list_snapshot_files(snapshots_dir: Path) -> List[str]:
+    """Snapshot JSON filenames in the directory (names only, no reads)."""
+    with os.scandir(snapshots_dir) as it:
+        return [e.name for e in it
+                if e.name.endswith(".json") and e.name != INDEX_FILENAME and e.is_file()]
+
+
+def _read_index(snapshots_dir: Path) -> List[Dict[str, Any]]:
+    index_path = snapshots_dir / INDEX_FILENAME
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+    if data.get("version") != INDEX_VERSION:
+        return []
+    return data.get("snapshots", [])
+
+
+def write_index(snapshots_dir: Path, entries: List[Dict[str, Any]]) -> None:
+    """
+    Write the index atomically, sorted by timestamp.
+
+    The sort is stable, so of two snapshots taken in the same second the
+    one added last stays last.
+    """
+    entries = sorted(entries, key=lambda e: e["timestamp"])
+    index_path = snapshots_dir / INDEX_FILENAME
+    tmp_path = index_path.with_suffix(".json.tmp")
+    tmp_path.write_text(
+        json.dumps({"version": INDEX_VERSION, "snapshots": entries}, indent=2, ensure_ascii=False),
+        encoding="utf-8"
+    )
+    os.replace(tmp_path, index_path)
+
+
+def load_index(snapshots_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Load index entries sorted by timestamp, repairing the index if needed.
+
+    Only snapshot files missing from the index are opened.
+    """
+    if not snapshots_dir.exists():
+        return []
+
+    entries = _read_index(snapshots_dir)
+    files = set(list_snapshot_files(snapshots_dir))
+    indexed = {e["file"] for e in entries}
+
+    if indexed == files:
+        return entries
+
+    entries = [e for e in entries if e["file"] in files]
+    for filename in sorted(files - indexed):
+        try:
+            snapshot = json.loads((snapshots_dir / filename).read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            continue
+        entry = summarize_snapshot(filename, snapshot)
+        if entry:
+            entries.append(entry)
+
+    write_index(snapshots_dir, entries)
+    return sorted(entries, key=lambda e: e["timestamp"])
+
+
+def update_index(snapshots_dir: Path, filename: str, snapshot: Dict[str, Any]) -> None:
+    """Add or replace the entry for a newly written snapshot."""
+    entries = [e for e in load_index(snapshots_dir) if e["file"] != filename]
+    entry = summarize_snapshot(filename, snapshot)
+    if entry:
+        entries.append(entry)
+    write_index(snapshots_dir, entries)
+
+
+def entries_since(entries: List[Dict[str, Any]], since: Optional[datetime]) -> List[Dict[str, Any]]:
+    """Entries at or after since (entries must be sorted by timestamp)."""
+    if since is None:
+        return entries
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    timestamps = [parse_timestamp(e["timestamp"]) for e in entries]
+    return entries[bisect.bisect_left(timestamps, since):]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the snapshot index")
+    parser.add_argument("--dir", type=Path, help="Snapshots directory (default: .claude/archive/snapshots/)")
+    args = parser.parse_args()
+
+    snapshots_dir = args.dir or find_project_root() / ".claude" / "archive" / "snapshots"
+    if not snapshots_dir.exists():
+        print(f"❌ Snapshots directory not found: {snapshots_dir}")
+        return 1
+
+    index_path = snapshots_dir / INDEX_FILENAME
+    if index_path.exists():
+        index_path.unlink()
+
+    entries = load_index(snapshots_dir)
+    print(f"✅ Indexed {len(entries)} snapshot(s): {index_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store - Part of The Archivist
+
+Delta-encoded storage for the snapshots written by generate_snapshot.py.
+
+Every agent and skill record, and every large derived section of the
+ecosystem state (tool usage, capability graph), is stored once in a
+content-addressed object store keyed by the hash of its canonical JSON:
+
+    snapshots/objects/ab/ab12...ef.json
+
+Snapshot files then only reference objects by hash:
+
+- A base snapshot lists the hash of every agent and skill ("refs").
+- A delta snapshot names its base and lists only the entities that were
+  added, changed or removed relative to that base ("changes").
+
+A new base is written every BASE_INTERVAL snapshots, or earlier when the
+changes since the base grow past BASE_CHANGE_RATIO of its size, so any
+snapshot is reconstructed from at most one base and one delta. Writing a
+delta only touches objects for entities that changed since the previous
+snapshot.
+
+Snapshots written before this format (with the full "state" inline) are
+still readable.
+
+Usage:
+    from snapshot_store import SnapshotStore
+
+    store = SnapshotStore(snapshots_dir)
+    state = store.load_state("2024-12-07-1800.json")
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+STORE_VERSION = 2
+
+OBJECTS_DIRNAME = "objects"
+
+# Entity collections of the ecosystem state stored per record
+ENTITY_KINDS = ["agents", "skills"]
+
+# State sections kept inline in every snapshot (small, read by the index)
+INLINE_SECTIONS = {"summary"}
+
+# Write a new base after this many deltas...
+BASE_INTERVAL = 20
+# ...or once the changes since the base exceed this fraction of it
+BASE_CHANGE_RATIO = 0.25
+
+# Number of reconstructed bases kept in memory by a SnapshotStore
+BASE_CACHE_SIZE = 8
+
+
+def object_hash(value: Any) -> str:
+    """Hash of the canonical JSON encoding of a value."""
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def entity_fingerprint(entity: Dict[str, Any]) -> str:
+    """
+    Content fingerprint of an agent or skill record.
+
+    Records carry the content_hash of their source file, so any edit to the
+    file changes the fingerprint, as does any change to derived fields.
+    """
+    return object_hash(entity)
+
+
+def fingerprint_entities(entities: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map agent or skill names to their content fingerprints."""
+    return {e["name"]: entity_fingerprint(e) for e in entities}
+
+
+def state_refs(state: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Fingerprints of every agent and skill in an ecosystem state."""
+    return {kind: fingerprint_entities(state.get(kind, [])) for kind in ENTITY_KINDS}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class SnapshotStore:
+    """Reads and writes delta-encoded snapshots in a snapshots directory."""
+
+    def __init__(self, snapshots_dir: Path, cache_size: int = BASE_CACHE_SIZE):
+        self.snapshots_dir = Path(snapshots_dir)
+        self.objects_dir = self.snapshots_dir / OBJECTS_DIRNAME
+        self.cache_size = cache_size
+        self._base_cache: "OrderedDict[str, Dict[str, Dict[str, str]]]" = OrderedDict()
+
+    # -------------------------------------------------------------------------
+    # Objects
+    # -------------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json"
+
+    def has_object(self, digest: str) -> bool:
+        return self._object_path(digest).exists()
+
+    def put_object(self, value: Any, digest: Optional[str] = None) -> str:
+        """Store a value under its content hash (no-op if already stored)."""
+        digest = digest or object_hash(value)
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, json.dumps(value, ensure_ascii=False))
+        return digest
+
+    def get_object(self, digest: str) -> Any:
+        return json.loads(self._object_path(digest).read_text(encoding="utf-8"))
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def read(self, filename: str) -> Dict[str, Any]:
+        """Read a snapshot document as stored (no reconstruction)."""
+        return json.loads((self.snapshots_dir / filename).read_text(encoding="utf-8"))
+
+    def _base_refs(self, filename: str) -> Dict[str, Dict[str, str]]:
+        """Entity refs of a base snapshot, through the LRU cache."""
+        cached = self._base_cache.get(filename)
+        if cached is not None:
+            self._base_cache.move_to_end(filename)
+            return cached
+
+        document = self.read(filename)
+        refs = document["refs"] if "refs" in document else state_refs(document["state"])
+
+        self._base_cache[filename] = refs
+        if len(self._base_cache) > self.cache_size:
+            self._base_cache.popitem(last=False)
+        return refs
+
+    def refs(self, filename: str, document: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Entity name -> fingerprint maps of a snapshot.
+
+        Only the snapshot and its base are read; entity objects are not.
+        """
+        document = document if document is not None else self.read(filename)
+        if document.get("kind") != "delta":
+            return {kind: dict(names) for kind, names in self._base_refs(filename).items()}
+
+        base = self._base_refs(document["base"])
+        refs = {}
+        for kind in ENTITY_KINDS:
+            changes = document["changes"].get(kind, {})
+            names = dict(base.get(kind, {}))
+            names.update(changes.get("set", {}))
+            for name in changes.get("removed", []):
+                names.pop(name, None)
+            refs[kind] = names
+        return refs
+
+    def load_state(self, filename: str) -> Dict[str, Any]:
+        """Reconstruct the full ecosystem state of a snapshot."""
+        document = self.read(filename)
+        if "state" in document:
+            return document["state"]
+
+        state = dict(document["meta"])
+        for section, digest in document.get("sections", {}).items():
+            state[section] = self.get_object(digest)
+
+        for kind, names in self.refs(filename, document).items():
+            state[kind] = [self.get_object(names[name]) for name in sorted(names)]
+        return state
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def _needs_base(self, previous: Optional[Dict[str, Any]],
+                    base: Optional[Dict[str, Dict[str, str]]],
+                    changes: Dict[str, Dict[str, Any]]) -> bool:
+        if previous is None or base is None:
+            return True
+        if previous.get("depth", 0) + 1 >= BASE_INTERVAL:
+            return True
+        base_size = sum(len(names) for names in base.values())
+        changed = sum(len(c["set"]) + len(c["removed"]) for c in changes.values())
+        return changed > base_size * BASE_CHANGE_RATIO
+
+    def write(
+        self,
+        filename: str,
+        timestamp: str,
+        state: Dict[str, Any],
+        delta: Dict[str, Any],
+        refs: Dict[str, Dict[str, str]],
+        previous_file: Optional[str] = None,
+        previous_refs: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Write a snapshot of state and return the stored document.
+
+        refs are the state's entity fingerprints (see state_refs()); the
+        previous snapshot's refs, if known, limit object writes to changed
+        entities.
+        """
+        if filename == previous_file:
+            raise ValueError(f"Snapshot {filename} cannot overwrite its own previous snapshot")
+        previous = self.read(previous_file) if previous_file else None
+        base_file = None
+        base = None
+        if previous is not None and "state" not in previous:
+            base_file = previous["base"] if previous.get("kind") == "delta" else previous_file
+            if base_file == filename:
+                raise ValueError(f"Snapshot {filename} cannot be a delta against itself")
+            base = self._base_refs(base_file)
+
+        changes = {}
+        if base is not None:
+            for kind in ENTITY_KINDS:
+                current, base_names = refs.get(kind, {}), base.get(kind, {})
+                changes[kind] = {
+                    "set": {name: fp for name, fp in current.items() if base_names.get(name) != fp},
+                    "removed": sorted(base_names.keys() - current.keys()),
+                }
+
+        is_base = self._needs_base(previous, base, changes)
+
+        # Objects: all entities for a base (cheap existence checks), only
+        # entities changed since the previous snapshot for a delta
+        for kind in ENTITY_KINDS:
+            known = {} if is_base or previous_refs is None else previous_refs.get(kind, {})
+            for entity in state.get(kind, []):
+                digest = refs[kind][entity["name"]]
+                if known.get(entity["name"]) != digest:
+                    self.put_object(entity, digest)
+
+        meta = {}
+        sections = {}
+        for key, value in state.items():
+            if key in ENTITY_KINDS:
+                continue
+            if key in INLINE_SECTIONS or not isinstance(value, (dict, list)):
+                meta[key] = value
+            else:
+                sections[key] = self.put_object(value)
+
+        document: Dict[str, Any] = {
+            "version": STORE_VERSION,
+            "timestamp": timestamp,
+            "kind": "base" if is_base else "delta",
+        }
+        if is_base:
+            document["depth"] = 0
+            document["refs"] = refs
+        else:
+            document["base"] = base_file
+            document["depth"] = previous.get("depth", 0) + 1
+            document["changes"] = changes
+        document["meta"] = meta
+        document["sections"] = sections
+        document["delta"] = delta
+
+        _write_atomic(self.snapshots_dir / filename, json.dumps(document, indent=2, ensure_ascii=False))
+        if is_base:
+            self._base_cache.pop(filename, None)
+        return document
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Sync Skill Docs
+
+Incremental .claude/skills -> website/docs/skills sync. A manifest
+(.cache/docs-sync/manifest.json) records, per skill, the hash of its
+source directory and the hashes of the doc files generated from it:
+
+    {
+      "version": 1,
+      "generator": "5be1...",
+      "catalogue_dirty": false,
+      "skills": {
+        "foo-bar": {
+          "source_hash": "9f2c...",
+          "sources": {"SKILL.md": {"hash": "...", "size": 812, "mtime_ns": ...}},
+          "docs": {"foo_bar.md": {"hash": "...", "size": 1022, "mtime_ns": ...}}
+        }
+      }
+    }
+
+Each run classifies every skill as:
+
+- new        no manifest entry: generate
+- changed    source hash differs, or the generator scripts changed: generate
+- drifted    generated docs missing or edited since the last sync: reported,
+             regenerated with --repair
+- removed    doc folder (or manifest entry) without a source: deleted
+- unchanged  nothing to do
+
+Hashes are reused while a file's size and mtime are unchanged, so an
+unchanged skill costs one stat per file. Docs are rendered by
+generate-skills.ts in one --docs-only run over the changed skills, which
+only parses and validates those skills. Its JSON report says which of them
+failed; the rest are recorded even if another one is broken. A catalogue
+pass then rebuilds skills.ts and skillDescriptions.json. The manifest
+marks the catalogue dirty whenever docs are regenerated or removed and
+clears the mark only once a catalogue pass succeeds, so a failed pass is
+retried on the next run even if no skill changed. That pass is judged by
+its report: an invalid skill is reported against its id and does not
+fail it, an error not tied to a skill (e.g. writing skills.ts) does.
+Nothing is rendered when nothing changed.
+
+Usage:
+    python scripts/sync_skill_docs.py
+    python scripts/sync_skill_docs.py --dry-run
+    python scripts/sync_skill_docs.py --jobs 4 --repair
+    python scripts/sync_skill_docs.py --adopt   # record current docs as the baseline
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from ingest_manifest import FileTable, scan_source, tree_hash
+
+MANIFEST_VERSION = 1
+
+SKILLS_DIR = Path(".claude/skills")
+DOCS_DIR = Path("website/docs/skills")
+WEBSITE_DIR = Path("website")
+MANIFEST_PATH = Path(".cache/docs-sync/manifest.json")
+
+# Scripts whose changes invalidate every generated doc
+GENERATOR_FILES = [
+    Path("website/scripts/generate-skills.ts"),
+    Path("website/scripts/lib/doc-generator.ts"),
+    Path("website/scripts/lib/skill-parser.ts"),
+    Path("website/scripts/lib/mdx-sanitizer.ts"),
+    Path("website/scripts/lib/types.ts"),
+]
+
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+GENERATE_TIMEOUT = 600
+
+NEW = "new"
+CHANGED = "changed"
+DRIFTED = "drifted"
+REMOVED = "removed"
+UNCHANGED = "unchanged"
+
+
+def find_project_root() -> Path:
+    """Find the project root by looking for .claude directory."""
+    current = Path.cwd()
+    while current != current.parent:
+        if (current / ".claude").exists():
+            return current
+        current = current.parent
+    return Path.cwd()
+
+
+def doc_folder(skill_id: str) -> str:
+    """Doc folder of a skill, as generate-skills.ts names it."""
+    return skill_id.replace("-", "_")
+
+
+def generator_hash(project_root: Path) -> str:
+    digest = hashlib.sha256()
+    for rel in GENERATOR_FILES:
+        path = project_root / rel
+        digest.update(rel.as_posix().encode("utf-8") + b"\0")
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def docs_drifted(docs_dir: Path, recorded: FileTable) -> bool:
+    """True if a recorded doc file is missing or its content changed."""
+    if not recorded:
+        return True
+    current = scan_source(docs_dir, SKIP_DIRS, recorded) if docs_dir.exists() else {}
+    return any(rel not in current or current[rel]["hash"] != info["hash"]
+               for rel, info in recorded.items())
+
+
+class DocsSyncManifest:
+    """Skill id -> source hash -> generated doc hashes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.generator: Optional[str] = None
+        # skills.ts/descriptions lag behind the docs until a catalogue pass succeeds
+        self.catalogue_dirty = False
+        self.skills: Dict[str, Dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.generator = data.get("generator")
+                self.catalogue_dirty = bool(data.get("catalogue_dirty", False))
+                self.skills = data.get("skills", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "generator": self.generator,
+                        "catalogue_dirty": self.catalogue_dirty, "skills": self.skills},
+                       indent=1, sort_keys=True),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.path)
+
+
+def classify(skill_id: str, sources: FileTable, record: Optional[Dict],
+             generator_changed: bool, docs_dir: Path) -> str:
+    if record is None:
+        return NEW
+    if generator_changed or record["source_hash"] != tree_hash(sources):
+        return CHANGED
+    if docs_drifted(docs_dir, record.get("docs", {})):
+        return DRIFTED
+    return UNCHANGED
+
+
+def run_generator(website_dir: Path, args: List[str]) -> subprocess.CompletedProcess:
+    cmd = ["npm", "run", "--silent", "skills:generate", "--", *args]
+    return subprocess.run(cmd, cwd=website_dir, capture_output=True, text=True, timeout=GENERATE_TIMEOUT)
+
+
+def run_reported(website_dir: Path, args: List[str]) -> Optional[List[Dict]]:
+    """Run the generator with --report; return its errors, or None if it died before reporting."""
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = Path(tmp) / "report.json"
+        result = run_generator(website_dir, [*args, f"--report={report_path}"])
+        try:
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            report = None
+
+    if report is None:
+        print(f"   ❌ Generation failed (exit {result.returncode}): {result.stderr.strip()[-500:]}")
+        return None
+
+    errors = report.get("errors", [])
+    for error in errors[:10]:
+        print(f"   ❌ [{error.get('skillId', '-')}] {error.get('message')}")
+    if len(errors) > 10:
+        print(f"   ... and {len(errors) - 10} more errors")
+    return errors
+
+
+def generate_docs(website_dir: Path, skill_ids: List[str]) -> Set[str]:
+    """Render the docs of skill_ids in one generator run; return the ids that failed."""
+    errors = run_reported(website_dir, ["--docs-only", f"--only={','.join(skill_ids)}"])
+    # No report, or an error not tied to a skill (e.g. the docs folder): no doc can be trusted
+    if errors is None or any(not error.get("skillId") for error in errors):
+        return set(skill_ids)
+    return {error["skillId"] for error in errors} & set(skill_ids)
+
+
+def generate_catalogue(website_dir: Path) -> bool:
+    """Rebuild skills.ts and skillDescriptions.json; True if both were written."""
+    errors = run_reported(website_dir, ["--only="])
+    # Invalid skills are reported against their id and left out of the
+    # catalogue; only errors not tied to a skill mean it was not written
+    return errors is not None and all(error.get("skillId") for error in errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally sync skill docs from .claude/skills")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Parallel hashing threads")
+    parser.add_argument("--repair", action="store_true", help="Regenerate drifted docs too")
+    parser.add_argument("--full", action="store_true", help="Regenerate every skill")
+    parser.add_argument("--adopt", action="store_true",
+                        help="Record current sources and docs as synced without generating")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    skills_dir = project_root / SKILLS_DIR
+    docs_root = project_root / DOCS_DIR
+    if not skills_dir.exists():
+        print(f"❌ Skills directory not found: {skills_dir}")
+        return 1
+
+    start = time.perf_counter()
+    manifest = DocsSyncManifest(project_root / MANIFEST_PATH)
+    generator = generator_hash(project_root)
+    generator_changed = manifest.generator is not None and manifest.generator != generator
+
+    skill_ids = sorted(p.parent.name for p in skills_dir.glob("*/SKILL.md"))
+
+    # Hash sources and check docs concurrently (stat-only for unchanged files)
+    def inspect(skill_id: str):
+        record = manifest.skills.get(skill_id)
+        sources = scan_source(skills_dir / skill_id, SKIP_DIRS, record["sources"] if record else None)
+        status = classify(skill_id, sources, record, generator_changed or args.full,
+                          docs_root / doc_folder(skill_id))
+        return skill_id, sources, status
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        inspected = list(executor.map(inspect, skill_ids))
+
+    statuses: Dict[str, List[str]] = {s: [] for s in (NEW, CHANGED, DRIFTED, REMOVED, UNCHANGED)}
+    sources_by_id: Dict[str, FileTable] = {}
+    for skill_id, sources, status in inspected:
+        statuses[status].append(skill_id)
+        sources_by_id[skill_id] = sources
+
+    # Docs whose skill is gone: manifest entries plus unmanaged doc folders
+    live_folders = {doc_folder(s) for s in skill_ids}
+    removed_folders = {doc_folder(s) for s in manifest.skills if s not in sources_by_id}
+    if docs_root.exists():
+        removed_folders |= {p.name for p in docs_root.iterdir()
+                            if p.is_dir() and not p.name.startswith("_") and p.name not in live_folders}
+    statuses[REMOVED] = sorted(removed_folders)
+
+    print(f"🔄 Syncing {len(skill_ids)} skills"
+          + (" (generator changed, regenerating all)" if generator_changed else ""))
+    for status in (NEW, CHANGED, DRIFTED, REMOVED):
+        if statuses[status]:
+            shown = ", ".join(statuses[status][:10]) + (" ..." if len(statuses[status]) > 10 else "")
+            print(f"   {status}: {len(statuses[status])} ({shown})")
+    print(f"   {UNCHANGED}: {len(statuses[UNCHANGED])}")
+
+    to_generate = statuses[NEW] + statuses[CHANGED] + (statuses[DRIFTED] if args.repair else [])
+    if args.adopt:
+        to_generate = []
+
+    if args.dry_run:
+        print(f"\n[DRY RUN] Would regenerate {len(to_generate)} and delete {len(statuses[REMOVED])} doc folders"
+              + (", and rebuild the catalogue" if to_generate or statuses[REMOVED] or manifest.catalogue_dirty
+                 else ""))
+        return 0
+
+    # Delete docs of removed skills
+    for folder in statuses[REMOVED]:
+        path = docs_root / folder
+        if path.exists():
+            shutil.rmtree(path)
+            print(f"   🗑️  Removed {DOCS_DIR / folder}")
+    for skill_id in [s for s in manifest.skills if s not in sources_by_id]:
+        del manifest.skills[skill_id]
+
+    failed = set()
+    if to_generate:
+        print(f"\n📚 Regenerating docs for {len(to_generate)} skills...")
+        failed = generate_docs(project_root / WEBSITE_DIR, sorted(to_generate))
+
+    # skills.ts and descriptions cover the whole catalogue: rebuild them once,
+    # and again on later runs until a pass succeeds
+    if to_generate or statuses[REMOVED]:
+        manifest.catalogue_dirty = True
+    catalogue_ok = True
+    if manifest.catalogue_dirty:
+        print("\n📝 Rebuilding the skill catalogue...")
+        catalogue_ok = generate_catalogue(project_root / WEBSITE_DIR)
+        if catalogue_ok:
+            manifest.catalogue_dirty = False
+        else:
+            print("   ❌ Catalogue generation failed; it will be retried on the next run")
+
+    # Record every synced skill; failed ones keep their old entry so they retry next run
+    recorded = set(to_generate) - failed
+    if args.adopt:
+        recorded = set(skill_ids)
+    for skill_id in recorded:
+        folder = docs_root / doc_folder(skill_id)
+        previous_docs = manifest.skills.get(skill_id, {}).get("docs")
+        sources = sources_by_id[skill_id]
+        manifest.skills[skill_id] = {
+            "source_hash": tree_hash(sources),
+            "sources": sources,
+            "docs": scan_source(folder, SKIP_DIRS, previous_docs) if folder.exists() else {},
+        }
+    # Unchanged skills may have new stat info for identical content
+    for skill_id in statuses[UNCHANGED] + ([] if args.repair else statuses[DRIFTED]):
+        if skill_id in manifest.skills:
+            manifest.skills[skill_id]["sources"] = sources_by_id[skill_id]
+    if not failed:
+        manifest.generator = generator
+    manifest.save()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Synced {len(recorded)} skills, removed {len(statuses[REMOVED])} "
+          f"doc folders, {len(failed)} failed ({elapsed:.1f}s)")
+    if statuses[DRIFTED] and not args.repair:
+        print(f"⚠️  {len(statuses[DRIFTED])} docs were edited outside the sync; run with --repair to regenerate")
+    return 1 if failed or not catalogue_ok else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Tests for scripts/metrics_store.py.
+
+Usage:
+    python -m pytest scripts/tests
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from metrics_store import MetricsStore  # noqa: E402
+
+
+def run(timestamp, **skills):
+    return {
+        "timestamp": timestamp,
+        "version": "1.0.0",
+        "total_skills": len(skills),
+        "skills": [{"name": name, **values} for name, values in skills.items()],
+    }
+
+
+class ImportAfterLiveRunTest(unittest.TestCase):
+    """Legacy imports are older than the live runs already in the store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.store = MetricsStore(self.dir / "metrics.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def import_legacy(self, name, record):
+        path = self.dir / name
+        path.write_text(json.dumps(record), encoding="utf-8")
+        return self.store.import_json([path])
+
+    def test_import_does_not_rewrite_latest(self):
+        self.store.append(run("2026-10-19T00:00:00", a={"lines": 100}, b={"lines": 5}))
+        self.assertEqual(self.import_legacy("2025-12-01.json", run("2025-12-01T00:00:00", a={"lines": 10})), 1)
+
+        self.assertEqual(self.store.latest_skills(), {
+            "a": {"name": "a", "lines": 100},
+            "b": {"name": "b", "lines": 5},
+        })
+        self.assertEqual(self.store.skill_series("lines", "a"),
+                         [("2025-12-01T00:00:00", 10), ("2026-10-19T00:00:00", 100)])
+        self.assertEqual(self.store.skill_series("present", "b"), [("2026-10-19T00:00:00", 1)])
+        self.assertEqual([ts for _, ts in self.store.runs()],
+                         ["2025-12-01T00:00:00", "2026-10-19T00:00:00"])
+        self.assertEqual(self.store.ecosystem_series("total_skills"),
+                         [("2025-12-01T00:00:00", 1), ("2026-10-19T00:00:00", 2)])
+
+    def test_import_between_runs_keeps_later_values(self):
+        self.store.append(run("2025-11-01T00:00:00", a={"lines": 10}, b={"lines": 5}))
+        self.store.append(run("2026-10-19T00:00:00", a={"lines": 10}, b={"lines": 5}))
+        self.import_legacy("2025-12-01.json", run("2025-12-01T00:00:00", a={"lines": 20}))
+
+        self.assertEqual(self.store.skill_series("lines", "a"), [
+            ("2025-11-01T00:00:00", 10), ("2025-12-01T00:00:00", 20), ("2026-10-19T00:00:00", 10),
+        ])
+        self.assertEqual(self.store.skill_series("present", "b"), [
+            ("2025-11-01T00:00:00", 1), ("2025-12-01T00:00:00", 0), ("2026-10-19T00:00:00", 1),
+        ])
+        self.assertEqual(set(self.store.latest_skills()), {"a", "b"})
+
+    def test_reimport_is_a_no_op(self):
+        self.store.append(run("2026-10-19T00:00:00", a={"lines": 100}))
+        record = run("2025-12-01T00:00:00", a={"lines": 10})
+        self.assertEqual(self.import_legacy("2025-12-01.json", record), 1)
+        self.assertEqual(self.import_legacy("2025-12-01.json", record), 0)
+        self.assertEqual(len(self.store.runs()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,20 +5,34 @@ Changelog Generator - Part of The Archivist
 Analyzes git history for .claude/skills/ and .claude/agents/ changes
 and generates/updates CHANGELOG.md in Keep a Changelog format.
 
+Runs are incremental: the last processed commit is stored next to the
+changelog (.changelog-state.json) and the next run only reads commits after
+it.
+
 Usage:
-    python scripts/update_changelog.py [--output PATH] [--since DATE]
+    python scripts/update_changelog.py [--output PATH] [--since DATE] [--full]
 
 Output goes to .claude/archive/changelogs/CHANGELOG.md by default.
 """
 
 import subprocess
 import argparse
+import json
+import os
 import re
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from collections import defaultdict
 
+# Header fields of each commit, NUL-terminated (see parse_git_log)
+GIT_LOG_FORMAT = "%H%x00%ai%x00%s%x00%b%x00"
+
+READ_CHUNK_SIZE = 1 << 16
+
+STATE_FILENAME = ".changelog-state.json"
+STATE_VERSION = 1
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .claude directory."""
@@ -30,79 +44,169 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
-def get_git_log(since: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Get git log for .claude/skills/ and .claude/agents/ directories."""
+def load_state(state_path: Path) -> Dict[str, Any]:
+    """Load the last processed commit."""
     try:
-        # Build git log command
-        cmd = [
-            "git", "log",
-            "--pretty=format:%H|%ai|%s|%b",
-            "--name-status",
-        ]
-
-        if since:
-            cmd.append(f"--since={since}")
-
-        cmd.extend([
-            "--",
-            ".claude/skills/",
-            ".claude/agents/"
-        ])
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        return parse_git_log(result.stdout)
-
-    except subprocess.CalledProcessError:
-        # No git repo or no commits
-        return []
-
-
-def parse_git_log(log_output: str) -> List[Dict[str, Any]]:
-    """Parse git log output into structured commits."""
-    commits = []
-    lines = log_output.split("\n")
-
-    current_commit = None
-
-    for line in lines:
-        if "|" in line and not line.startswith(("A\t", "M\t", "D\t", "R\t")):
-            # New commit line
-            parts = line.split("|", 3)
-            if len(parts) >= 3:
-                if current_commit:
-                    commits.append(current_commit)
-
-                current_commit = {
-                    "hash": parts[0],
-                    "date": parts[1],
-                    "subject": parts[2],
-                    "body": parts[3] if len(parts) > 3 else "",
-                    "files": []
-                }
-        elif line.startswith(("A\t", "M\t", "D\t", "R\t")) and current_commit:
-            # File change line
-            parts = line.split("\t", 1)
-            if len(parts) == 2:
-                status = parts[0]
-                filepath = parts[1]
-                current_commit["files"].append({
-                    "status": status,
-                    "path": filepath
-                })
-
-    if current_commit:
-        commits.append(current_commit)
-
-    return commits
-
-
-def categorize_changes(commits: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        state = {}
+    if state.get("version") != STATE_VERSION:
+        state = {}
+    return {
+        "version": STATE_VERSION,
+        "last_commit": state.get("last_commit"),
+    }
+
+
+def save_state(state_path: Path, state: Dict[str, Any]) -> None:
+    """Write the state file atomically."""
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=0, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, state_path)
+
+
+def git_rev_parse(rev: str) -> Optional[str]:
+    """Resolve a revision to a commit hash (None if it does not exist)."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        capture_output=True, text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def is_ancestor(commit: str, head: str) -> bool:
+    """True if commit is reachable from head (history was not rewritten)."""
+    result = subprocess.run(
+        ["git", "merge-base", "--is-ancestor", commit, head],
+        capture_output=True
+    )
+    return result.returncode == 0
+
+
+def get_git_log(
+    since: Optional[str] = None,
+    revision_range: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream commits touching .claude/skills/ and .claude/agents/, newest first.
+
+    git output is read incrementally from a pipe, so memory use does not
+    depend on the length of the history. Yields nothing outside a git repo.
+    """
+    cmd = [
+        "git", "log", "-z",
+        f"--pretty=format:{GIT_LOG_FORMAT}",
+        "--name-status",
+    ]
+
+    if since:
+        cmd.append(f"--since={since}")
+
+    if revision_range:
+        cmd.append(revision_range)
+
+    cmd.extend([
+        "--",
+        ".claude/skills/",
+        ".claude/agents/"
+    ])
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+        yield from parse_git_log(iter_nul_fields(proc.stdout))
+
+
+def iter_nul_fields(stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """Split a binary stream on NUL bytes, reading it chunk by chunk."""
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        fields = (pending + chunk).split(b"\0")
+        pending = fields.pop()
+        for field in fields:
+            yield field.decode("utf-8", errors="replace")
+
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+def parse_git_log(fields: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse NUL-delimited `git log -z --name-status` fields into commits.
+
+    Each commit is its GIT_LOG_FORMAT header fields followed by name-status
+    entries (status, path, plus the new path for renames and copies), and
+    ends with an empty field. Messages may contain any character but NUL.
+    """
+    fields = iter(fields)
+
+    for commit_hash in fields:
+        if not commit_hash:
+            continue
+
+        try:
+            date, subject, body = next(fields), next(fields), next(fields)
+        except StopIteration:
+            return
+
+        commit = {
+            "hash": commit_hash,
+            "date": date,
+            "subject": subject,
+            "body": body.strip(),
+            "files": []
+        }
+
+        for status in fields:
+            # The file list is separated from the header by a newline
+            status = status.lstrip("\n")
+            if not status:
+                break
+
+            path = next(fields, "")
+            file = {"status": status[0], "path": path}
+            if status[0] in ("R", "C"):
+                file["old_path"] = path
+                file["path"] = next(fields, "")
+            commit["files"].append(file)
+
+        yield commit
+
+
+def categorize_commit(commit: Dict[str, Any]) -> str:
+    """Pick the Keep a Changelog category of a commit."""
+    # Analyze commit message
+    subject = commit["subject"].lower()
+
+    # Determine category based on keywords
+    if any(kw in subject for kw in ["add", "new", "create", "initial"]):
+        return "Added"
+    elif any(kw in subject for kw in ["remove", "delete"]):
+        return "Removed"
+    elif any(kw in subject for kw in ["fix", "bug", "issue", "error"]):
+        return "Fixed"
+    elif any(kw in subject for kw in ["deprecate"]):
+        return "Deprecated"
+    elif any(kw in subject for kw in ["security", "vulnerability", "cve"]):
+        return "Security"
+    elif any(kw in subject for kw in ["update", "improve", "enhance", "change", "refactor"]):
+        return "Changed"
+
+    # Also check file status
+    for file in commit["files"]:
+        if file["status"] == "A":
+            return "Added"
+        elif file["status"] == "D":
+            return "Removed"
+        elif file["status"] == "M":
+            return "Changed"
+
+    # Default to Changed
+    return "Changed"
+
+
+def categorize_changes(commits: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """Categorize commits into Added, Changed, Fixed, Removed."""
     categories = {
         "Added": [],
@@ -112,46 +216,8 @@ def categorize_changes(commits: List[Dict[str, Any]]) -> Dict[str, List[Dict[str
         "Removed": [],
         "Security": []
     }
-
     for commit in commits:
-        # Analyze commit message
-        subject = commit["subject"].lower()
-        body = commit["body"].lower()
-
-        # Determine category based on keywords
-        category = None
-
-        if any(kw in subject for kw in ["add", "new", "create", "initial"]):
-            category = "Added"
-        elif any(kw in subject for kw in ["remove", "delete"]):
-            category = "Removed"
-        elif any(kw in subject for kw in ["fix", "bug", "issue", "error"]):
-            category = "Fixed"
-        elif any(kw in subject for kw in ["deprecate"]):
-            category = "Deprecated"
-        elif any(kw in subject for kw in ["security", "vulnerability", "cve"]):
-            category = "Security"
-        elif any(kw in subject for kw in ["update", "improve", "enhance", "change", "refactor"]):
-            category = "Changed"
-
-        # Also check file status
-        if not category:
-            for file in commit["files"]:
-                if file["status"] == "A":
-                    category = "Added"
-                    break
-                elif file["status"] == "D":
-                    category = "Removed"
-                    break
-                elif file["status"] == "M":
-                    category = "Changed"
-                    break
-
-        # Default to Changed
-        if not category:
-            category = "Changed"
-
-        categories[category].append(commit)
+        categories[categorize_commit(commit)].append(commit)
 
     return categories
 
@@ -275,6 +341,11 @@ def main():
         type=str,
         help="Include commits since date (e.g., '2024-12-01', '1 week ago')"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the last processed commit and read the whole history"
+    )
     parser.add_argument(
         "--version", "-v",
         type=str,
@@ -293,10 +364,33 @@ def main():
         changelog_dir.mkdir(parents=True, exist_ok=True)
         changelog_path = changelog_dir / "CHANGELOG.md"
 
-    # Get git log
-    commits = get_git_log(since=args.since)
+    # Only read commits after the last processed one, unless history was
+    # rewritten since (or --full was given)
+    state_path = changelog_path.parent / STATE_FILENAME
+    state = load_state(state_path)
+    head = git_rev_parse("HEAD")
+    revision_range = head
+
+    last_commit = state["last_commit"]
+    if last_commit and head and not args.full:
+        if last_commit == head:
+            revision_range = None
+        elif is_ancestor(last_commit, head):
+            revision_range = f"{last_commit}..{head}"
+        else:
+            print(f"⚠️  Last processed commit {last_commit[:12]} is not in the current history, reading full history")
+
+    # Stream and categorize git log
+    commits = get_git_log(since=args.since, revision_range=revision_range) if revision_range else iter(())
+    categories = categorize_changes(commits)
+    total_changes = sum(len(entries) for entries in categories.values())
+    if head:
+        state["last_commit"] = head
+
+    if not total_changes:
+        if head and changelog_path.parent.exists():
+            save_state(state_path, state)
 
-    if not commits:
         # Check if git repo exists
         try:
             subprocess.run(["git", "rev-parse", "--git-dir"], capture_output=True, check=True)
@@ -352,9 +446,6 @@ The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/).
 
         return 0
 
-    # Categorize changes
-    categories = categorize_changes(commits)
-
     # Generate new entry
     new_entry = generate_changelog_entry(categories, args.version)
 
@@ -366,9 +457,9 @@ The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/).
 
     # Write
     changelog_path.write_text(updated_changelog, encoding="utf-8")
+    save_state(state_path, state)
 
     # Print summary
-    total_changes = sum(len(entries) for entries in categories.values())
     print(f"✅ Changelog updated: {changelog_path}")
     print(f"   📝 {total_changes} commit(s) processed")
 
@@ -15,6 +15,8 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from frontmatter_parser import split_frontmatter, load_yaml
+
 
 class Severity(Enum):
     ERROR = "ERROR"
@@ -58,6 +60,7 @@ class AgentValidator:
         self.issues: List[ValidationIssue] = []
         self.frontmatter: Dict = {}
         self.content: str = ""
+        self.body: str = ""
         self.is_directory_format: bool = False
 
     def validate(self) -> List[ValidationIssue]:
@@ -130,15 +133,16 @@ class AgentValidator:
             return
 
         # Extract frontmatter
+        frontmatter, self.body = split_frontmatter(self.content)
+        if frontmatter is None:
+            self.issues.append(ValidationIssue(
+                Severity.ERROR,
+                "Invalid frontmatter format. Must have opening and closing '---'"
+            ))
+            return
+
         try:
-            parts = self.content.split('---', 2)
-            if len(parts) < 3:
-                self.issues.append(ValidationIssue(
-                    Severity.ERROR,
-                    "Invalid frontmatter format. Must have opening and closing '---'"
-                ))
-                return
-            self.frontmatter = yaml.safe_load(parts[1]) or {}
+            self.frontmatter = load_yaml(frontmatter)
         except yaml.YAMLError as e:
             self.issues.append(ValidationIssue(
                 Severity.ERROR,
@@ -330,11 +334,9 @@ class AgentValidator:
 
     def check_body_content(self):
         """Validate the body content of the agent file."""
-        # Get body after frontmatter
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
+        body = self.body
+        if not body:
             return
-        body = parts[2]
 
         lines = body.strip().split('\n')
 
@@ -374,11 +376,9 @@ class AgentValidator:
 
     def check_coordination_references(self):
         """Check if coordinating agent references are valid."""
-        # Get body after frontmatter
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
+        if not self.body:
             return
-        body = parts[2].lower()
+        body = self.body.lower()
 
         # Known founding council agents
         council_agents = [
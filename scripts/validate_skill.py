@@ -16,6 +16,8 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+from frontmatter_parser import split_frontmatter
+
 @dataclass
 class ValidationResult:
     """Result of a single validation check"""
@@ -97,13 +99,11 @@ class SkillValidator:
             return
 
         # Extract frontmatter
-        parts = content.split('---', 2)
-        if len(parts) < 3:
+        frontmatter, _ = split_frontmatter(content)
+        if frontmatter is None:
             self.add_result('frontmatter_valid', False, "Malformed frontmatter")
             return
 
-        frontmatter = parts[1]
-
         # Check required fields
         for field in self.REQUIRED_FRONTMATTER:
             pattern = rf'^{field}:\s*\S+'
@@ -12,6 +12,10 @@
  *   --verbose          Show detailed output
  *   --watch            Watch for changes and regenerate
  *   --include-remote   Include remote skills from skill-sources.yaml
+ *   --only=ID,ID       Only regenerate docs for these skills
+ *   --docs-only        Only write per-skill docs (no skills.ts, descriptions or cleanup);
+ *                      with --only, only those skills are parsed and validated
+ *   --report=PATH      Write errors and warnings as JSON to PATH
  */
 
 import * as fs from 'fs';
@@ -56,12 +60,27 @@ async function generateSkills(
 
   console.log('🔄 Generating skills...\n');
 
-  // Step 1: Parse all local skills
+  // Step 1: Parse all local skills (only the requested ones for --docs-only --only)
   console.log(`📂 Scanning ${options.skillsSourceDir}...`);
-  const skills = parseAllSkills(options.skillsSourceDir);
+  const onlyIds = options.onlySkills ? new Set(options.onlySkills) : undefined;
+  const parseIds = options.docsOnly ? onlyIds : undefined;
+  const skills = parseAllSkills(options.skillsSourceDir, parseIds);
   console.log(`   Found ${skills.length} skill folders\n`);
 
-  if (skills.length === 0) {
+  if (parseIds) {
+    const parsed = new Set(skills.map((s) => s.id));
+    for (const id of parseIds) {
+      if (!parsed.has(id)) {
+        errors.push({
+          skillId: id,
+          file: path.join(options.skillsSourceDir, id),
+          message: 'Skill not found or SKILL.md could not be parsed',
+        });
+      }
+    }
+  }
+
+  if (skills.length === 0 && !parseIds) {
     errors.push({
       message: 'No skills found',
       details: `Checked directory: ${options.skillsSourceDir}`,
@@ -118,32 +137,35 @@ async function generateSkills(
   // Step 3: Assign categories to uncategorized skills
   assignCategories(skills);
 
-  // Step 4: Generate skills.ts
-  console.log('📝 Generating skills.ts...');
-  try {
-    generateSkillsTs(skills, options.skillsOutputFile);
-    console.log(`   Written to ${options.skillsOutputFile}\n`);
-  } catch (error) {
-    errors.push({
-      message: 'Failed to generate skills.ts',
-      details: String(error),
-    });
-  }
+  // Steps 4-5 cover the whole catalogue; --docs-only leaves them to a later run
+  if (!options.docsOnly) {
+    // Step 4: Generate skills.ts
+    console.log('📝 Generating skills.ts...');
+    try {
+      generateSkillsTs(skills, options.skillsOutputFile);
+      console.log(`   Written to ${options.skillsOutputFile}\n`);
+    } catch (error) {
+      errors.push({
+        message: 'Failed to generate skills.ts',
+        details: String(error),
+      });
+    }
 
-  // Step 5: Generate skillDescriptions.json
-  const descriptionsPath = path.join(
-    path.dirname(options.skillsOutputFile),
-    'skillDescriptions.json'
-  );
-  console.log('📝 Generating skillDescriptions.json...');
-  try {
-    generateSkillDescriptionsJson(skills, descriptionsPath);
-    console.log(`   Written to ${descriptionsPath}\n`);
-  } catch (error) {
-    errors.push({
-      message: 'Failed to generate skillDescriptions.json',
-      details: String(error),
-    });
+    // Step 5: Generate skillDescriptions.json
+    const descriptionsPath = path.join(
+      path.dirname(options.skillsOutputFile),
+      'skillDescriptions.json'
+    );
+    console.log('📝 Generating skillDescriptions.json...');
+    try {
+      generateSkillDescriptionsJson(skills, descriptionsPath);
+      console.log(`   Written to ${descriptionsPath}\n`);
+    } catch (error) {
+      errors.push({
+        message: 'Failed to generate skillDescriptions.json',
+        details: String(error),
+      });
+    }
   }
 
   // Step 6: Generate docs
@@ -152,14 +174,25 @@ async function generateSkills(
     const generatedDocs = generateSkillDocs(
       skills,
       options.docsOutputDir,
-      options.skillsSourceDir
+      options.skillsSourceDir,
+      onlyIds,
+      (skill, error) => {
+        errors.push({
+          skillId: skill.id,
+          file: skill.sourcePath,
+          message: 'Failed to generate docs',
+          details: String(error),
+        });
+      }
     );
     console.log(`   Generated ${generatedDocs.length} doc files\n`);
 
     // Cleanup old docs
-    const removed = cleanupOldDocs(options.docsOutputDir, skills);
-    if (removed.length > 0) {
-      console.log(`   Removed ${removed.length} obsolete doc folders: ${removed.join(', ')}\n`);
+    if (!options.docsOnly) {
+      const removed = cleanupOldDocs(options.docsOutputDir, skills);
+      if (removed.length > 0) {
+        console.log(`   Removed ${removed.length} obsolete doc folders: ${removed.join(', ')}\n`);
+      }
     }
   } catch (error) {
     errors.push({
@@ -246,6 +279,21 @@ function buildResult(
   };
 }
 
+/**
+ * Write errors and warnings as JSON, so callers can tell which skills failed
+ * without parsing console output.
+ */
+function writeReport(reportFile: string, result: GenerationResult): void {
+  const report = {
+    success: result.success,
+    skills: result.skills.map((s) => s.id),
+    errors: result.errors,
+    warnings: result.warnings,
+  };
+  fs.mkdirSync(path.dirname(reportFile), { recursive: true });
+  fs.writeFileSync(reportFile, JSON.stringify(report, null, 2), 'utf-8');
+}
+
 function printSummary(
   skills: ParsedSkill[],
   errors: GenerationError[],
@@ -328,10 +376,19 @@ function parseArgs(): GenerationOptions {
       case '-r':
         options.includeRemote = true;
         break;
+      case '--docs-only':
+        options.docsOnly = true;
+        break;
       case '--help':
       case '-h':
         printHelp();
         process.exit(0);
+      default:
+        if (arg.startsWith('--only=')) {
+          options.onlySkills = arg.slice('--only='.length).split(',').filter(Boolean);
+        } else if (arg.startsWith('--report=')) {
+          options.reportFile = path.resolve(arg.slice('--report='.length));
+        }
     }
   }
 
@@ -349,6 +406,10 @@ Options:
   --verbose              Show detailed output for each skill
   --watch, -w            Watch for changes and regenerate
   --include-remote, -r   Include remote skills from skill-sources.yaml
+  --only=ID,ID           Only regenerate docs for these skill IDs
+  --docs-only            Only write per-skill docs (no skills.ts, descriptions or cleanup);
+                         with --only, only those skills are parsed and validated
+  --report=PATH          Write errors and warnings as JSON to PATH
   --help, -h             Show this help message
 
 Examples:
@@ -409,6 +470,9 @@ async function main(): Promise<void> {
     await watchMode(options);
   } else {
     const result = await generateSkills(options);
+    if (options.reportFile) {
+      writeReport(options.reportFile, result);
+    }
     process.exit(result.success ? 0 : 1);
   }
 }
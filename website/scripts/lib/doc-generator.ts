@@ -19,7 +19,9 @@ import { sanitizeForMdx } from './mdx-sanitizer';
 export function generateSkillDocs(
   skills: ParsedSkill[],
   outputDir: string,
-  sourceSkillsDir: string
+  sourceSkillsDir: string,
+  onlyIds?: Set<string>,
+  onSkillError?: (skill: ParsedSkill, error: unknown) => void
 ): GeneratedDoc[] {
   const generated: GeneratedDoc[] = [];
 
@@ -29,8 +31,16 @@ export function generateSkillDocs(
   }
 
   for (const skill of skills) {
-    const docs = generateSkillDocFiles(skill, outputDir, sourceSkillsDir);
-    generated.push(...docs);
+    // The category index below always covers every skill
+    if (onlyIds && !onlyIds.has(skill.id)) continue;
+
+    // With an error callback, one broken skill does not stop the others
+    try {
+      generated.push(...generateSkillDocFiles(skill, outputDir, sourceSkillsDir));
+    } catch (error) {
+      if (!onSkillError) throw error;
+      onSkillError(skill, error);
+    }
   }
 
   // Generate category index
@@ -330,7 +330,7 @@ export function validateSkill(skill: ParsedSkill): ValidationResult {
 // BATCH PARSING
 // =============================================================================
 
-export function parseAllSkills(skillsDir: string): ParsedSkill[] {
+export function parseAllSkills(skillsDir: string, onlyIds?: Set<string>): ParsedSkill[] {
   if (!fs.existsSync(skillsDir)) {
     console.error(`Skills directory not found: ${skillsDir}`);
     return [];
@@ -341,6 +341,8 @@ export function parseAllSkills(skillsDir: string): ParsedSkill[] {
 
   for (const entry of entries) {
     if (!entry.isDirectory()) continue;
+    // Skill IDs are folder names, so other skills are never read
+    if (onlyIds && !onlyIds.has(entry.name)) continue;
 
     const skillPath = path.join(skillsDir, entry.name);
     const skillMdPath = path.join(skillPath, 'SKILL.md');
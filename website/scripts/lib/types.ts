@@ -221,6 +221,11 @@ export interface GenerationOptions {
   // Filtering
   categories?: string[];         // Only process these categories
   skipSkills?: string[];         // Skip these skill IDs
+  onlySkills?: string[];         // Only regenerate docs for these skill IDs
+  docsOnly?: boolean;            // Skip catalogue-wide outputs (skills.ts, descriptions, cleanup)
+
+  // Output
+  reportFile?: string;           // Write errors and warnings as JSON here
 }
 
 export interface GenerationResult {
@@ -40,6 +40,16 @@ interface EcosystemData {
     nodes: Array<{ id: string; type: string; label: string; role?: string }>;
     edges: Array<{ from: string; to: string; type: string }>;
   };
+  // Precomputed by scripts/generate_ecosystem_data.py, aligned with node_ids
+  graph_metrics?: {
+    node_ids: string[];
+    adjacency: { offsets: number[]; targets: number[] };
+    in_degree: number[];
+    out_degree: number[];
+    pagerank: number[];
+    component: number[];
+    component_sizes: number[];
+  };
 }
 
 interface EcosystemDashboardProps {